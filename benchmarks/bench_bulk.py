@@ -0,0 +1,73 @@
+"""Benchmark bulk encryption of many small files: one process versus a pool.
+
+Encrypts a directory of small files sequentially with one SDK, then with
+``SDK.encrypt_many`` and ``SDK.decrypt_many``, and reports files per second.
+
+Usage:
+    uv run python -m benchmarks.bench_bulk [files] [file_kib] [workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from otdf_python.config import KASInfo, TDFConfig
+from otdf_python.sdk import SDK
+from otdf_python.tdf import TDFReaderConfig
+
+from tests.mock_crypto import generate_rsa_keypair
+
+
+class _LocalServices(SDK.Services):
+    """Services for TDFs wrapped with local KAS keys."""
+
+
+def main():
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    size = int(sys.argv[2]) * 1024 if len(sys.argv) > 2 else 16 * 1024
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    private_key, public_key = generate_rsa_keypair()
+    config = TDFConfig(
+        kas_info_list=[KASInfo(url="https://kas.example.com", public_key=public_key)]
+    )
+    reader_config = TDFReaderConfig(kas_private_key=private_key)
+    sdk = SDK(services=_LocalServices())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sources = []
+        for i in range(count):
+            path = tmp / f"{i}.bin"
+            path.write_bytes(os.urandom(size))
+            sources.append(path)
+        print(f"{count} files of {size / 2**10:.0f} KiB, workers {workers or 'auto'}")
+
+        started = time.perf_counter()
+        for path in sources:
+            with path.open("rb") as src, path.with_suffix(".seq").open("wb") as out:
+                sdk.create_tdf(src, config, out)
+        elapsed = time.perf_counter() - started
+        print(f"{'sequential encrypt':>20} {count / elapsed:10.1f} files/s")
+
+        items = [(p, p.with_suffix(".tdf")) for p in sources]
+        result = sdk.encrypt_many(items, config, max_workers=workers)
+        print(
+            f"{'encrypt_many':>20} {result.stats.items_per_second:10.1f} files/s "
+            f"({result.stats.bytes_per_second / 2**20:.1f} MiB/s, "
+            f"{result.stats.failed} failed)"
+        )
+
+        items = [(p.with_suffix(".tdf"), p.with_suffix(".out")) for p in sources]
+        result = sdk.decrypt_many(items, reader_config, max_workers=workers)
+        print(
+            f"{'decrypt_many':>20} {result.stats.items_per_second:10.1f} files/s "
+            f"({result.stats.bytes_per_second / 2**20:.1f} MiB/s, "
+            f"{result.stats.failed} failed)"
+        )
+
+
+if __name__ == "__main__":
+    main()
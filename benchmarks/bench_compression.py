@@ -0,0 +1,100 @@
+"""Benchmark per-segment compression: ratio versus throughput.
+
+Encrypts and decrypts a few synthetic payloads (JSON lines, CSV, random
+bytes) with every available codec and reports the resulting TDF size
+relative to the uncompressed TDF alongside create/decrypt throughput.
+
+Usage:
+    uv run python -m benchmarks.bench_compression [size_mib] [segment_kib]
+"""
+
+import io
+import json
+import os
+import random
+import sys
+import time
+
+from otdf_python.compression import available_codecs
+from otdf_python.config import KASInfo, TDFConfig
+from otdf_python.range_source import BytesRangeSource
+from otdf_python.tdf import TDF, TDFReaderConfig
+
+from tests.mock_crypto import generate_rsa_keypair
+
+
+def _json_lines(size: int) -> bytes:
+    rng = random.Random(0)
+    lines = []
+    total = 0
+    while total < size:
+        line = json.dumps(
+            {
+                "ts": 1700000000 + total,
+                "level": rng.choice(["INFO", "WARN", "DEBUG"]),
+                "user": f"user-{rng.randrange(1000)}",
+                "latency_ms": round(rng.random() * 250, 2),
+            }
+        ).encode()
+        lines.append(line + b"\n")
+        total += len(line) + 1
+    return b"".join(lines)[:size]
+
+
+def _csv(size: int) -> bytes:
+    rng = random.Random(1)
+    rows = [b"id,region,amount,currency\n"]
+    total = len(rows[0])
+    i = 0
+    while total < size:
+        row = f"{i},{rng.choice(['us', 'eu', 'apac'])},{rng.random() * 1000:.2f},USD\n"
+        rows.append(row.encode())
+        total += len(row)
+        i += 1
+    return b"".join(rows)[:size]
+
+
+def main():
+    """Run the benchmark."""
+    size = int(sys.argv[1]) * 1024 * 1024 if len(sys.argv) > 1 else 16 * 1024 * 1024
+    segment_size = int(sys.argv[2]) * 1024 if len(sys.argv) > 2 else 1024 * 1024
+    private_key, public_key = generate_rsa_keypair()
+    kas_info = KASInfo(url="https://kas.example.com", public_key=public_key)
+    reader_config = TDFReaderConfig(kas_private_key=private_key)
+
+    payloads = {
+        "json-lines": _json_lines(size),
+        "csv": _csv(size),
+        "random": os.urandom(size),
+    }
+    print(f"payload {size / 2**20:.0f} MiB, segment {segment_size / 2**10:.0f} KiB")
+    print(
+        f"{'data':>10} {'codec':>6} {'ratio':>7} {'create MiB/s':>13} {'read MiB/s':>11}"
+    )
+    for data_name, payload in payloads.items():
+        baseline = None
+        for codec in [None, *available_codecs()]:
+            config = TDFConfig(
+                kas_info_list=[kas_info],
+                default_segment_size=segment_size,
+                compression=codec,
+            )
+            started = time.perf_counter()
+            _manifest, tdf_size, out = TDF().create_tdf(payload, config)
+            create_elapsed = time.perf_counter() - started
+            baseline = baseline or tdf_size
+
+            started = time.perf_counter()
+            TDF().read_tdf_source(
+                BytesRangeSource(out.getvalue()), io.BytesIO(), reader_config
+            )
+            read_elapsed = time.perf_counter() - started
+            print(
+                f"{data_name:>10} {codec or 'none':>6} {tdf_size / baseline:7.3f} "
+                f"{size / create_elapsed / 2**20:13.1f} "
+                f"{size / read_elapsed / 2**20:11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Benchmark the codec and compression options of Connect RPCs to KAS.
+
+Starts a local stand-in KAS answering rewraps with a batch of key access
+results, then sends rewraps through ``KASConnectRPCClient`` with several
+``ConnectOptions`` and reports the bytes on the wire per request and
+response, and the median latency. Options whose compression library is not
+installed are skipped.
+
+Usage:
+    uv run python -m benchmarks.bench_connect_compression [results] [requests]
+"""
+
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from otdf_python.config import KASInfo
+from otdf_python.connect_options import ConnectOptions, connect_compression
+from otdf_python.kas_connect_rpc_client import KASConnectRPCClient
+from otdf_python_proto.kas import kas_pb2
+from otdf_python_proto.kas.kas_connect import (
+    AccessServiceSync,
+    AccessServiceWSGIApplication,
+)
+
+# Keyword arguments of the ConnectOptions compared
+_OPTIONS = {
+    "identity": {"send_compression": None, "accept_compression": ()},
+    "gzip": {"send_compression": "gzip", "accept_compression": ("gzip",)},
+    "zstd": {"send_compression": "zstd", "accept_compression": ("zstd",)},
+    "json+gzip": {"proto_json": True},
+}
+
+
+class _AccessService(AccessServiceSync):
+    """Answers every rewrap with a batch of results like a bulk rewrap."""
+
+    def __init__(self, results: int):
+        self.response = kas_pb2.RewrapResponse(
+            session_public_key="-----BEGIN PUBLIC KEY-----\n"
+            + base64.encodebytes(os.urandom(294)).decode()
+            + "-----END PUBLIC KEY-----\n",
+            responses=[
+                kas_pb2.PolicyRewrapResult(
+                    policy_id="policy-0",
+                    results=[
+                        kas_pb2.KeyAccessRewrapResult(
+                            key_access_object_id=f"kao-{i}",
+                            status="permit",
+                            kas_wrapped_key=os.urandom(256),
+                        )
+                        for i in range(results)
+                    ],
+                )
+            ],
+        )
+
+    def rewrap(self, request, ctx):
+        return self.response
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _KeepAliveHandler(WSGIRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ByteCounter:
+    """WSGI middleware counting request and response body bytes."""
+
+    def __init__(self, app):
+        self.app = app
+        self.sent = 0
+        self.received = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        body = b"".join(self.app(environ, start_response))
+        with self.lock:
+            self.received += int(environ.get("CONTENT_LENGTH") or 0)
+            self.sent += len(body)
+        return [body]
+
+    def reset(self):
+        with self.lock:
+            self.sent = self.received = 0
+
+
+def _available_compressions():
+    compressions = []
+    for name in ("gzip", "zstd"):
+        try:
+            compression = connect_compression(name)
+        except ValueError:
+            continue
+        compressions.append(compression)
+    return compressions
+
+
+def _signed_token(results: int) -> str:
+    # A signed request for a batch rewrap: base64 JSON with one key access
+    # object per result, much like the real request body
+    body = {
+        "clientPublicKey": "-----BEGIN PUBLIC KEY-----\n" + "A" * 392,
+        "requests": [
+            {
+                "policy": {"id": "policy-0", "body": "e30="},
+                "keyAccessObjects": [
+                    {
+                        "keyAccessObjectId": f"kao-{i}",
+                        "keyAccessObject": {
+                            "type": "wrapped",
+                            "url": "https://kas.example.com",
+                            "protocol": "kas",
+                            "wrappedKey": base64.b64encode(os.urandom(256)).decode(),
+                            "policyBinding": {"alg": "HS256", "hash": "x" * 64},
+                        },
+                    }
+                    for i in range(results)
+                ],
+            }
+        ],
+    }
+    payload = base64.urlsafe_b64encode(json.dumps(body).encode()).decode()
+    return f"eyJhbGciOiJSUzI1NiJ9.{payload}.{'s' * 342}"
+
+
+def main():
+    """Run the benchmark."""
+    results = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    counter = _ByteCounter(
+        AccessServiceWSGIApplication(
+            _AccessService(results), compressions=_available_compressions()
+        )
+    )
+    server = make_server(
+        "127.0.0.1",
+        0,
+        counter,
+        server_class=_ThreadingWSGIServer,
+        handler_class=_KeepAliveHandler,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/kas"
+    token = _signed_token(results)
+    print(f"{count} rewraps of {results} key access objects each")
+
+    for name, kwargs in _OPTIONS.items():
+        try:
+            options = ConnectOptions(**kwargs)
+        except ValueError as e:
+            print(f"{name:>10} skipped: {e}")
+            continue
+        with KASConnectRPCClient(use_plaintext=True, options=options) as client:
+            client.unwrap_key(url, KASInfo(url=url), token)
+            counter.reset()
+            latencies = []
+            for _ in range(count):
+                started = time.perf_counter()
+                client.unwrap_key(url, KASInfo(url=url), token)
+                latencies.append(time.perf_counter() - started)
+        latencies.sort()
+        print(
+            f"{name:>10} request {counter.received / count:9.0f} B  "
+            f"response {counter.sent / count:9.0f} B  "
+            f"p50 {latencies[count // 2] * 1000:6.2f} ms"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
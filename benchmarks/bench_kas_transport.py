@@ -0,0 +1,117 @@
+"""Benchmark the KAS transports: Connect RPC versus shared gRPC channels.
+
+Starts a local stand-in KAS serving both protocols, then sends rewrap
+requests from a number of concurrent threads through ``KASConnectRPCClient``
+and ``KASGrpcClient`` and reports requests per second and latency
+percentiles. The stand-in answers immediately, so the numbers measure the
+transports; note that its Connect side is a threaded ``wsgiref`` server,
+which limits Connect more than a production HTTP server would.
+
+Usage:
+    uv run python -m benchmarks.bench_kas_transport [requests] [threads]
+"""
+
+import sys
+import threading
+import time
+from concurrent import futures
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import grpc
+from otdf_python.config import KASInfo
+from otdf_python.kas_connect_rpc_client import KASConnectRPCClient
+from otdf_python.kas_grpc_client import KASGrpcClient
+from otdf_python_proto.kas import kas_pb2
+from otdf_python_proto.kas.kas_connect import (
+    AccessServiceSync,
+    AccessServiceWSGIApplication,
+)
+from otdf_python_proto.legacy_grpc.kas import kas_pb2_grpc
+
+# Roughly the size of an RSA-2048 wrapped key
+_WRAPPED_KEY = bytes(256)
+
+
+class _ConnectService(AccessServiceSync):
+    def rewrap(self, request, ctx):
+        return kas_pb2.RewrapResponse(entity_wrapped_key=_WRAPPED_KEY)
+
+
+class _GrpcService(kas_pb2_grpc.AccessServiceServicer):
+    def Rewrap(self, request, context):
+        return kas_pb2.RewrapResponse(entity_wrapped_key=_WRAPPED_KEY)
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _KeepAliveHandler(WSGIRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_connect_server() -> str:
+    server = make_server(
+        "127.0.0.1",
+        0,
+        AccessServiceWSGIApplication(_ConnectService()),
+        server_class=_ThreadingWSGIServer,
+        handler_class=_KeepAliveHandler,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}/kas"
+
+
+def _start_grpc_server(threads: int) -> tuple[grpc.Server, str]:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=threads))
+    kas_pb2_grpc.add_AccessServiceServicer_to_server(_GrpcService(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    # The server stops once it is garbage collected
+    return server, f"http://127.0.0.1:{port}/kas"
+
+
+def _run(name, client, url, count, threads):
+    key_access = KASInfo(url=url)
+
+    def rewrap(i):
+        started = time.perf_counter()
+        client.unwrap_key(url, key_access, f"token-{i}", "access-token")
+        return time.perf_counter() - started
+
+    # Warm up connections
+    rewrap(0)
+    started = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = sorted(executor.map(rewrap, range(count)))
+    elapsed = time.perf_counter() - started
+
+    def percentile(fraction):
+        return latencies[min(count - 1, int(fraction * count))] * 1000
+
+    print(
+        f"{name:>10} {count / elapsed:10.0f} req/s  "
+        f"p50 {percentile(0.5):6.2f} ms  p99 {percentile(0.99):6.2f} ms"
+    )
+
+
+def main():
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    print(f"{count} rewraps from {threads} threads")
+
+    with KASConnectRPCClient(use_plaintext=True) as client:
+        _run("connect", client, _start_connect_server(), count, threads)
+    server, url = _start_grpc_server(threads)
+    with KASGrpcClient(use_plaintext=True) as client:
+        _run("grpc", client, url, count, threads)
+    server.stop(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -33,14 +33,46 @@ class AesGcm:
             return self.iv + self.ciphertext
 
     def encrypt(
-        self, plaintext: bytes, offset: int = 0, length: int | None = None
+        self,
+        plaintext: bytes | bytearray | memoryview,
+        offset: int = 0,
+        length: int | None = None,
     ) -> "AesGcm.Encrypted":
         if length is None:
             length = len(plaintext) - offset
         iv = os.urandom(self.GCM_NONCE_LENGTH)
-        ct = self.aesgcm.encrypt(iv, plaintext[offset : offset + length], None)
+        with memoryview(plaintext) as view:
+            ct = self.aesgcm.encrypt(iv, view[offset : offset + length], None)
         return self.Encrypted(iv, ct)
 
+    def encrypt_into(self, plaintext, out: bytearray | memoryview) -> int:
+        """Encrypt any bytes-like plaintext into a caller-provided buffer.
+
+        Writes a fresh random IV followed by the ciphertext and tag into
+        ``out``, the same layout as ``Encrypted.as_bytes()``, without
+        allocating intermediate objects when the installed cryptography
+        version provides ``AESGCM.encrypt_into``.
+
+        Args:
+            plaintext: Plaintext as any contiguous bytes-like object
+            out: Writable buffer with room for IV + plaintext + tag
+
+        Returns:
+            Number of bytes written to ``out``
+
+        """
+        iv = os.urandom(self.GCM_NONCE_LENGTH)
+        with memoryview(plaintext) as data, memoryview(out) as view:
+            end = self.GCM_NONCE_LENGTH + data.nbytes + self.GCM_TAG_LENGTH
+            view[: self.GCM_NONCE_LENGTH] = iv
+            if hasattr(self.aesgcm, "encrypt_into"):
+                self.aesgcm.encrypt_into(
+                    iv, data, None, view[self.GCM_NONCE_LENGTH : end]
+                )
+            else:
+                view[self.GCM_NONCE_LENGTH : end] = self.aesgcm.encrypt(iv, data, None)
+        return end
+
     def encrypt_with_iv(
         self,
         iv: bytes,
@@ -61,3 +93,26 @@ class AesGcm:
         self, iv: bytes, auth_tag_len: int, cipher_data: bytes
     ) -> bytes:
         return self.aesgcm.decrypt(iv, cipher_data, None)
+
+    def decrypt_into(self, iv, cipher_data, out: bytearray | memoryview) -> int:
+        """Decrypt any bytes-like ciphertext into a caller-provided buffer.
+
+        Uses ``AESGCM.decrypt_into`` when the installed cryptography version
+        provides it, and falls back to decrypting and copying otherwise.
+
+        Args:
+            iv: Nonce as a bytes-like object
+            cipher_data: Ciphertext followed by the tag, as a bytes-like object
+            out: Writable buffer with room for at least the plaintext length
+
+        Returns:
+            Number of plaintext bytes written to ``out``
+
+        """
+        length = len(cipher_data) - self.GCM_TAG_LENGTH
+        if hasattr(self.aesgcm, "decrypt_into"):
+            with memoryview(out) as view:
+                self.aesgcm.decrypt_into(iv, cipher_data, None, view[:length])
+        else:
+            memoryview(out)[:length] = self.aesgcm.decrypt(iv, cipher_data, None)
+        return length
@@ -0,0 +1,156 @@
+"""Creation, signing and verification of TDF assertions.
+
+An assertion is bound to its TDF by a JWS over two claims, matching the
+platform SDK:
+
+* ``assertionHash``: hex SHA-256 of the canonical assertion JSON (without
+  its binding)
+* ``assertionSig``: base64 of the aggregate segment hash (the concatenated
+  raw segment hashes) followed by the raw assertion hash
+
+The aggregate hash is collected by the segment table while segments are
+encrypted or streamed, so binding and verification never re-read the
+payload.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+from typing import Any
+
+import jwt
+
+from otdf_python.assertion_config import (
+    AssertionConfig,
+    AssertionKey,
+    AssertionKeyAlg,
+    BindingMethod,
+)
+from otdf_python.manifest import ManifestAssertion, ManifestBinding
+
+_HASH_CLAIM = "assertionHash"
+_SIG_CLAIM = "assertionSig"
+
+
+def build_assertion(config: AssertionConfig) -> ManifestAssertion:
+    """Build an unsigned manifest assertion from its configuration."""
+    statement = config.statement
+    return ManifestAssertion(
+        id=config.id,
+        type=str(config.type),
+        scope=str(config.scope),
+        appliesTo_state=str(config.applies_to_state),
+        statement={
+            "format": statement.format,
+            "schema": statement.schema,
+            "value": statement.value,
+        },
+    )
+
+
+def assertion_hash(assertion: ManifestAssertion) -> str:
+    """Return the hex SHA-256 of the canonical JSON of an assertion.
+
+    The binding is replaced by an empty object and keys are sorted, which is
+    how the platform SDK canonicalizes assertions before hashing.
+    """
+    d = assertion.to_dict()
+    d["binding"] = {}
+    canonical = json.dumps(d, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _signing_params(key: AssertionKey) -> tuple[str, Any]:
+    if key.alg == AssertionKeyAlg.HS256:
+        return "HS256", key.key
+    if key.alg == AssertionKeyAlg.RS256:
+        return "RS256", key.key
+    raise ValueError(f"Unsupported assertion key algorithm: {key.alg}")
+
+
+def _expected_sig(aggregate_hash: bytes, hash_hex: str) -> str:
+    return base64.b64encode(aggregate_hash + bytes.fromhex(hash_hex)).decode()
+
+
+def sign_assertion(
+    assertion: ManifestAssertion, aggregate_hash: bytes, key: AssertionKey
+) -> ManifestAssertion:
+    """Bind an assertion to a payload by setting its JWS binding.
+
+    Args:
+        assertion: The assertion to sign; its binding is replaced
+        aggregate_hash: Concatenated raw segment hashes of the payload
+        key: Signing key (HS256 secret or RS256 private key)
+
+    Returns:
+        The same assertion, for chaining
+
+    """
+    hash_hex = assertion_hash(assertion)
+    algorithm, signing_key = _signing_params(key)
+    token = jwt.encode(
+        {_HASH_CLAIM: hash_hex, _SIG_CLAIM: _expected_sig(aggregate_hash, hash_hex)},
+        signing_key,
+        algorithm=algorithm,
+    )
+    assertion.binding = ManifestBinding(method=str(BindingMethod.JWS), signature=token)
+    return assertion
+
+
+def binding_algorithm(assertion: ManifestAssertion) -> str | None:
+    """Return the JWS algorithm an assertion is signed with, if it is signed."""
+    binding = assertion.binding
+    if isinstance(binding, dict):
+        binding = ManifestBinding(**binding)
+    if binding is None or not binding.signature:
+        return None
+    try:
+        return jwt.get_unverified_header(binding.signature).get("alg")
+    except jwt.PyJWTError:
+        return None
+
+
+def verify_assertion(
+    assertion: ManifestAssertion, aggregate_hash: bytes, key: AssertionKey
+):
+    """Verify that an assertion is signed by ``key`` and bound to the payload.
+
+    Args:
+        assertion: Assertion read from the manifest
+        aggregate_hash: Concatenated raw segment hashes of the payload
+        key: Verification key (HS256 secret or RS256 public key)
+
+    Raises:
+        SDK.AssertionException: If the binding is missing, the signature is
+            invalid, or the assertion or payload was modified
+
+    """
+    from otdf_python.sdk import SDK
+
+    binding = assertion.binding
+    if binding is None or not binding.signature:
+        raise SDK.AssertionException("Assertion has no binding", assertion.id)
+    if isinstance(binding, dict):
+        binding = ManifestBinding(**binding)
+    if binding.method != str(BindingMethod.JWS):
+        raise SDK.AssertionException(
+            f"Unsupported assertion binding method: {binding.method}", assertion.id
+        )
+    algorithm, verify_key = _signing_params(key)
+    try:
+        claims = jwt.decode(binding.signature, verify_key, algorithms=[algorithm])
+    except jwt.PyJWTError as e:
+        raise SDK.AssertionException(
+            f"Assertion signature verification failed: {e}", assertion.id
+        ) from e
+
+    hash_hex = assertion_hash(assertion)
+    if not hmac.compare_digest(str(claims.get(_HASH_CLAIM, "")), hash_hex):
+        raise SDK.AssertionException("Assertion hash mismatch", assertion.id)
+    if not hmac.compare_digest(
+        str(claims.get(_SIG_CLAIM, "")), _expected_sig(aggregate_hash, hash_hex)
+    ):
+        raise SDK.AssertionException(
+            "Assertion is not bound to this payload", assertion.id
+        )
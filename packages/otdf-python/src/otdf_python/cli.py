@@ -9,8 +9,9 @@ import argparse
 import contextlib
 import json
 import logging
+import shutil
 import sys
-from dataclasses import asdict
+import tempfile
 from importlib import metadata
 from io import BytesIO
 from pathlib import Path
@@ -309,64 +310,79 @@ def cmd_encrypt(args):
         sdk.close()
 
 
+def _is_zip_file(path: Path) -> bool:
+    """Check whether a file starts with the ZIP local file header magic."""
+    with path.open("rb") as f:
+        return f.read(2) == b"PK"
+
+
+def _decrypt_to(sdk: SDK, args, input_path: Path | None, output_file) -> None:
+    """Decrypt a TDF or NanoTDF file, or stdin if no path is given, into a stream."""
+    if input_path is None:
+        _decrypt_stream_to(sdk, args, sys.stdin.buffer, output_file)
+        return
+    # NanoTDFs have a specific header format, regular TDFs are ZIP files
+    if _is_zip_file(input_path):
+        # Regular TDF: decrypt straight from a memory-mapped file
+        logger.debug("Decrypting TDF")
+        sdk.read_tdf_file(input_path, output_file)
+        logger.info("Successfully decrypted TDF")
+    else:
+        # Assume NanoTDF
+        logger.debug("Decrypting NanoTDF")
+        with input_path.open("rb") as input_file:
+            encrypted_data = input_file.read()
+        config = create_nano_tdf_config(sdk, args)
+        sdk.read_nano_tdf(BytesIO(encrypted_data), output_file, config)
+        logger.info("Successfully decrypted NanoTDF")
+
+
+def _decrypt_stream_to(sdk: SDK, args, input_stream, output_file) -> None:
+    """Decrypt a TDF or NanoTDF read from a non-seekable stream such as stdin."""
+    if input_stream.peek(2)[:2] == b"PK":
+        # Regular TDF: the payload is spooled until the manifest arrives
+        logger.debug("Decrypting TDF from stream")
+        sdk.read_tdf_stream(input_stream, output_file)
+        logger.info("Successfully decrypted TDF")
+    else:
+        logger.debug("Decrypting NanoTDF from stream")
+        config = create_nano_tdf_config(sdk, args)
+        sdk.read_nano_tdf(BytesIO(input_stream.read()), output_file, config)
+        logger.info("Successfully decrypted NanoTDF")
+
+
 def cmd_decrypt(args):
     """Handle decrypt command."""
     logger.info("Running decrypt command")
 
-    # Validate input file
-    input_path = validate_file_exists(args.file)
+    # Validate input file; "-" reads the TDF from stdin
+    input_path = None if args.file == "-" else validate_file_exists(args.file)
 
     # Build SDK
     sdk = build_sdk(args)
 
     try:
-        # Read encrypted file
-        with input_path.open("rb") as input_file:
-            encrypted_data = input_file.read()
-
-        # Determine output
+        # Segments are checked as they are decrypted, so the plaintext goes
+        # to a temporary file first and is only released once all of them
+        # passed; a failed decrypt leaves no partial output behind
         if args.output:
             output_path = Path(args.output)
-            with output_path.open("wb") as output_file:
+            with tempfile.NamedTemporaryFile(
+                dir=output_path.parent, prefix=f".{output_path.name}.", delete=False
+            ) as temp_file:
+                temp_path = Path(temp_file.name)
                 try:
-                    # Try to determine if it's a NanoTDF or regular TDF
-                    # NanoTDFs have a specific header format, regular TDFs are ZIP files
-                    if encrypted_data.startswith(b"PK"):
-                        # Regular TDF (ZIP format)
-                        logger.debug("Decrypting TDF")
-                        tdf_reader = sdk.load_tdf(encrypted_data)
-                        # Access payload directly from TDFReader
-                        payload_bytes = tdf_reader.payload
-                        output_file.write(payload_bytes)
-                        logger.info("Successfully decrypted TDF")
-                    else:
-                        # Assume NanoTDF
-                        logger.debug("Decrypting NanoTDF")
-                        config = create_nano_tdf_config(sdk, args)
-                        sdk.read_nano_tdf(BytesIO(encrypted_data), output_file, config)
-                        logger.info("Successfully decrypted NanoTDF")
-
-                except Exception:
-                    # Clean up the output file if there was an error
-                    output_path.unlink(missing_ok=True)
+                    _decrypt_to(sdk, args, input_path, temp_file)
+                except BaseException:
+                    temp_file.close()
+                    temp_path.unlink(missing_ok=True)
                     raise
+            temp_path.replace(output_path)
         else:
-            output_file = sys.stdout.buffer
-            # Try to determine if it's a NanoTDF or regular TDF
-            # NanoTDFs have a specific header format, regular TDFs are ZIP files
-            if encrypted_data.startswith(b"PK"):
-                # Regular TDF (ZIP format)
-                logger.debug("Decrypting TDF")
-                tdf_reader = sdk.load_tdf(encrypted_data)
-                payload_bytes = tdf_reader.payload
-                output_file.write(payload_bytes)
-                logger.info("Successfully decrypted TDF")
-            else:
-                # Assume NanoTDF
-                logger.debug("Decrypting NanoTDF")
-                config = create_nano_tdf_config(sdk, args)
-                sdk.read_nano_tdf(BytesIO(encrypted_data), output_file, config)
-                logger.info("Successfully decrypted NanoTDF")
+            with tempfile.TemporaryFile() as temp_file:
+                _decrypt_to(sdk, args, input_path, temp_file)
+                temp_file.seek(0)
+                shutil.copyfileobj(temp_file, sys.stdout.buffer)
 
     finally:
         sdk.close()
@@ -380,61 +396,46 @@ def cmd_inspect(args):
     input_path = validate_file_exists(args.file)
 
     try:
-        sdk = build_sdk(args)
-
-        try:
-            # Read encrypted file
-            with input_path.open("rb") as input_file:
-                encrypted_data = input_file.read()
-
-            if encrypted_data.startswith(b"PK"):
-                # Regular TDF
-                logger.debug("Inspecting TDF")
-                tdf_reader = sdk.load_tdf(BytesIO(encrypted_data))
-                manifest = tdf_reader.manifest
-
-                # Try to get data attributes
-                try:
-                    data_attributes = []  # This would need to be implemented in the SDK
-                    inspection_result = {
-                        "manifest": asdict(manifest),
-                        "dataAttributes": data_attributes,
-                    }
-                except Exception as e:
-                    logger.warning(f"Could not retrieve data attributes: {e}")
-                    inspection_result = {"manifest": asdict(manifest)}
-
-                print(json.dumps(inspection_result, indent=2, default=str))
-            else:
-                # NanoTDF - for now just show basic info
-                logger.debug("Inspecting NanoTDF")
-                print(
-                    json.dumps(
-                        {
-                            "type": "NanoTDF",
-                            "size": len(encrypted_data),
-                            "note": "NanoTDF inspection not fully implemented",
-                        },
-                        indent=2,
-                    )
+        if _is_zip_file(input_path):
+            # Regular TDF: only the manifest is read, no KAS access required
+            logger.debug("Inspecting TDF")
+            inspection = SDK.inspect_tdf(input_path)
+            inspection_result = {
+                "manifest": json.loads(inspection.manifest.to_json()),
+                "dataAttributes": inspection.attributes,
+                "kasUrls": inspection.kas_urls,
+                "segments": {
+                    "count": inspection.segment_count,
+                    "segmentSizeDefault": inspection.segment_size_default,
+                    "plaintextSize": inspection.plaintext_size,
+                    "encryptedSize": inspection.encrypted_size,
+                },
+            }
+            print(json.dumps(inspection_result, indent=2, default=str))
+        else:
+            # NanoTDF - for now just show basic info
+            logger.debug("Inspecting NanoTDF")
+            print(
+                json.dumps(
+                    {
+                        "type": "NanoTDF",
+                        "size": input_path.stat().st_size,
+                        "note": "NanoTDF inspection not fully implemented",
+                    },
+                    indent=2,
                 )
-
-        finally:
-            sdk.close()
+            )
 
     except Exception as e:
-        # If we can't inspect due to auth issues, show what we can
+        # If the manifest cannot be parsed, show what we can
         logger.warning(f"Limited inspection due to: {e}")
-        with input_path.open("rb") as input_file:
-            encrypted_data = input_file.read()
-
-        file_type = "TDF" if encrypted_data.startswith(b"PK") else "NanoTDF"
+        file_type = "TDF" if _is_zip_file(input_path) else "NanoTDF"
         print(
             json.dumps(
                 {
                     "type": file_type,
-                    "size": len(encrypted_data),
-                    "note": "Full inspection requires authentication",
+                    "size": input_path.stat().st_size,
+                    "note": "Full inspection failed",
                 },
                 indent=2,
             )
@@ -539,7 +540,9 @@ Where creds.json contains:
 
     # Decrypt command
     decrypt_parser = subparsers.add_parser("decrypt", help="Decrypt a file")
-    decrypt_parser.add_argument("file", help="Path to encrypted file")
+    decrypt_parser.add_argument(
+        "file", help="Path to encrypted file, or - to read from stdin"
+    )
     decrypt_parser.add_argument(
         "--output", "-o", help="Output file path (default: stdout)"
     )
@@ -0,0 +1,179 @@
+"""Per-segment payload compression for TDF.
+
+Segments are compressed individually before encryption, so every segment
+stays independently decodable for range reads and parallel decryption. The
+algorithm is recorded in the manifest (``encryptionInformation.method.
+compression``), which is an extension of this SDK: TDFs written without
+compression are unchanged and readable by every OpenTDF SDK.
+
+``zlib`` is always available. ``zstd`` uses the standard library
+``compression.zstd`` module (Python 3.14+) or the ``zstandard`` package, and
+``lz4`` the ``lz4`` package, when installed.
+"""
+
+import zlib
+from abc import ABC, abstractmethod
+
+
+class SegmentCodec(ABC):
+    """Compresses and decompresses individual payload segments."""
+
+    name: str
+
+    @abstractmethod
+    def compress(self, data) -> bytes:
+        """Compress one segment given as any bytes-like object."""
+
+    @abstractmethod
+    def _decompress(self, data, size: int) -> bytes:
+        """Decompress one segment, producing at most ``size`` bytes."""
+
+    def decompress(self, data, size: int) -> bytes:
+        """Decompress one segment and check it has the expected size.
+
+        Args:
+            data: Compressed segment as any bytes-like object
+            size: Plaintext size of the segment recorded in the manifest
+
+        Returns:
+            The decompressed segment
+
+        Raises:
+            ValueError: If the segment does not decompress to ``size`` bytes
+
+        """
+        try:
+            plaintext = self._decompress(data, size)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to decompress {self.name} segment: {e}") from e
+        if len(plaintext) != size:
+            raise ValueError(
+                f"Decompressed {self.name} segment is {len(plaintext)} bytes, "
+                f"expected {size}"
+            )
+        return plaintext
+
+
+class ZlibCodec(SegmentCodec):
+    """DEFLATE via the standard library ``zlib`` module."""
+
+    name = "zlib"
+
+    def __init__(self, level: int | None = None):
+        """Initialize with an optional compression level (0-9)."""
+        self.level = zlib.Z_DEFAULT_COMPRESSION if level is None else level
+
+    def compress(self, data) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def _decompress(self, data, size: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        # Bound the output so a malformed segment cannot expand unchecked
+        plaintext = decompressor.decompress(data, size)
+        if decompressor.unconsumed_tail or not decompressor.eof:
+            raise ValueError("zlib segment is larger than recorded in the manifest")
+        return plaintext
+
+
+class ZstdCodec(SegmentCodec):
+    """Zstandard via ``compression.zstd`` or the ``zstandard`` package."""
+
+    name = "zstd"
+
+    def __init__(self, level: int | None = None):
+        """Initialize with an optional compression level."""
+        self.level = 3 if level is None else level
+        try:
+            from compression import zstd
+
+            self._zstd = zstd
+            self._zstandard = None
+        except ImportError:
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ValueError(
+                    "zstd compression requires Python 3.14+ or the 'zstandard' package"
+                ) from e
+            self._zstd = None
+            self._zstandard = zstandard
+
+    def compress(self, data) -> bytes:
+        if self._zstd is not None:
+            return self._zstd.compress(data, level=self.level)
+        return self._zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def _decompress(self, data, size: int) -> bytes:
+        if self._zstd is not None:
+            decompressor = self._zstd.ZstdDecompressor()
+            plaintext = decompressor.decompress(data, max_length=size)
+            if not decompressor.eof:
+                raise ValueError("zstd segment is larger than recorded in the manifest")
+            return plaintext
+        return self._zstandard.ZstdDecompressor().decompress(data, max_output_size=size)
+
+
+class Lz4Codec(SegmentCodec):
+    """LZ4 frames via the ``lz4`` package."""
+
+    name = "lz4"
+
+    def __init__(self, level: int | None = None):
+        """Initialize with an optional compression level."""
+        try:
+            import lz4.frame
+        except ImportError as e:
+            raise ValueError("lz4 compression requires the 'lz4' package") from e
+        self._frame = lz4.frame
+        self.level = 0 if level is None else level
+
+    def compress(self, data) -> bytes:
+        return self._frame.compress(data, compression_level=self.level)
+
+    def _decompress(self, data, size: int) -> bytes:
+        decompressor = self._frame.LZ4FrameDecompressor()
+        plaintext = decompressor.decompress(data, max_length=size)
+        if not decompressor.eof:
+            raise ValueError("lz4 segment is larger than recorded in the manifest")
+        return plaintext
+
+
+_CODECS: dict[str, type[SegmentCodec]] = {
+    ZlibCodec.name: ZlibCodec,
+    ZstdCodec.name: ZstdCodec,
+    Lz4Codec.name: Lz4Codec,
+}
+
+
+def get_codec(name: str, level: int | None = None) -> SegmentCodec:
+    """Return the codec for a compression algorithm name.
+
+    Args:
+        name: ``"zlib"``, ``"zstd"`` or ``"lz4"`` (case-insensitive)
+        level: Optional codec-specific compression level
+
+    Returns:
+        A SegmentCodec instance
+
+    Raises:
+        ValueError: If the algorithm is unknown or its library is not installed
+
+    """
+    codec = _CODECS.get(name.lower())
+    if codec is None:
+        raise ValueError(f"Unsupported segment compression: {name}")
+    return codec(level)
+
+
+def available_codecs() -> list[str]:
+    """Return the names of the compression algorithms usable here."""
+    names = []
+    for name in _CODECS:
+        try:
+            get_codec(name)
+        except ValueError:
+            continue
+        names.append(name)
+    return names
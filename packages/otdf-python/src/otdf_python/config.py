@@ -5,6 +5,9 @@ from enum import Enum
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
+from otdf_python.assertion_config import AssertionConfig
+from otdf_python.autoconfigure_utils import KeySplitStep
+
 
 class TDFFormat(Enum):
     """TDF format enumeration."""
@@ -50,11 +53,19 @@ class TDFConfig:
     attributes: list[str] = field(default_factory=list)
     kas_info_list: list[KASInfo] = field(default_factory=list)
     mime_type: str = "application/octet-stream"
-    split_plan: list[str] | None = field(default_factory=list)
+    # Splits the payload key into XOR shares, one per split ID; each share is
+    # wrapped for the KASes of its steps. Empty wraps the whole key for every
+    # KAS in kas_info_list
+    split_plan: list[KeySplitStep] | None = field(default_factory=list)
     wrapping_key_type: str | None = None
     hex_encode_root_and_segment_hashes: bool = False
     render_version_info_in_manifest: bool = True
     policy_object: Any | None = None
+    # Opt-in per-segment compression before encryption: "zlib", "zstd" or "lz4"
+    compression: str | None = None
+    compression_level: int | None = None
+    # Assertions signed and bound to the payload when the TDF is created
+    assertions: list[AssertionConfig] = field(default_factory=list)
 
 
 @dataclass
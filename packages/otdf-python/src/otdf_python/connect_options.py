@@ -0,0 +1,91 @@
+"""Codec and compression of Connect RPCs to platform services.
+
+Connect clients encode messages as binary protobuf and compress them with a
+negotiated algorithm. :class:`ConnectOptions` selects both for the Connect
+clients of an SDK: which algorithm requests are compressed with, which ones
+responses may be compressed with (in order of preference), and how large a
+response may be. Large responses, such as batch rewraps, shrink on the wire
+with gzip or zstd; small ones are often better sent uncompressed.
+
+``gzip`` is always available; ``zstd`` requires the ``zstandard`` package and
+``br`` the ``brotli`` package.
+"""
+
+from dataclasses import dataclass
+
+from connectrpc.compression import Compression
+from connectrpc.compression.gzip import GzipCompression
+
+
+def connect_compression(name: str) -> Compression:
+    """Return the Connect compression for an algorithm name.
+
+    Args:
+        name: ``"gzip"``, ``"zstd"`` or ``"br"`` (case-insensitive)
+
+    Returns:
+        A Compression instance
+
+    Raises:
+        ValueError: If the algorithm is unknown or its library is not installed
+
+    """
+    name = name.lower()
+    if name == "gzip":
+        return GzipCompression()
+    if name == "zstd":
+        try:
+            from connectrpc.compression.zstd import ZstdCompression
+        except ImportError as e:
+            raise ValueError("zstd compression requires the 'zstandard' package") from e
+        return ZstdCompression()
+    if name == "br":
+        try:
+            from connectrpc.compression.brotli import BrotliCompression
+        except ImportError as e:
+            raise ValueError("br compression requires the 'brotli' package") from e
+        return BrotliCompression()
+    raise ValueError(f"Unsupported Connect compression: {name}")
+
+
+@dataclass(frozen=True)
+class ConnectOptions:
+    """Codec and compression of the Connect RPCs of an SDK."""
+
+    # Encode messages as JSON instead of binary protobuf; larger and slower,
+    # but readable when debugging
+    proto_json: bool = False
+    # Algorithm requests are compressed with, or None to send them as is
+    send_compression: str | None = "gzip"
+    # Algorithms responses may be compressed with, most preferred first; an
+    # empty tuple asks for uncompressed responses
+    accept_compression: tuple[str, ...] = ("gzip",)
+    # Largest response accepted, in bytes, or None for no limit
+    read_max_bytes: int | None = None
+
+    def __post_init__(self):
+        """Check that every algorithm is usable.
+
+        Raises:
+            ValueError: If an algorithm is unknown or its library is not
+                installed
+
+        """
+        for name in (self.send_compression, *self.accept_compression):
+            if name is not None:
+                connect_compression(name)
+
+    def client_kwargs(self) -> dict:
+        """Return the arguments of a generated Connect client for these options."""
+        return {
+            "proto_json": self.proto_json,
+            "send_compression": (
+                connect_compression(self.send_compression)
+                if self.send_compression
+                else None
+            ),
+            "accept_compression": [
+                connect_compression(name) for name in self.accept_compression
+            ],
+            "read_max_bytes": self.read_max_bytes,
+        }
@@ -0,0 +1,78 @@
+"""Storage for TDFs whose encrypted payload is kept outside the ZIP.
+
+A detached TDF consists of two objects: the raw encrypted segments, one
+after another without any ZIP framing, and a small manifest JSON object
+whose ``payload`` references the segments by ``url`` and ``protocol``.
+Without ZIP framing the payload maps directly onto object-store multipart
+uploads, segment ``i`` starts at a fixed offset (with uncompressed
+segments), and readers fetch only the segments they need with range reads.
+
+A :class:`PayloadStorage` resolves the URLs of both objects; object stores
+are supported by implementing it, the local file system by
+:class:`LocalPayloadStorage`.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO
+from urllib.parse import unquote, urlparse
+
+from otdf_python.range_source import FileRangeSource, RangeSource
+
+
+class PayloadStorage(ABC):
+    """Resolves the URLs of detached payloads and manifests to storage."""
+
+    # Recorded as ``payload.protocol`` in the manifest
+    protocol: str = ""
+
+    @abstractmethod
+    def create(self, url: str) -> BinaryIO:
+        """Open the object at ``url`` for writing, replacing any existing one."""
+
+    @abstractmethod
+    def open(self, url: str) -> RangeSource:
+        """Open the object at ``url`` for range reads."""
+
+    def read(self, url: str) -> bytes:
+        """Read a whole, small object such as a manifest."""
+        with self.open(url) as source:
+            return bytes(source.read_range(0, source.size()))
+
+
+class LocalPayloadStorage(PayloadStorage):
+    """Payload storage on the local file system.
+
+    URLs are ``file://`` URLs or paths; relative paths are resolved against
+    ``root``.
+    """
+
+    protocol = "file"
+
+    def __init__(self, root: str | os.PathLike | None = None):
+        """Resolve relative URLs against ``root``, the working directory by default."""
+        self.root = Path(root) if root is not None else Path()
+
+    def path(self, url: str) -> Path:
+        """Return the local path of ``url``.
+
+        Raises:
+            ValueError: If the URL has a scheme other than ``file``
+
+        """
+        parsed = urlparse(url)
+        if parsed.scheme == "file":
+            return Path(unquote(parsed.path))
+        if parsed.scheme and len(parsed.scheme) > 1:
+            # Single letters are Windows drive letters, not schemes
+            raise ValueError(f"Unsupported URL for local payload storage: {url}")
+        return self.root / url
+
+    def create(self, url: str) -> BinaryIO:
+        path = self.path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open("wb")
+
+    def open(self, url: str) -> RangeSource:
+        return FileRangeSource(self.path(url))
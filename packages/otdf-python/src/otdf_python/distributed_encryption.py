@@ -0,0 +1,174 @@
+"""Distributed encryption of one TDF across processes or nodes.
+
+A coordinator creates an :class:`EncryptionPlan` once (see
+``TDF.plan_encryption``): the payload key, its key access objects and the
+policy, and a split of the plaintext into segment-aligned parts. Each worker
+encrypts one part with :func:`encrypt_part`, producing the encrypted
+segments and a :class:`PartResult` holding the part's segment table and
+CRC-32. The finalizer (``TDF.finalize_encryption``) combines the partial
+tables into the manifest and root signature, and the CRCs into the ZIP entry
+CRC, without reading any ciphertext.
+
+The TDF is ``plan.header``, followed by the encrypted parts in order and the
+tail returned by the finalizer, so parts map directly onto the parts of an
+object store multipart upload. Without compression every part also has a
+fixed offset in the TDF (:meth:`EncryptionPlan.part_offset`), so workers
+sharing a file system can write straight into the final file.
+
+The plan carries the payload key in the clear; only hand it to trusted
+workers.
+"""
+
+import contextlib
+import os
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+from otdf_python.aesgcm import AesGcm
+from otdf_python.compression import get_codec
+from otdf_python.manifest import ManifestKeyAccess
+from otdf_python.segment_table import SegmentTable
+
+_SEGMENT_OVERHEAD = AesGcm.GCM_NONCE_LENGTH + AesGcm.GCM_TAG_LENGTH
+
+
+@dataclass
+class EncryptionPart:
+    """A segment-aligned plaintext range assigned to one worker."""
+
+    index: int
+    offset: int
+    size: int
+
+
+@dataclass
+class EncryptionPlan:
+    """Everything workers need to encrypt their parts of one TDF."""
+
+    key: bytes
+    key_access: list[ManifestKeyAccess]
+    policy: str
+    segment_size: int
+    plaintext_size: int
+    parts: list[EncryptionPart]
+    # Local header of the payload entry, which starts the TDF
+    header: bytes = field(default=b"", repr=False)
+    compression: str | None = None
+    compression_level: int | None = None
+
+    def part_offset(self, index: int) -> int:
+        """Return the offset of a part's encrypted segments in the TDF.
+
+        Raises:
+            ValueError: If segments are compressed, so their size is unknown
+
+        """
+        if self.compression:
+            raise ValueError("Part offsets are not known in advance with compression")
+        part = self.parts[index]
+        segments_before = part.offset // self.segment_size
+        return len(self.header) + part.offset + segments_before * _SEGMENT_OVERHEAD
+
+    @property
+    def payload_size(self) -> int | None:
+        """Size of the encrypted payload, if known in advance."""
+        if self.compression:
+            return None
+        segment_count = -(-self.plaintext_size // self.segment_size)
+        return self.plaintext_size + segment_count * _SEGMENT_OVERHEAD
+
+
+@dataclass
+class PartResult:
+    """Outcome of encrypting one part, returned by a worker."""
+
+    index: int
+    segments: SegmentTable
+    size: int
+    crc: int
+
+
+def split_parts(
+    plaintext_size: int, segment_size: int, part_size: int
+) -> list[EncryptionPart]:
+    """Split a plaintext into parts whose size is a multiple of the segment size."""
+    part_size = max(segment_size, -(-part_size // segment_size) * segment_size)
+    return [
+        EncryptionPart(index, offset, min(part_size, plaintext_size - offset))
+        for index, offset in enumerate(range(0, plaintext_size, part_size))
+    ]
+
+
+def _read_part(source: BinaryIO, size: int, segment_size: int) -> Iterator[memoryview]:
+    """Yield the segments of a part, read into one recycled buffer."""
+    buffer = memoryview(bytearray(segment_size))
+    remaining = size
+    while remaining:
+        wanted = min(segment_size, remaining)
+        filled = 0
+        while filled < wanted:
+            n = source.readinto(buffer[filled:wanted])
+            if not n:
+                raise ValueError("Plaintext ended before the end of the part")
+            filled += n
+        remaining -= filled
+        yield buffer[:filled]
+
+
+def encrypt_part(
+    plan: EncryptionPlan,
+    index: int,
+    source: str | os.PathLike | BinaryIO,
+    output: str | os.PathLike | BinaryIO,
+    output_offset: int | None = None,
+) -> PartResult:
+    """Encrypt one part of a plan; the worker side of distributed encryption.
+
+    Args:
+        plan: Plan created by the coordinator
+        index: Index of the part to encrypt
+        source: Path of the whole plaintext, or a seekable binary stream
+            holding it
+        output: Path or binary stream the encrypted segments are written to
+        output_offset: Offset to write at, e.g. ``plan.part_offset(index)``
+            to write into the final TDF; a path is then opened for update
+            rather than created
+
+    Returns:
+        PartResult to hand to the finalizer
+
+    """
+    from otdf_python.tdf import TDF
+
+    part = plan.parts[index]
+    codec = (
+        get_codec(plan.compression, plan.compression_level)
+        if plan.compression
+        else None
+    )
+    table = SegmentTable(plan.segment_size)
+    crc = 0
+    size = 0
+    with contextlib.ExitStack() as stack:
+        if isinstance(source, str | os.PathLike):
+            source = stack.enter_context(Path(source).open("rb"))
+        if isinstance(output, str | os.PathLike):
+            mode = "wb" if output_offset is None else "r+b"
+            output = stack.enter_context(Path(output).open(mode))
+        if output_offset is not None:
+            output.seek(output_offset)
+        source.seek(part.offset)
+        chunks = _read_part(source, part.size, plan.segment_size)
+        for plaintext_size, encrypted in TDF._encrypted_segments(
+            AesGcm(plan.key), chunks, plan.segment_size, codec
+        ):
+            output.write(encrypted)
+            crc = zlib.crc32(encrypted, crc)
+            size += len(encrypted)
+            table.append(
+                plaintext_size, len(encrypted), encrypted[-SegmentTable.TAG_LENGTH :]
+            )
+    return PartResult(index=index, segments=table, size=size, crc=crc)
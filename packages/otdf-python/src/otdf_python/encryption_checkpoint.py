@@ -0,0 +1,167 @@
+"""Sidecar file recording the progress of a resumable TDF encryption.
+
+The sidecar is a JSON-lines file. The first line describes the encryption
+(wrapped key access objects, policy, segment size and where the payload
+starts in the output); every following line records one checkpoint: the
+segments completed since the previous checkpoint, the payload bytes written,
+their CRC-32 and the plaintext offset to continue from. Checkpoints are only
+appended after the output file has been flushed to disk, so the last
+complete line always describes data that is durable. A line torn by a crash
+is ignored on load.
+"""
+
+import base64
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from otdf_python.manifest import ManifestKeyAccess
+from otdf_python.segment_table import SegmentTable
+
+
+class EncryptionCheckpoint:
+    """Append-only record of a resumable encryption."""
+
+    VERSION = 1
+
+    def __init__(self, path: str | os.PathLike, header: dict[str, Any]):
+        """Initialize a checkpoint; use :meth:`create` or :meth:`load`."""
+        self.path = Path(path)
+        self.header = header
+        # Segments written so far; the caller appends to it as it encrypts
+        self.table = SegmentTable(header["segmentSize"])
+        self._recorded = 0
+        self.payload_size = 0
+        self.crc = 0
+        self.plaintext_offset = 0
+
+    @classmethod
+    def create(
+        cls,
+        path: str | os.PathLike,
+        key_access: list[ManifestKeyAccess],
+        policy: str,
+        segment_size: int,
+        compression: str | None,
+        header_offset: int,
+        data_offset: int,
+        plaintext_size: int | None,
+    ) -> "EncryptionCheckpoint":
+        """Start a new sidecar file, replacing any existing one.
+
+        Args:
+            path: Location of the sidecar file
+            key_access: Key access objects holding the wrapped payload key
+            policy: Base64-encoded policy of the TDF
+            segment_size: Plaintext segment size
+            compression: Segment compression algorithm, if any
+            header_offset: Offset of the payload local header in the output
+            data_offset: Offset of the payload data in the output
+            plaintext_size: Size of the plaintext, if known
+
+        Returns:
+            The new checkpoint
+
+        """
+        header = {
+            "version": cls.VERSION,
+            "keyAccess": [asdict(ka) for ka in key_access],
+            "policy": policy,
+            "segmentSize": segment_size,
+            "compression": compression,
+            "headerOffset": header_offset,
+            "dataOffset": data_offset,
+            "plaintextSize": plaintext_size,
+        }
+        checkpoint = cls(path, header)
+        with checkpoint.path.open("w", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return checkpoint
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "EncryptionCheckpoint":
+        """Read a sidecar file and replay its checkpoints.
+
+        Raises:
+            ValueError: If the file is not a checkpoint of a known version
+
+        """
+        lines = Path(path).read_bytes().splitlines(keepends=True)
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid encryption checkpoint: {path}") from e
+        if header.get("version") != cls.VERSION:
+            raise ValueError(
+                f"Unsupported encryption checkpoint version: {header.get('version')}"
+            )
+        checkpoint = cls(path, header)
+        valid_length = len(lines[0])
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            if record is None or not line.endswith(b"\n"):
+                # Torn write of the last checkpoint; drop it so that new
+                # checkpoints start on a line of their own
+                with checkpoint.path.open("r+b") as f:
+                    f.truncate(valid_length)
+                break
+            valid_length += len(line)
+            for size, encrypted_size, tag in record["segments"]:
+                checkpoint.table.append(size, encrypted_size, base64.b64decode(tag))
+            checkpoint.payload_size = record["payloadSize"]
+            checkpoint.crc = record["crc"]
+            checkpoint.plaintext_offset = record["plaintextOffset"]
+        checkpoint._recorded = len(checkpoint.table)
+        return checkpoint
+
+    @property
+    def key_access(self) -> list[ManifestKeyAccess]:
+        """Key access objects holding the wrapped payload key."""
+        return [ManifestKeyAccess(**ka) for ka in self.header["keyAccess"]]
+
+    def record(self, payload_size: int, crc: int, offset: int):
+        """Append a checkpoint for the segments added to :attr:`table` since the last.
+
+        The caller must have flushed the output up to ``payload_size`` to
+        disk beforehand.
+
+        Args:
+            payload_size: Encrypted payload bytes written
+            crc: CRC-32 of those bytes
+            offset: Plaintext offset encryption continues from
+
+        """
+        table = self.table
+        new_segments = [
+            [
+                table.segment_size(i),
+                table.encrypted_segment_size(i),
+                base64.b64encode(table.tag(i)).decode(),
+            ]
+            for i in range(self._recorded, len(table))
+        ]
+        record = {
+            "segments": new_segments,
+            "payloadSize": payload_size,
+            "crc": crc,
+            "plaintextOffset": offset,
+        }
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._recorded = len(table)
+        self.payload_size = payload_size
+        self.crc = crc
+        self.plaintext_offset = offset
+
+    def remove(self):
+        """Delete the sidecar file once the TDF is complete."""
+        self.path.unlink(missing_ok=True)
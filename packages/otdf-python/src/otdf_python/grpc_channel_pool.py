@@ -0,0 +1,125 @@
+"""Shared gRPC channels to platform services.
+
+A gRPC channel multiplexes any number of concurrent calls as HTTP/2 streams
+over one connection, which it keeps alive with HTTP/2 pings. A
+:class:`GrpcChannelPool` holds one channel per ``host:port`` and hands it to
+every client of that target, so KAS and other platform service stubs (see
+``otdf_python_proto.legacy_grpc``) share connections instead of opening
+their own.
+"""
+
+import threading
+from urllib.parse import urlparse
+
+import grpc
+
+
+def grpc_target(url: str, use_plaintext: bool = False) -> tuple[str, bool]:
+    """Return the ``host:port`` target of a service URL and whether it is plaintext.
+
+    gRPC methods are served from the root of the host, so any path of the
+    URL is ignored. URLs without a scheme use ``use_plaintext``.
+
+    Raises:
+        ValueError: If the URL has no host or a scheme other than HTTP(S)
+
+    """
+    parsed = urlparse(url if "://" in url else f"//{url}")
+    if parsed.scheme not in ("", "http", "https") or not parsed.hostname:
+        raise ValueError(f"Invalid gRPC service URL: {url}")
+    plaintext = parsed.scheme == "http" or (not parsed.scheme and use_plaintext)
+    port = parsed.port or (80 if plaintext else 443)
+    host = parsed.hostname
+    if ":" in host:
+        host = f"[{host}]"
+    return f"{host}:{port}", plaintext
+
+
+class GrpcChannelPool:
+    """Thread-safe cache of gRPC channels, one per target."""
+
+    def __init__(
+        self,
+        keepalive_time: float = 300.0,
+        keepalive_timeout: float = 20.0,
+        root_certificates: bytes | None = None,
+        options: tuple[tuple[str, object], ...] = (),
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            keepalive_time: Seconds between keepalive pings on a connection
+                with calls in flight. Servers reject clients that ping too
+                often; the platform accepts one ping per five minutes by
+                default.
+            keepalive_timeout: Seconds to wait for a ping to be acknowledged
+                before the connection is considered dead
+            root_certificates: PEM-encoded CA certificates for TLS targets,
+                the system ones by default
+            options: Further gRPC channel options
+
+        """
+        self.keepalive_time = keepalive_time
+        self.keepalive_timeout = keepalive_timeout
+        self.root_certificates = root_certificates
+        self.options = options
+        self._channels: dict[tuple[str, bool], grpc.Channel] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Pickle the configuration only; worker processes connect afresh."""
+        return {
+            "keepalive_time": self.keepalive_time,
+            "keepalive_timeout": self.keepalive_timeout,
+            "root_certificates": self.root_certificates,
+            "options": self.options,
+        }
+
+    def __setstate__(self, state: dict):
+        """Restore the configuration with no channels."""
+        self.__init__(**state)
+
+    def channel(self, url: str, use_plaintext: bool = False) -> grpc.Channel:
+        """Return the shared channel to the service at ``url``.
+
+        Args:
+            url: Service URL; only its scheme, host and port are used
+            use_plaintext: Whether URLs without a scheme are plaintext
+
+        Returns:
+            The channel, created on first use
+
+        """
+        key = grpc_target(url, use_plaintext)
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = self._channels[key] = self._create_channel(*key)
+            return channel
+
+    def _create_channel(self, target: str, plaintext: bool) -> grpc.Channel:
+        options = [
+            ("grpc.keepalive_time_ms", int(self.keepalive_time * 1000)),
+            ("grpc.keepalive_timeout_ms", int(self.keepalive_timeout * 1000)),
+            # Idle connections are not pinged, so servers do not drop them
+            # for pinging without calls
+            ("grpc.keepalive_permit_without_calls", 0),
+            *self.options,
+        ]
+        if plaintext:
+            return grpc.insecure_channel(target, options=options)
+        credentials = grpc.ssl_channel_credentials(self.root_certificates)
+        return grpc.secure_channel(target, credentials, options=options)
+
+    def __len__(self) -> int:
+        """Return the number of open channels."""
+        with self._lock:
+            return len(self._channels)
+
+    def close(self) -> None:
+        """Close every channel; later calls to :meth:`channel` reconnect."""
+        with self._lock:
+            channels = list(self._channels.values())
+            self._channels.clear()
+        for channel in channels:
+            channel.close()
@@ -7,6 +7,7 @@ import secrets
 import time
 from base64 import b64decode
 from dataclasses import dataclass
+from enum import Enum
 
 import jwt
 
@@ -16,6 +17,51 @@ from .kas_connect_rpc_client import KASConnectRPCClient
 from .kas_key_cache import KASKeyCache
 from .key_type_constants import EC_KEY_TYPE, RSA_KEY_TYPE
 from .sdk_exceptions import SDKException
+from .single_flight import SingleFlight
+
+
+class KASTransport(Enum):
+    """Protocol used to talk to KAS."""
+
+    # Connect RPC over HTTP, the default
+    CONNECT = "connect"
+    # gRPC over shared, kept-alive HTTP/2 channels
+    GRPC = "grpc"
+
+
+def create_rpc_client(
+    transport=KASTransport.CONNECT,
+    channel_pool=None,
+    connect_options=None,
+    **options,
+):
+    """Create the client making the KAS RPCs over a transport.
+
+    Both transports have the interface of KASConnectRPCClient.
+
+    Args:
+        transport: KASTransport (or its value) to talk to KAS with
+        channel_pool: Optional GrpcChannelPool, for the gRPC transport
+        connect_options: Optional ConnectOptions, for the Connect transport
+        **options: use_plaintext, verify_ssl, scheduler, retry_policy and
+            retry_budget of the client
+
+    Returns:
+        A KASConnectRPCClient or KASGrpcClient
+
+    Raises:
+        ValueError: If the transport is unknown
+
+    """
+    try:
+        transport = KASTransport(transport)
+    except ValueError:
+        raise ValueError(f"Unsupported KAS transport: {transport}") from None
+    if transport is KASTransport.GRPC:
+        from .kas_grpc_client import KASGrpcClient
+
+        return KASGrpcClient(channel_pool=channel_pool, **options)
+    return KASConnectRPCClient(options=connect_options, **options)
 
 
 @dataclass
@@ -39,6 +85,14 @@ class KASClient:
         use_plaintext=False,
         verify_ssl=True,
         kas_allowlist=None,
+        single_flight=None,
+        scheduler=None,
+        retry_policy=None,
+        retry_budget=None,
+        transport=KASTransport.CONNECT,
+        channel_pool=None,
+        connect_options=None,
+        rpc_client=None,
     ):
         """Initialize KAS client.
 
@@ -50,20 +104,48 @@ class KASClient:
             verify_ssl: Whether to verify SSL certificates
             kas_allowlist: Optional KASAllowlist for URL validation. If provided,
                 only URLs in the allowlist will be contacted.
+            single_flight: Optional SingleFlight shared with other KAS clients,
+                so that concurrent identical public key and rewrap requests
+                are sent only once
+            scheduler: Optional KASScheduler shared with other KAS clients,
+                limiting the concurrent requests to each KAS
+            retry_policy: Optional RetryPolicy with the timeout and retries of
+                each KAS request
+            retry_budget: Optional RetryBudget shared with other KAS clients
+            transport: KASTransport (or its value) to talk to KAS with
+            channel_pool: Optional GrpcChannelPool shared with other KAS
+                clients, for the gRPC transport
+            connect_options: Optional ConnectOptions with the codec and
+                compression of the Connect transport
+            rpc_client: Optional RPC client (see :func:`create_rpc_client`)
+                shared with other KAS clients, which replaces the one built
+                from the transport options; it is not closed with this client
+
+        Raises:
+            ValueError: If the transport is unknown
 
         """
         self.kas_url = kas_url
         self.token_source = token_source
         self.cache = cache or KASKeyCache()
+        self.single_flight = single_flight or SingleFlight()
         self.use_plaintext = use_plaintext
         self.verify_ssl = verify_ssl
         self.kas_allowlist = kas_allowlist
         self.decryptor = None
         self.client_public_key = None
 
-        # Initialize Connect RPC client for protobuf interactions
-        self.connect_rpc_client = KASConnectRPCClient(
-            use_plaintext=use_plaintext, verify_ssl=verify_ssl
+        # RPC client for protobuf interactions, possibly shared
+        self._owns_rpc_client = rpc_client is None
+        self.connect_rpc_client = rpc_client or create_rpc_client(
+            transport,
+            use_plaintext=use_plaintext,
+            verify_ssl=verify_ssl,
+            scheduler=scheduler,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            channel_pool=channel_pool,
+            connect_options=connect_options,
         )
 
         # Generate DPoP key for JWT signing (separate from encryption keys)
@@ -93,7 +175,7 @@ class KASClient:
         to properly clean up resources. It's also called automatically
         when using the client as a context manager.
         """
-        if self.connect_rpc_client:
+        if self.connect_rpc_client and self._owns_rpc_client:
             self.connect_rpc_client.close()
 
     def _normalize_kas_url(self, url: str) -> str:
@@ -481,7 +563,17 @@ class KASClient:
                 if cached_info:
                     return cached_info
 
-            result = self._get_public_key_with_connect_rpc(kas_info)
+            # Concurrent requests for an uncached key share one RPC
+            result = self.single_flight.do(
+                ("public_key", kas_info.url, getattr(kas_info, "algorithm", None)),
+                lambda: self._get_public_key_with_connect_rpc(kas_info),
+            )
+            if result is not None and result is not kas_info:
+                # Every caller gets the key on its own KASInfo, not the
+                # object of the caller whose RPC was shared
+                kas_info.public_key = result.public_key
+                kas_info.kid = result.kid
+                result = kas_info
 
             # Cache the result if cache is available
             if self.cache and result:
@@ -676,6 +768,35 @@ class KASClient:
         if session_key_type is None:
             session_key_type = RSA_KEY_TYPE
 
+        # Concurrent rewraps of the same key access object share one RPC
+        return self.single_flight.do(
+            self._rewrap_flight_key(key_access, session_key_type),
+            lambda: self._rewrap(key_access, policy_json, session_key_type),
+        )
+
+    def _rewrap_flight_key(self, key_access, session_key_type):
+        """Identify equivalent rewrap requests: same KAS, wrapped key and binding."""
+        binding = getattr(key_access, "policyBinding", None) or getattr(
+            key_access, "policy_binding", None
+        )
+        if isinstance(binding, dict):
+            binding = binding.get("hash")
+        else:
+            binding = getattr(binding, "hash", binding)
+        wrapped_key = getattr(key_access, "wrappedKey", None) or getattr(
+            key_access, "wrapped_key", None
+        )
+        return (
+            "rewrap",
+            key_access.url,
+            wrapped_key,
+            binding,
+            getattr(key_access, "header", None),
+            str(session_key_type),
+        )
+
+    def _rewrap(self, key_access, policy_json, session_key_type) -> bytes:
+        """Rewrap a key access object for this client's session key."""
         # Ensure we have an ephemeral client keypair for encryption (separate from DPoP keys)
         session_key_type = self._normalize_session_key_type(session_key_type)
         self._ensure_client_keypair(session_key_type)
@@ -4,35 +4,109 @@ This class encapsulates all interactions with otdf_python_proto.
 """
 
 import logging
+import threading
 
 import pyqwest
+from connectrpc.code import Code
+from connectrpc.errors import ConnectError
 from otdf_python_proto.kas import kas_pb2
 from otdf_python_proto.kas.kas_connect import AccessServiceClientSync
 
 from otdf_python.auth_headers import AuthHeaders
 
-from .sdk_exceptions import SDKException
+from .connect_options import ConnectOptions
+from .retry import RetryBudget, RetryPolicy, call_timeout, call_with_retry
+from .sdk_exceptions import (
+    DeadlineExceededException,
+    KASOverloadedException,
+    SDKException,
+)
+
+# Connect error codes of failures that are worth retrying
+_RETRYABLE_CODES = frozenset(
+    {Code.UNAVAILABLE, Code.RESOURCE_EXHAUSTED, Code.ABORTED, Code.DEADLINE_EXCEEDED}
+)
+
+
+def _is_retryable(error: Exception) -> bool:
+    return isinstance(error, ConnectError) and error.code in _RETRYABLE_CODES
+
+
+def _timeout_ms(timeout: float | None) -> int | None:
+    return None if timeout is None else max(1, int(timeout * 1000))
+
+
+def entity_wrapped_key_of(response):
+    """Return the entity wrapped key of a rewrap response.
+
+    Args:
+        response: kas_pb2.RewrapResponse
+
+    Raises:
+        SDKException: If the response carries an error or no key
+
+    """
+    # The v2 response has responses[] array with results[] for each policy
+    if response.responses and len(response.responses) > 0:
+        policy_result = response.responses[0]  # First policy
+        if policy_result.results and len(policy_result.results) > 0:
+            kao_result = policy_result.results[0]  # First KAO result
+            if kao_result.kas_wrapped_key:
+                return kao_result.kas_wrapped_key
+            raise SDKException(f"KAO result error: {kao_result.error}")
+        raise SDKException("No KAO results in policy response")
+    # Fallback to legacy entity_wrapped_key field for backward compatibility
+    if not response.entity_wrapped_key:
+        raise SDKException("No entity_wrapped_key in rewrap response")
+    return response.entity_wrapped_key
 
 
 class KASConnectRPCClient:
     """Handles Connect RPC communication with KAS service using otdf_python_proto."""
 
-    def __init__(self, use_plaintext=False, verify_ssl=True):
+    # Whether a failed RPC is worth retrying
+    _retryable = staticmethod(_is_retryable)
+
+    def __init__(
+        self,
+        use_plaintext=False,
+        verify_ssl=True,
+        scheduler=None,
+        retry_policy=None,
+        retry_budget=None,
+        options=None,
+    ):
         """Initialize the Connect RPC client.
 
         Args:
             use_plaintext: Whether to use plaintext (HTTP) connections
             verify_ssl: Whether to verify SSL certificates
+            scheduler: Optional KASScheduler admitting the RPCs, shared with
+                other clients
+            retry_policy: RetryPolicy with the timeout and retries of each
+                RPC; defaults to RetryPolicy()
+            retry_budget: Optional RetryBudget shared with other clients
+            options: ConnectOptions with the codec and compression of the
+                RPCs; defaults to ConnectOptions()
 
         """
         self.use_plaintext = use_plaintext
         self.verify_ssl = verify_ssl
+        self.scheduler = scheduler
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.options = options or ConnectOptions()
         self._transport = None
         self._http_client = None
+        # Whether close() is taken care of, by a context manager or owner
+        self._managed = False
+        # Generated clients by base URL, reused across RPCs
+        self._clients = {}
+        self._clients_lock = threading.Lock()
 
     def __enter__(self):
-        """Enter context manager and create HTTP client."""
-        self._http_client = self._create_http_client()
+        """Enter context manager; the HTTP client is created on first use."""
+        self._managed = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -41,6 +115,8 @@ class KASConnectRPCClient:
 
     def close(self):
         """Close HTTP client and release resources."""
+        with self._clients_lock:
+            self._clients.clear()
         if self._transport is not None:
             self._transport.close()
             self._transport = None
@@ -77,14 +153,39 @@ class KASConnectRPCClient:
             pyqwest.SyncClient instance
 
         """
-        if self._http_client is None:
+        if self._http_client is None and not self._managed:
             logging.warning(
                 "KASConnectRPCClient is being used without a context manager. "
                 "Consider using 'with KASConnectRPCClient(...) as client:' to ensure proper resource cleanup."
             )
+        if self._http_client is None:
             self._http_client = self._create_http_client()
         return self._http_client
 
+    def _service_client(self, base_url):
+        """Return the AccessService client for a base URL, creating it once.
+
+        Clients, and the HTTP client under them, are created under a lock,
+        so one KASConnectRPCClient can be shared by threads.
+
+        Args:
+            base_url: Base URL of the Connect RPC service
+
+        Returns:
+            AccessServiceClientSync configured with the client's options
+
+        """
+        with self._clients_lock:
+            client = self._clients.get(base_url)
+            if client is None:
+                logging.info(f"Creating Connect RPC client for base URL: {base_url}")
+                client = self._clients[base_url] = AccessServiceClientSync(
+                    address=base_url,
+                    http_client=self._get_http_client(),
+                    **self.options.client_kwargs(),
+                )
+            return client
+
     def _prepare_connect_rpc_url(self, kas_url):
         """Prepare the base URL for Connect RPC client.
 
@@ -118,6 +219,34 @@ class KASConnectRPCClient:
             return auth_headers.to_dict()
         return None
 
+    def _call(self, kas_url, rpc):
+        """Make an RPC within the deadline, retrying transient failures.
+
+        Both KAS RPCs are idempotent: public key lookups are reads, and a
+        rewrap has no effect besides the KAS audit log. Every attempt goes
+        through the scheduler if there is one, and its timeout is taken from
+        what is left of the deadline once it is admitted.
+
+        Args:
+            kas_url: KAS endpoint of the RPC
+            rpc: Makes the RPC, given its timeout in milliseconds (or None)
+
+        """
+
+        def attempt(timeout):
+            if self.scheduler is None:
+                return rpc(_timeout_ms(timeout))
+            # Time spent queued for admission counts against the deadline
+            return self.scheduler.run(
+                kas_url,
+                lambda: rpc(_timeout_ms(call_timeout(self.retry_policy.timeout))),
+                overloaded=self._retryable,
+            )
+
+        return call_with_retry(
+            attempt, self.retry_policy, self.retry_budget, self._retryable
+        )
+
     def get_public_key(self, normalized_kas_url, kas_info, access_token=None):
         """Get KAS public key using Connect RPC.
 
@@ -138,16 +267,7 @@ class KASConnectRPCClient:
 
         try:
             connect_rpc_base_url = self._prepare_connect_rpc_url(normalized_kas_url)
-
-            logging.info(
-                f"Creating Connect RPC client for base URL: {connect_rpc_base_url}, "
-                f"for public key retrieval"
-            )
-
-            http_client = self._get_http_client()
-            client = AccessServiceClientSync(
-                address=connect_rpc_base_url, http_client=http_client
-            )
+            client = self._service_client(connect_rpc_base_url)
 
             # Create public key request
             algorithm = getattr(kas_info, "algorithm", "") or ""
@@ -161,7 +281,12 @@ class KASConnectRPCClient:
             headers = self._prepare_auth_headers(access_token)
 
             # Make the public key call with authentication headers
-            response = client.public_key(request, headers=headers)
+            response = self._call(
+                connect_rpc_base_url,
+                lambda timeout_ms: client.public_key(
+                    request, headers=headers, timeout_ms=timeout_ms
+                ),
+            )
 
             # Update kas_info with response
             kas_info.public_key = response.public_key
@@ -169,6 +294,8 @@ class KASConnectRPCClient:
 
             return kas_info
 
+        except (KASOverloadedException, DeadlineExceededException):
+            raise
         except Exception as e:
             import traceback
 
@@ -202,15 +329,7 @@ class KASConnectRPCClient:
 
         try:
             kas_service_url = self._prepare_connect_rpc_url(normalized_kas_url)
-
-            logging.info(
-                f"Creating Connect RPC client for base URL: {kas_service_url}, for unwrap"
-            )
-
-            http_client = self._get_http_client()
-            client = AccessServiceClientSync(
-                address=kas_service_url, http_client=http_client
-            )
+            client = self._service_client(kas_service_url)
 
             # Create rewrap request
             request = kas_pb2.RewrapRequest(
@@ -223,29 +342,20 @@ class KASConnectRPCClient:
             headers = self._prepare_auth_headers(access_token)
 
             # Make the rewrap call with authentication headers
-            response = client.rewrap(request, headers=headers)
-
-            # Extract the entity wrapped key from v2 response structure
-            # The v2 response has responses[] array with results[] for each policy
-            if response.responses and len(response.responses) > 0:
-                policy_result = response.responses[0]  # First policy
-                if policy_result.results and len(policy_result.results) > 0:
-                    kao_result = policy_result.results[0]  # First KAO result
-                    if kao_result.kas_wrapped_key:
-                        entity_wrapped_key = kao_result.kas_wrapped_key
-                    else:
-                        raise SDKException(f"KAO result error: {kao_result.error}")
-                else:
-                    raise SDKException("No KAO results in policy response")
-            else:
-                # Fallback to legacy entity_wrapped_key field for backward compatibility
-                entity_wrapped_key = response.entity_wrapped_key
-                if not entity_wrapped_key:
-                    raise SDKException("No entity_wrapped_key in Connect RPC response")
+            response = self._call(
+                kas_service_url,
+                lambda timeout_ms: client.rewrap(
+                    request, headers=headers, timeout_ms=timeout_ms
+                ),
+            )
+
+            entity_wrapped_key = entity_wrapped_key_of(response)
 
             logging.info("Connect RPC rewrap succeeded")
             return entity_wrapped_key
 
+        except (KASOverloadedException, DeadlineExceededException):
+            raise
         except Exception as e:
             logging.error(f"Connect RPC rewrap failed: {e}")
             raise SDKException(f"Connect RPC rewrap failed: {e}") from e
@@ -0,0 +1,184 @@
+"""KASGrpcClient: Handles gRPC communication with the Key Access Service (KAS).
+
+An alternative to :class:`~otdf_python.kas_connect_rpc_client.KASConnectRPCClient`
+for high-concurrency deployments: calls go through the generated
+``otdf_python_proto.legacy_grpc`` stubs over channels from a shared
+:class:`~otdf_python.grpc_channel_pool.GrpcChannelPool`, so concurrent
+requests to a KAS are multiplexed on one kept-alive HTTP/2 connection.
+"""
+
+import logging
+
+import grpc
+from otdf_python_proto.kas import kas_pb2
+from otdf_python_proto.legacy_grpc.kas.kas_pb2_grpc import AccessServiceStub
+
+from .grpc_channel_pool import GrpcChannelPool
+from .kas_connect_rpc_client import KASConnectRPCClient, entity_wrapped_key_of
+from .sdk_exceptions import (
+    DeadlineExceededException,
+    KASOverloadedException,
+    SDKException,
+)
+
+# gRPC status codes of failures that are worth retrying
+_RETRYABLE_CODES = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.ABORTED,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+    }
+)
+
+
+def _is_retryable(error: Exception) -> bool:
+    return isinstance(error, grpc.RpcError) and error.code() in _RETRYABLE_CODES
+
+
+class KASGrpcClient(KASConnectRPCClient):
+    """Handles gRPC communication with KAS service using otdf_python_proto."""
+
+    _retryable = staticmethod(_is_retryable)
+
+    def __init__(
+        self,
+        use_plaintext=False,
+        verify_ssl=True,
+        scheduler=None,
+        retry_policy=None,
+        retry_budget=None,
+        channel_pool=None,
+    ):
+        """Initialize the gRPC client.
+
+        Args:
+            use_plaintext: Whether to use plaintext (HTTP/2 without TLS)
+                connections
+            verify_ssl: Whether to verify SSL certificates
+            scheduler: Optional KASScheduler admitting the RPCs, shared with
+                other clients
+            retry_policy: RetryPolicy with the timeout and retries of each
+                RPC; defaults to RetryPolicy()
+            retry_budget: Optional RetryBudget shared with other clients
+            channel_pool: Optional GrpcChannelPool shared with other
+                clients; without one, the client keeps its own channels and
+                closes them in :meth:`close`
+
+        Raises:
+            ValueError: If verify_ssl=False is requested for TLS
+                connections, which gRPC does not support
+
+        """
+        if not verify_ssl and not use_plaintext:
+            raise ValueError(
+                "verify_ssl=False is not supported for gRPC over TLS; "
+                "configure the CA certificates of the channel pool instead"
+            )
+        super().__init__(
+            use_plaintext=use_plaintext,
+            verify_ssl=verify_ssl,
+            scheduler=scheduler,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+        )
+        self._owns_pool = channel_pool is None
+        self.channel_pool = GrpcChannelPool() if self._owns_pool else channel_pool
+
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+
+    def close(self):
+        """Close the channels, unless they are shared through a pool."""
+        if self._owns_pool:
+            self.channel_pool.close()
+
+    def _stub(self, kas_url):
+        return AccessServiceStub(self.channel_pool.channel(kas_url, self.use_plaintext))
+
+    def _prepare_metadata(self, access_token):
+        """Return the authentication headers as gRPC call metadata."""
+        headers = self._prepare_auth_headers(access_token) or {}
+        return [(name.lower(), value) for name, value in headers.items()]
+
+    @staticmethod
+    def _timeout(timeout_ms):
+        return None if timeout_ms is None else timeout_ms / 1000
+
+    def get_public_key(self, normalized_kas_url, kas_info, access_token=None):
+        """Get KAS public key using gRPC.
+
+        Args:
+            normalized_kas_url: The normalized KAS URL
+            kas_info: KAS information object with algorithm
+            access_token: Optional access token for authentication
+
+        Returns:
+            Updated kas_info with public_key and kid
+
+        """
+        try:
+            kas_service_url = self._prepare_connect_rpc_url(normalized_kas_url)
+            stub = self._stub(kas_service_url)
+
+            algorithm = getattr(kas_info, "algorithm", "") or ""
+            request = (
+                kas_pb2.PublicKeyRequest(algorithm=algorithm)
+                if algorithm
+                else kas_pb2.PublicKeyRequest()
+            )
+            metadata = self._prepare_metadata(access_token)
+
+            response = self._call(
+                kas_service_url,
+                lambda timeout_ms: stub.PublicKey(
+                    request, metadata=metadata, timeout=self._timeout(timeout_ms)
+                ),
+            )
+
+            kas_info.public_key = response.public_key
+            kas_info.kid = response.kid
+            return kas_info
+
+        except (KASOverloadedException, DeadlineExceededException):
+            raise
+        except Exception as e:
+            logging.error(f"gRPC public key request failed: {type(e).__name__}: {e}")
+            raise SDKException(f"gRPC public key request failed: {e}") from e
+
+    def unwrap_key(
+        self, normalized_kas_url, key_access, signed_token, access_token=None
+    ):
+        """Unwrap a key using gRPC.
+
+        Args:
+            normalized_kas_url: The normalized KAS URL
+            key_access: Key access information
+            signed_token: Signed JWT token for the request
+            access_token: Optional access token for authentication
+
+        Returns:
+            Unwrapped key bytes from the response
+
+        """
+        try:
+            kas_service_url = self._prepare_connect_rpc_url(normalized_kas_url)
+            stub = self._stub(kas_service_url)
+
+            request = kas_pb2.RewrapRequest(signed_request_token=signed_token)
+            metadata = self._prepare_metadata(access_token)
+
+            response = self._call(
+                kas_service_url,
+                lambda timeout_ms: stub.Rewrap(
+                    request, metadata=metadata, timeout=self._timeout(timeout_ms)
+                ),
+            )
+            return entity_wrapped_key_of(response)
+
+        except (KASOverloadedException, DeadlineExceededException):
+            raise
+        except Exception as e:
+            logging.error(f"gRPC rewrap failed: {e}")
+            raise SDKException(f"gRPC rewrap failed: {e}") from e
@@ -43,6 +43,16 @@ class KASKeyCache:
         with self._lock:
             self._cache[key] = value
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the cached entries, e.g. to warm a cache in another process."""
+        with self._lock:
+            return dict(self._cache)
+
+    def update(self, entries: dict[str, Any]) -> None:
+        """Add entries taken from :meth:`snapshot` of another cache."""
+        with self._lock:
+            self._cache.update(entries)
+
     def clear(self):
         """Clear the cache."""
         with self._lock:
@@ -0,0 +1,170 @@
+"""Per-endpoint KAS latency tracking and hedged requests.
+
+A TDF usually carries key access objects for several equivalent KAS
+endpoints. Rather than trying them one after another, :func:`hedged_call`
+sends the request to the historically fastest endpoint and, if it has not
+answered within that endpoint's p95 latency, sends it to the next one as
+well. The first success wins and the requests not yet started are dropped;
+a failure starts the next request immediately. Latencies are recorded in a
+:class:`KASLatencyTracker`, which is shared by the KAS clients of an SDK.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class KASLatencyTracker:
+    """Thread-safe record of recent request latencies per KAS endpoint."""
+
+    def __init__(
+        self,
+        window: int = 100,
+        min_samples: int = 5,
+        default_delay: float = 0.5,
+        min_delay: float = 0.01,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            window: Number of recent latencies kept per endpoint
+            min_samples: Latencies needed before an endpoint's p95 is used
+                as its hedge delay
+            default_delay: Hedge delay, in seconds, for endpoints with too
+                few samples
+            min_delay: Lower bound of the hedge delay, in seconds
+
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self._latencies: dict[str, deque[float]] = {}
+        self._failures: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, url: str, seconds: float) -> None:
+        """Record the latency of a successful request."""
+        with self._lock:
+            samples = self._latencies.get(url)
+            if samples is None:
+                samples = self._latencies[url] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._failures[url] = 0
+
+    def record_failure(self, url: str) -> None:
+        """Record a failed request; endpoints failing in a row rank last."""
+        with self._lock:
+            self._failures[url] = self._failures.get(url, 0) + 1
+
+    def percentile(self, url: str, fraction: float) -> float | None:
+        """Return a latency percentile of an endpoint, or None without samples."""
+        with self._lock:
+            samples = sorted(self._latencies.get(url, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def hedge_delay(self, url: str) -> float:
+        """Return how long to wait for an endpoint before hedging."""
+        with self._lock:
+            count = len(self._latencies.get(url, ()))
+        if count < self.min_samples:
+            return self.default_delay
+        return max(self.min_delay, self.percentile(url, 0.95))
+
+    def rank(self, urls: Sequence[str]) -> list[str]:
+        """Order endpoints fastest first.
+
+        Endpoints are ordered by consecutive failures, then by median
+        latency; endpoints without samples come after those with samples,
+        and ties keep their given order.
+        """
+        with self._lock:
+            failures = {url: self._failures.get(url, 0) for url in urls}
+        medians = {url: self.percentile(url, 0.5) for url in urls}
+        return sorted(
+            urls,
+            key=lambda url: (
+                failures[url],
+                medians[url] is None,
+                medians[url] or 0.0,
+            ),
+        )
+
+
+def hedged_call(
+    calls: Sequence[tuple[str, Callable[[], T]]], tracker: KASLatencyTracker
+) -> T:
+    """Run equivalent requests against several endpoints, hedging slow ones.
+
+    Args:
+        calls: ``(endpoint URL, request)`` pairs; every request must yield
+            the same result
+        tracker: Latency history used to order the endpoints and to pick the
+            hedge delays; updated with the outcome of every request
+
+    Returns:
+        The result of the first request to succeed
+
+    Raises:
+        ValueError: If no calls are given
+        Exception: The error of the last request, if every request fails
+
+    """
+    if not calls:
+        raise ValueError("No endpoints to call")
+    order = tracker.rank([url for url, _call in calls])
+    # Requests for the same endpoint keep their given order
+    pending_calls = sorted(calls, key=lambda c: order.index(c[0]))
+
+    def timed(url: str, call: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception:
+            tracker.record_failure(url)
+            raise
+        tracker.record(url, time.perf_counter() - started)
+        return result
+
+    if len(pending_calls) == 1:
+        url, call = pending_calls[0]
+        return timed(url, call)
+
+    executor = ThreadPoolExecutor(max_workers=len(pending_calls))
+    in_flight: dict[Future, str] = {}
+    last_error: Exception | None = None
+    try:
+        while pending_calls or in_flight:
+            delay = None
+            if pending_calls:
+                url, call = pending_calls.pop(0)
+                # Requests keep the caller's context, e.g. its KAS lane
+                context = contextvars.copy_context()
+                in_flight[executor.submit(context.run, timed, url, call)] = url
+                if pending_calls:
+                    delay = tracker.hedge_delay(url)
+            # On timeout the next endpoint is hedged; after a failure it is
+            # started right away
+            done, _not_done = wait(
+                in_flight, timeout=delay, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                url = in_flight.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    logging.warning(f"Request to KAS {url} failed: {e}")
+                    last_error = e
+    finally:
+        # Losing requests finish in the background and only update the tracker
+        executor.shutdown(wait=False, cancel_futures=True)
+    raise last_error
@@ -0,0 +1,327 @@
+"""Adaptive concurrency limits and priority lanes for KAS requests.
+
+A :class:`KASScheduler` sits in front of the Connect RPC calls to KAS. Per
+KAS endpoint it admits at most ``limit`` requests at a time, where the limit
+adapts to the endpoint (:class:`AIMDLimit`): it grows by one per limit's
+worth of successful requests, and shrinks multiplicatively on errors or when
+latency climbs well above the endpoint's unloaded latency.
+
+Requests wait in one of two lanes. Interactive requests are admitted before
+batch requests, and batch requests only ever use part of the limit, so bulk
+jobs sharing a process cannot starve interactive ones. Queues are bounded;
+a request arriving at a full queue is shed with
+:class:`~otdf_python.sdk_exceptions.KASOverloadedException` instead of
+queueing without bound, and a queued request gives up when its deadline
+(see :mod:`otdf_python.retry`) passes. Requests use the lane set with
+:func:`kas_lane`, interactive by default.
+"""
+
+import contextlib
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from otdf_python.retry import remaining_time
+from otdf_python.sdk_exceptions import (
+    DeadlineExceededException,
+    KASOverloadedException,
+)
+
+
+class KASLane(Enum):
+    """Priority lane of a KAS request."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+_lane: contextvars.ContextVar[KASLane] = contextvars.ContextVar(
+    "kas_lane", default=KASLane.INTERACTIVE
+)
+
+
+@contextlib.contextmanager
+def kas_lane(lane: KASLane) -> Iterator[None]:
+    """Send the KAS requests made within the block through ``lane``."""
+    token = _lane.set(lane)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+def current_lane() -> KASLane:
+    """Return the lane KAS requests are currently sent through."""
+    return _lane.get()
+
+
+class AIMDLimit:
+    """Additive-increase, multiplicative-decrease concurrency limit."""
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 64,
+        backoff: float = 0.9,
+        tolerance: float = 2.0,
+    ):
+        """Initialize the limit.
+
+        Args:
+            initial: Starting limit
+            minimum: The limit never drops below this
+            maximum: The limit never grows above this
+            backoff: Factor applied to the limit on errors or latency growth
+            tolerance: Latency, as a multiple of the unloaded latency, above
+                which the endpoint is considered overloaded
+
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        # Latency of the endpoint when it is not loaded; tracks the minimum,
+        # drifting up slowly in case the endpoint got slower for good
+        self.baseline: float | None = None
+
+    def update(self, latency: float, in_flight: int, failed: bool) -> None:
+        """Adjust the limit after a request.
+
+        Args:
+            latency: Service time of the request, in seconds
+            in_flight: Requests still in flight when it finished
+            failed: Whether the request failed
+
+        """
+        overloaded = (
+            self.baseline is not None and latency > self.tolerance * self.baseline
+        )
+        if failed or overloaded:
+            self.limit = max(self.minimum, self.limit * self.backoff)
+        elif in_flight + 1 >= int(self.limit) // 2:
+            # Only grow a limit that is actually being used
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+        if not failed:
+            if self.baseline is None or latency < self.baseline:
+                self.baseline = latency
+            else:
+                self.baseline += (latency - self.baseline) * 0.01
+
+
+@dataclass
+class LaneStats:
+    """Counters of one lane of one KAS endpoint."""
+
+    admitted: int = 0
+    shed: int = 0
+    errors: int = 0
+    # Seconds spent waiting for admission, summed over admitted requests
+    queue_time: float = 0.0
+    # Seconds spent in the request itself, summed over finished requests
+    service_time: float = 0.0
+    finished: int = 0
+
+    @property
+    def mean_queue_time(self) -> float:
+        """Mean seconds an admitted request waited."""
+        return self.queue_time / self.admitted if self.admitted else 0.0
+
+    @property
+    def mean_service_time(self) -> float:
+        """Mean seconds a finished request took."""
+        return self.service_time / self.finished if self.finished else 0.0
+
+
+@dataclass
+class EndpointStats:
+    """Snapshot of the scheduling state of one KAS endpoint."""
+
+    limit: float
+    in_flight: int
+    queued: dict[KASLane, int]
+    lanes: dict[KASLane, LaneStats]
+
+
+@dataclass
+class _Endpoint:
+    limit: AIMDLimit
+    in_flight: int = 0
+    queues: dict[KASLane, deque[threading.Event]] = field(
+        default_factory=lambda: {lane: deque() for lane in KASLane}
+    )
+    stats: dict[KASLane, LaneStats] = field(
+        default_factory=lambda: {lane: LaneStats() for lane in KASLane}
+    )
+
+
+class KASScheduler:
+    """Admission control for KAS requests, per endpoint and lane."""
+
+    def __init__(
+        self,
+        limit_factory: Callable[[], AIMDLimit] = AIMDLimit,
+        batch_share: float = 0.75,
+        max_queued: dict[KASLane, int] | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            limit_factory: Creates the concurrency limit of a new endpoint
+            batch_share: Fraction of an endpoint's limit that batch requests
+                may use; at least one batch request is always admitted
+            max_queued: Queue bound per lane; requests beyond it are shed
+
+        """
+        self.limit_factory = limit_factory
+        self.batch_share = batch_share
+        self.max_queued = max_queued or {
+            KASLane.INTERACTIVE: 256,
+            KASLane.BATCH: 1024,
+        }
+        self._endpoints: dict[str, _Endpoint] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Pickle the configuration only; worker processes start afresh."""
+        return {
+            "limit_factory": self.limit_factory,
+            "batch_share": self.batch_share,
+            "max_queued": self.max_queued,
+        }
+
+    def __setstate__(self, state: dict):
+        """Restore the configuration with no endpoint state."""
+        self.__init__(**state)
+
+    def run(
+        self,
+        endpoint: str,
+        fn: Callable[[], Any],
+        lane: KASLane | None = None,
+        overloaded: Callable[[Exception], bool] | None = None,
+    ) -> Any:
+        """Call ``fn`` once ``endpoint`` has capacity for it.
+
+        Args:
+            endpoint: KAS endpoint the request goes to
+            fn: The request
+            lane: Lane to queue in, :func:`current_lane` by default
+            overloaded: Whether an error raised by ``fn`` is a transport,
+                timeout or overload error, which shrinks the limit; other
+                errors, such as a denied request, leave it unchanged. By
+                default every error shrinks the limit
+
+        Returns:
+            The result of ``fn``
+
+        Raises:
+            KASOverloadedException: If the lane's queue is full
+            DeadlineExceededException: If the deadline passes while queued
+
+        """
+        lane = lane or current_lane()
+        queued_at = time.perf_counter()
+        state = self._acquire(endpoint, lane)
+        started = time.perf_counter()
+        with self._lock:
+            stats = state.stats[lane]
+            stats.admitted += 1
+            stats.queue_time += started - queued_at
+        try:
+            result = fn()
+        except BaseException as e:
+            failed = overloaded is None or not isinstance(e, Exception) or overloaded(e)
+            self._release(
+                state, lane, time.perf_counter() - started, failed, error=True
+            )
+            raise
+        self._release(state, lane, time.perf_counter() - started, failed=False)
+        return result
+
+    def stats(self, endpoint: str) -> EndpointStats | None:
+        """Return a snapshot of an endpoint's state, if it has seen requests."""
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            if state is None:
+                return None
+            return EndpointStats(
+                limit=state.limit.limit,
+                in_flight=state.in_flight,
+                queued={lane: len(queue) for lane, queue in state.queues.items()},
+                lanes={
+                    lane: LaneStats(**vars(stats))
+                    for lane, stats in state.stats.items()
+                },
+            )
+
+    def endpoints(self) -> list[str]:
+        """Return the endpoints that have seen requests."""
+        with self._lock:
+            return list(self._endpoints)
+
+    def _capacity(self, state: _Endpoint, lane: KASLane) -> int:
+        limit = int(state.limit.limit)
+        if lane is KASLane.BATCH:
+            return max(1, int(limit * self.batch_share))
+        return limit
+
+    def _acquire(self, endpoint: str, lane: KASLane) -> _Endpoint:
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            if state is None:
+                state = self._endpoints[endpoint] = _Endpoint(self.limit_factory())
+            # Queued requests of this lane, or interactive ones, go first
+            ahead = state.queues[KASLane.INTERACTIVE] or state.queues[lane]
+            if not ahead and state.in_flight < self._capacity(state, lane):
+                state.in_flight += 1
+                return state
+            if len(state.queues[lane]) >= self.max_queued[lane]:
+                state.stats[lane].shed += 1
+                raise KASOverloadedException(
+                    f"KAS {endpoint} is overloaded: {lane.value} queue is full"
+                )
+            admitted = threading.Event()
+            state.queues[lane].append(admitted)
+        # The releasing request hands its slot over before setting the event
+        if not admitted.wait(remaining_time()):
+            with self._lock:
+                if not admitted.is_set():
+                    state.queues[lane].remove(admitted)
+                    raise DeadlineExceededException(
+                        f"Deadline exceeded waiting for KAS {endpoint}"
+                    )
+        return state
+
+    def _release(
+        self,
+        state: _Endpoint,
+        lane: KASLane,
+        latency: float,
+        failed: bool,
+        error: bool = False,
+    ) -> None:
+        with self._lock:
+            state.in_flight -= 1
+            stats = state.stats[lane]
+            stats.finished += 1
+            stats.service_time += latency
+            stats.errors += error
+            # Errors that say nothing about the endpoint's load, such as a
+            # denied request, leave the limit as it is
+            if failed or not error:
+                state.limit.update(latency, state.in_flight, failed)
+            for next_lane in KASLane:
+                queue = state.queues[next_lane]
+                while queue and state.in_flight < self._capacity(state, next_lane):
+                    state.in_flight += 1
+                    queue.popleft().set()
+                if queue:
+                    # Batch requests never overtake waiting interactive ones
+                    break
@@ -1,6 +1,7 @@
 """TDF manifest representation and serialization."""
 
 import json
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass, field
 from typing import Any
 
@@ -24,13 +25,18 @@ class ManifestRootSignature:
 
 @dataclass
 class ManifestIntegrityInformation:
-    """Manifest integrity information with signatures and hashes."""
+    """Manifest integrity information with signatures and hashes.
+
+    When loaded from JSON, ``segments`` is a compact ``SegmentTable`` that
+    yields ``ManifestSegment`` objects on demand. Its segment hashes are only
+    decoded once the table is first used.
+    """
 
     rootSignature: ManifestRootSignature
     segmentHashAlg: str
     segmentSizeDefault: int
     encryptedSegmentSizeDefault: int
-    segments: list[ManifestSegment]
+    segments: Sequence[ManifestSegment]
 
 
 @dataclass
@@ -64,6 +70,8 @@ class ManifestMethod:
     algorithm: str
     iv: str
     isStreamable: bool | None = None
+    # Per-segment compression applied before encryption (SDK extension)
+    compression: str | None = None
 
 
 @dataclass
@@ -107,6 +115,14 @@ class ManifestAssertion:
     statement: Any
     binding: ManifestBinding | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the assertion as manifest JSON, using the spec field names."""
+        d = asdict(self)
+        d["appliesTo"] = d.pop("appliesTo_state")
+        # Keep the binding last, as written by other SDKs
+        d["binding"] = d.pop("binding")
+        return d
+
 
 @dataclass
 class Manifest:
@@ -154,42 +170,46 @@ class Manifest:
 
         if self.assertions and len(self.assertions) > 0:
             manifest_dict["assertions"] = [
-                asdict(assertion) for assertion in self.assertions
+                assertion.to_dict() for assertion in self.assertions
             ]
 
         cleaned_dict = self._remove_none_values_and_empty_lists(manifest_dict)
-        return json.dumps(cleaned_dict, default=str)
+        return json.dumps(cleaned_dict, default=_json_default)
 
     @staticmethod
     def from_json(data: str) -> "Manifest":
         d = json.loads(data)
 
         # Recursively instantiate nested dataclasses
+        from otdf_python.segment_table import SegmentTable
+
         def _payload(p):
             return ManifestPayload(**p) if p else None
 
-        def _segment(s):
-            return ManifestSegment(**s)
-
         def _root_sig(rs):
             return ManifestRootSignature(**rs)
 
         def _integrity(i):
             # Handle both snake_case and camelCase fields
             # TODO: This can probably be simplified to only camelCase
+            segment_size_default = i.get(
+                "segmentSizeDefault", i.get("segment_size_default")
+            )
             return ManifestIntegrityInformation(
                 rootSignature=_root_sig(
                     i.get("rootSignature", i.get("root_signature"))
                 ),
                 segmentHashAlg=i.get("segmentHashAlg", i.get("segment_hash_alg")),
-                segmentSizeDefault=i.get(
-                    "segmentSizeDefault", i.get("segment_size_default")
-                ),
+                segmentSizeDefault=segment_size_default,
                 encryptedSegmentSizeDefault=i.get(
                     "encryptedSegmentSizeDefault",
                     i.get("encrypted_segment_size_default"),
                 ),
-                segments=[_segment(s) for s in i["segments"]],
+                # Segments go straight into the array-backed table when first
+                # used, no per-segment dataclass instances are allocated here
+                segments=SegmentTable.from_json_list(
+                    i["segments"], segment_size_default
+                ),
             )
 
         def _method(m):
@@ -222,7 +242,9 @@ class Manifest:
                 id=a["id"],
                 type=a["type"],
                 scope=a["scope"],
-                appliesTo_state=a.get("appliesTo_state", a.get("applies_to_state")),
+                appliesTo_state=a.get(
+                    "appliesTo", a.get("appliesTo_state", a.get("applies_to_state"))
+                ),
                 statement=a["statement"],
                 binding=_binding(a.get("binding")),
             )
@@ -237,3 +259,11 @@ class Manifest:
             payload=_payload(d["payload"]) if d.get("payload") else None,
             assertions=[_assertion(a) for a in d.get("assertions", [])],
         )
+
+
+def _json_default(obj):
+    """Serialize values that the json module does not handle natively."""
+    to_json_list = getattr(obj, "to_json_list", None)
+    if to_json_list is not None:
+        return to_json_list()
+    return str(obj)
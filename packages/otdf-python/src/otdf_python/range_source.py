@@ -0,0 +1,291 @@
+"""Random-access byte sources for reading TDFs by byte range.
+
+A ``RangeSource`` lets the TDF reader fetch only the ZIP central directory,
+the manifest and the encrypted segments it needs, instead of downloading the
+whole object first. Local files, in-memory buffers and memory-mapped files are
+provided; object stores can be supported by implementing ``read_range``.
+"""
+
+import io
+import mmap
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+
+class RangeSource(ABC):
+    """A random-access source of bytes, such as a file or an object store."""
+
+    @abstractmethod
+    def size(self) -> int:
+        """Return the total size of the source in bytes."""
+
+    @abstractmethod
+    def read_range(self, offset: int, length: int) -> bytes | memoryview:
+        """Read ``length`` bytes starting at ``offset``.
+
+        Implementations must be safe to call from several threads at once and
+        may return fewer bytes only when the range extends past the end.
+        """
+
+    def close(self):  # noqa: B027 - optional hook, most sources hold nothing
+        """Release resources held by the source."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class BytesRangeSource(RangeSource):
+    """Range source over an in-memory buffer, returning zero-copy slices."""
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        """Initialize with any bytes-like object."""
+        self._view = memoryview(data)
+
+    def size(self) -> int:
+        return len(self._view)
+
+    def read_range(self, offset: int, length: int) -> memoryview:
+        return self._view[offset : offset + length]
+
+    def close(self):
+        self._view.release()
+
+
+class FileRangeSource(RangeSource):
+    """Range source over a local file, using positional reads."""
+
+    def __init__(self, path: str | os.PathLike):
+        """Open the file at ``path`` for reading."""
+        self._file = Path(path).open("rb")  # noqa: SIM115
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._lock = threading.Lock()
+
+    def size(self) -> int:
+        return self._size
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        if hasattr(os, "pread"):
+            return os.pread(self._file.fileno(), length, offset)
+        # Platforms without pread share the file position, so serialize access
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def close(self):
+        self._file.close()
+
+
+class StreamRangeSource(RangeSource):
+    """Range source over a seekable binary file object."""
+
+    def __init__(self, stream: BinaryIO):
+        """Wrap ``stream``; it is not closed by the source."""
+        self._stream = stream
+        self._size = stream.seek(0, io.SEEK_END)
+        self._lock = threading.Lock()
+
+    def size(self) -> int:
+        return self._size
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        with self._lock:
+            self._stream.seek(offset)
+            return self._stream.read(length)
+
+
+class MmapRangeSource(RangeSource):
+    """Range source over a memory-mapped local file.
+
+    Ranges are returned as ``memoryview`` slices of the mapping, so reading
+    never copies and the OS page cache handles the I/O. Callers must release
+    the returned views before closing the source.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Map the file at ``path`` read-only."""
+        with Path(path).open("rb") as f:
+            self._size = os.fstat(f.fileno()).st_size
+            # mmap cannot map empty files
+            self._mmap = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if self._size
+                else None
+            )
+        self._view = memoryview(self._mmap) if self._mmap else memoryview(b"")
+
+    def size(self) -> int:
+        return self._size
+
+    def read_range(self, offset: int, length: int) -> memoryview:
+        return self._view[offset : offset + length]
+
+    def close(self):
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+
+def as_range_source(
+    source: RangeSource | bytes | BinaryIO | str | os.PathLike,
+) -> tuple[RangeSource, bool]:
+    """Return a RangeSource for bytes, a path or a seekable file object.
+
+    Returns:
+        The range source, and whether it was opened here and should be
+        closed by the caller
+
+    """
+    if isinstance(source, RangeSource):
+        return source, False
+    if isinstance(source, bytes | bytearray | memoryview):
+        return BytesRangeSource(source), True
+    if isinstance(source, str | os.PathLike):
+        return FileRangeSource(source), True
+    return StreamRangeSource(source), True
+
+
+class RangeSourceFile(io.RawIOBase):
+    """Seekable read-only file object backed by a RangeSource.
+
+    Allows ``zipfile`` to locate the end-of-central-directory record, the
+    central directory and individual entries with one range read each.
+    """
+
+    def __init__(self, source: RangeSource):
+        """Wrap a range source."""
+        self._source = source
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self._source.size() + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if self._position < 0:
+            raise ValueError("negative seek position")
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), max(self._source.size() - self._position, 0))
+        if length == 0:
+            return 0
+        data = self._source.read_range(self._position, length)
+        n = len(data)
+        memoryview(buffer)[:n] = data
+        self._position += n
+        return n
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = max(self._source.size() - self._position, 0)
+        data = bytes(self._source.read_range(self._position, size)) if size else b""
+        self._position += len(data)
+        return data
+
+
+class SegmentPrefetcher:
+    """Fetch a sequence of byte ranges in order, with parallel read-ahead.
+
+    Adjacent ranges are coalesced into single requests of up to
+    ``coalesce_bytes``, and up to ``read_ahead`` requests are kept in flight
+    on a thread pool while the consumer processes earlier ranges. With
+    ``read_ahead=0`` every range is read synchronously on the calling thread.
+    """
+
+    def __init__(
+        self,
+        source: RangeSource,
+        ranges: Sequence[tuple[int, int]],
+        read_ahead: int = 4,
+        coalesce_bytes: int = 8 * 1024 * 1024,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            source: The range source to read from
+            ranges: ``(start, end)`` byte ranges, in the order they are consumed
+            read_ahead: Maximum number of requests in flight
+            coalesce_bytes: Maximum size of a coalesced request
+
+        """
+        self._source = source
+        self._ranges = ranges
+        self._read_ahead = max(read_ahead, 0)
+        self._coalesce_bytes = coalesce_bytes
+
+    def _groups(self) -> Iterator[tuple[int, int, list[tuple[int, int]]]]:
+        """Group consecutive, contiguous ranges into coalesced requests."""
+        group: list[tuple[int, int]] = []
+        for start, end in self._ranges:
+            if group and (
+                start != group[-1][1] or end - group[0][0] > self._coalesce_bytes
+            ):
+                yield group[0][0], group[-1][1], group
+                group = []
+            group.append((start, end))
+        if group:
+            yield group[0][0], group[-1][1], group
+
+    def _fetch(self, start: int, end: int) -> bytes | memoryview:
+        data = self._source.read_range(start, end - start)
+        if len(data) != end - start:
+            raise ValueError(f"Short read for byte range {start}-{end}")
+        return data
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Yield each requested range as a memoryview, in order."""
+        if self._read_ahead == 0:
+            for start, end in self._ranges:
+                data = self._fetch(start, end)
+                yield data if isinstance(data, memoryview) else memoryview(data)
+            return
+
+        groups = self._groups()
+        pending: deque[tuple[Future, int, list[tuple[int, int]]]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self._read_ahead, thread_name_prefix="tdf-read-ahead"
+        ) as executor:
+            try:
+
+                def _fill():
+                    while len(pending) < self._read_ahead:
+                        group = next(groups, None)
+                        if group is None:
+                            return
+                        start, end, members = group
+                        pending.append(
+                            (executor.submit(self._fetch, start, end), start, members)
+                        )
+
+                _fill()
+                while pending:
+                    future, group_start, members = pending.popleft()
+                    data = memoryview(future.result())
+                    _fill()
+                    for start, end in members:
+                        yield data[start - group_start : end - group_start]
+            finally:
+                for future, _, _ in pending:
+                    future.cancel()
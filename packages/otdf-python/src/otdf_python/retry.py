@@ -0,0 +1,234 @@
+"""Deadlines, bounded retries and retry budgets for KAS and IdP calls.
+
+A deadline is a time budget for a whole operation, such as decrypting one
+TDF. It is set per context with :func:`deadline` and every RPC made within
+the block gets at most the remaining time as its timeout, so a slow KAS can
+no longer stall a caller indefinitely.
+
+Idempotent calls are retried with :func:`call_with_retry` (HTTP requests
+with :func:`http_request_with_retry`): at most
+``RetryPolicy.max_attempts`` times, with full-jitter exponential backoff, and
+never beyond the deadline. Retries also draw from a shared
+:class:`RetryBudget`, which allows retries only up to a fraction of the
+calls made, so an outage does not multiply the load on a struggling
+service.
+"""
+
+import contextlib
+import contextvars
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+import httpx2 as httpx
+
+from otdf_python.sdk_exceptions import DeadlineExceededException
+
+T = TypeVar("T")
+
+# HTTP statuses of IdP and discovery responses that are worth retrying
+_RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Give the operations within the block at most ``seconds`` in total.
+
+    Nested deadlines can only shorten the enclosing one.
+    """
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Return the seconds left until the current deadline, if there is one."""
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def call_timeout(default: float | None) -> float | None:
+    """Return the timeout of the next call: the default, capped by the deadline.
+
+    Raises:
+        DeadlineExceededException: If the deadline has passed
+
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return default
+    if remaining <= 0:
+        raise DeadlineExceededException("Deadline exceeded")
+    return remaining if default is None else min(default, remaining)
+
+
+@dataclass
+class RetryPolicy:
+    """How calls are timed out and retried."""
+
+    # Attempts per call, including the first one
+    max_attempts: int = 3
+    # Backoff before the first retry, in seconds; doubled for each retry
+    initial_backoff: float = 0.1
+    max_backoff: float = 2.0
+    multiplier: float = 2.0
+    # Timeout of a single attempt, in seconds; capped by the deadline
+    timeout: float | None = 30.0
+
+    def backoff(self, retry: int) -> float:
+        """Return a full-jitter backoff before retry number ``retry`` (from 0)."""
+        ceiling = min(self.max_backoff, self.initial_backoff * self.multiplier**retry)
+        return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of the calls made.
+
+    Every call deposits ``ratio`` tokens, up to ``max_tokens``; every retry
+    withdraws one. The bucket starts full, so isolated failures are always
+    retried.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        """Initialize a full budget.
+
+        Args:
+            ratio: Retries allowed per call in the long run
+            max_tokens: Retries allowed in a burst
+
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Pickle the configuration only; worker processes start full."""
+        return {"ratio": self.ratio, "max_tokens": self.max_tokens}
+
+    def __setstate__(self, state: dict):
+        """Restore the configuration with a full budget."""
+        self.__init__(**state)
+
+    def deposit(self) -> None:
+        """Credit a call."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a token for a retry; return False if the budget is spent."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        """Retries currently available."""
+        with self._lock:
+            return self._tokens
+
+
+def call_with_retry(
+    call: Callable[[float | None], T],
+    policy: RetryPolicy,
+    budget: RetryBudget | None,
+    retryable: Callable[[Exception], bool],
+) -> T:
+    """Make an idempotent call, retrying failures within the deadline.
+
+    Args:
+        call: Makes one attempt, given its timeout in seconds (None for no
+            timeout)
+        policy: Attempts, backoff and per-attempt timeout
+        budget: Shared retry budget, or None for no budget
+        retryable: Whether an error is transient and worth retrying
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        DeadlineExceededException: If the deadline passes before an attempt
+        Exception: The error of the last attempt
+
+    """
+    if budget is not None:
+        budget.deposit()
+    retry = 0
+    while True:
+        timeout = call_timeout(policy.timeout)
+        try:
+            return call(timeout)
+        except Exception as e:
+            pause = policy.backoff(retry)
+            remaining = remaining_time()
+            if (
+                retry + 1 >= policy.max_attempts
+                or not retryable(e)
+                or (remaining is not None and pause >= remaining)
+                or (budget is not None and not budget.withdraw())
+            ):
+                raise
+            time.sleep(pause)
+            retry += 1
+
+
+class _RetryableStatus(Exception):
+    """An HTTP response with a transient error status."""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+def _is_retryable_http(error: Exception) -> bool:
+    return isinstance(error, httpx.TransportError | _RetryableStatus)
+
+
+def http_request_with_retry(
+    method: Callable[..., httpx.Response],
+    url: str,
+    policy: RetryPolicy,
+    budget: RetryBudget | None,
+    **kwargs,
+) -> httpx.Response:
+    """Send an idempotent HTTP request with a timeout and retries.
+
+    Connection errors and transient error statuses (429, 502, 503 and 504)
+    are retried; the response of the last attempt is returned whatever its
+    status.
+
+    Args:
+        method: ``httpx.get`` or ``httpx.post``
+        url: Request URL
+        policy: Attempts, backoff and per-attempt timeout
+        budget: Shared retry budget, or None for no budget
+        **kwargs: Further arguments of the request
+
+    Returns:
+        The response
+
+    """
+
+    def attempt(timeout: float | None) -> httpx.Response:
+        response = method(url, timeout=timeout, **kwargs)
+        if response.status_code in _RETRYABLE_STATUSES:
+            raise _RetryableStatus(response)
+        return response
+
+    try:
+        return call_with_retry(attempt, policy, budget, _is_retryable_http)
+    except _RetryableStatus as e:
+        return e.response
@@ -1,13 +1,36 @@
 """The main SDK class for OpenTDF platform interaction."""
 
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Executor
 from contextlib import AbstractContextManager
-from io import BytesIO
-from typing import Any, BinaryIO
+from io import BufferedReader, BytesIO
+from os import PathLike
+from typing import TYPE_CHECKING, Any, BinaryIO
 
+from otdf_python import bulk
+from otdf_python.bulk import BulkItem, BulkResult
 from otdf_python.config import KASInfo, NanoTDFConfig, TDFConfig
+from otdf_python.detached_payload import PayloadStorage
+from otdf_python.distributed_encryption import EncryptionPlan, PartResult
+from otdf_python.manifest import Manifest
 from otdf_python.nanotdf import NanoTDF
+from otdf_python.range_source import RangeSource
 from otdf_python.sdk_exceptions import SDKException
-from otdf_python.tdf import TDF, TDFReader, TDFReaderConfig
+from otdf_python.tdf import (
+    TDF,
+    TDFInspection,
+    TDFReader,
+    TDFReaderConfig,
+    TDFSource,
+    TDFVerification,
+)
+
+if TYPE_CHECKING:
+    from otdf_python.grpc_channel_pool import GrpcChannelPool
+    from otdf_python.kas_key_cache import KASKeyCache
+    from otdf_python.kas_latency import KASLatencyTracker
+    from otdf_python.kas_scheduler import KASScheduler
+    from otdf_python.sdk_builder import SDKBuilder
 
 
 class KAS(AbstractContextManager):
@@ -39,6 +62,15 @@ class KAS(AbstractContextManager):
         sdk_ssl_verify=True,
         use_plaintext=False,
         kas_allowlist=None,
+        key_cache=None,
+        single_flight=None,
+        scheduler=None,
+        retry_policy=None,
+        retry_budget=None,
+        transport="connect",
+        channel_pool=None,
+        connect_options=None,
+        rpc_client=None,
     ):
         """Initialize the KAS client.
 
@@ -48,6 +80,21 @@ class KAS(AbstractContextManager):
             sdk_ssl_verify: Whether to verify SSL certificates
             use_plaintext: Whether to use plaintext HTTP connections instead of HTTPS
             kas_allowlist: Optional KASAllowlist for URL validation
+            key_cache: Optional KASKeyCache shared with other KAS clients
+            single_flight: Optional SingleFlight shared with other KAS
+                clients, coalescing concurrent identical requests
+            scheduler: Optional KASScheduler shared with other KAS clients,
+                limiting the concurrent requests to each KAS
+            retry_policy: Optional RetryPolicy with the timeout and retries
+                of each KAS request
+            retry_budget: Optional RetryBudget shared with other KAS clients
+            transport: KASTransport (or its value) to talk to KAS with
+            channel_pool: Optional GrpcChannelPool shared with other KAS
+                clients, for the gRPC transport
+            connect_options: Optional ConnectOptions with the codec and
+                compression of the Connect transport
+            rpc_client: Optional RPC client shared with other KAS clients,
+                replacing the one built from the transport options
 
         """
         from .kas_client import KASClient
@@ -58,6 +105,15 @@ class KAS(AbstractContextManager):
             verify_ssl=sdk_ssl_verify,
             use_plaintext=use_plaintext,
             kas_allowlist=kas_allowlist,
+            cache=key_cache,
+            single_flight=single_flight,
+            scheduler=scheduler,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            transport=transport,
+            channel_pool=channel_pool,
+            connect_options=connect_options,
+            rpc_client=rpc_client,
         )
         # Store the parameters for potential use
         self._sdk_ssl_verify = sdk_ssl_verify
@@ -223,6 +279,26 @@ class SDK(AbstractContextManager):
             """
             raise NotImplementedError
 
+        def kas_key_cache(self) -> "KASKeyCache | None":
+            """Return the KAS public key cache shared by the KAS clients, if any."""
+            return None
+
+        def kas_latency_tracker(self) -> "KASLatencyTracker | None":
+            """Return the KAS latency history used to hedge requests, if any."""
+            return None
+
+        def kas_scheduler(self) -> "KASScheduler | None":
+            """Return the scheduler admitting requests to each KAS, if any."""
+            return None
+
+        def grpc_channel_pool(self) -> "GrpcChannelPool | None":
+            """Return the gRPC channels shared by platform service clients, if any.
+
+            Stubs from ``otdf_python_proto.legacy_grpc`` can be created on
+            these channels to share connections with the KAS clients.
+            """
+            return None
+
         def close(self):
             """Close resources associated with the services."""
 
@@ -235,6 +311,7 @@ class SDK(AbstractContextManager):
         platform_url: str | None = None,
         ssl_verify: bool = True,
         use_plaintext: bool = False,
+        builder: "SDKBuilder | None" = None,
     ):
         """Initialize a new SDK instance.
 
@@ -243,9 +320,12 @@ class SDK(AbstractContextManager):
             platform_url: Optional platform base URL
             ssl_verify: Whether to verify SSL certificates (default: True)
             use_plaintext: Whether to use HTTP instead of HTTPS (default: False)
+            builder: The SDKBuilder that built this SDK, used to build
+                equivalent SDKs in worker processes
 
         """
         self.services = services
+        self.builder = builder
         self.platform_url = platform_url
         self.ssl_verify = ssl_verify
         self._use_plaintext = use_plaintext
@@ -291,16 +371,205 @@ class SDK(AbstractContextManager):
 
         return tdf.load_tdf(tdf_data, config)
 
+    def read_tdf_file(
+        self,
+        path: str | PathLike,
+        output_stream: BinaryIO,
+        config: TDFReaderConfig | None = None,
+    ) -> Manifest:
+        """Decrypt a TDF file on disk and write the payload to the output stream.
+
+        The file is memory-mapped and encrypted segments are decrypted
+        straight from the mapping, which keeps multi-GB TDFs out of memory.
+
+        Args:
+            path: Path to the TDF file
+            output_stream: The output stream to write the payload to
+            config: TDFReaderConfig dataclass
+
+        Returns:
+            Manifest: The manifest of the decrypted TDF
+
+        Raises:
+            SDKException: If there's an error reading the TDF
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+
+        return tdf.read_tdf_file(path, output_stream, config)
+
+    def read_tdf_stream(
+        self,
+        stream: BinaryIO,
+        output_stream: BinaryIO,
+        config: TDFReaderConfig | None = None,
+        spool_threshold: int = 64 * 1024 * 1024,
+    ) -> Manifest:
+        """Decrypt a TDF from a non-seekable stream such as a pipe or socket.
+
+        The encrypted payload is spooled, in memory up to
+        ``spool_threshold`` bytes and then to a temporary file, until the
+        manifest at the end of the stream arrives.
+
+        Args:
+            stream: Binary stream holding the TDF
+            output_stream: The output stream to write the payload to
+            config: TDFReaderConfig dataclass
+            spool_threshold: Payload bytes kept in memory before spilling to disk
+
+        Returns:
+            Manifest: The manifest of the decrypted TDF
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+        return tdf.read_tdf_stream(stream, output_stream, config, spool_threshold)
+
+    def read_tdf_source(
+        self,
+        source: RangeSource,
+        output_stream: BinaryIO,
+        config: TDFReaderConfig | None = None,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> Manifest:
+        """Decrypt a TDF from a range source, such as an object store.
+
+        Only the central directory, the manifest and the segments covering
+        the requested plaintext range are fetched, with parallel read-ahead
+        controlled by ``config.read_ahead``.
+
+        Args:
+            source: RangeSource holding the TDF
+            output_stream: The output stream to write the payload to
+            config: TDFReaderConfig dataclass
+            offset: Plaintext offset to start at
+            length: Number of plaintext bytes to decrypt, or None for the rest
+
+        Returns:
+            Manifest: The manifest of the decrypted TDF
+
+        Raises:
+            SDKException: If there's an error reading the TDF
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+
+        return tdf.read_tdf_source(source, output_stream, config, offset, length)
+
+    def open_tdf(
+        self,
+        source: TDFSource,
+        config: TDFReaderConfig | None = None,
+        cache_segments: int = 4,
+    ) -> BufferedReader:
+        """Open a TDF as a seekable binary file object of its plaintext.
+
+        Supports ``read``, ``readinto``, ``seek`` and ``tell``; segments are
+        decrypted on demand, so random-access consumers such as ``zipfile``,
+        ``tarfile`` or pyarrow can read large TDFs with bounded memory.
+
+        Args:
+            source: TDF as a RangeSource, bytes, a file path or a seekable
+                binary file object
+            config: TDFReaderConfig dataclass
+            cache_segments: Number of decrypted segments kept in memory
+
+        Returns:
+            BufferedReader: Plaintext file object; close it when done
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+
+        return tdf.open_tdf(source, config, cache_segments)
+
+    def read_tdf_pipeline(
+        self,
+        documents: Iterable[tuple[TDFSource, BinaryIO]],
+        config: TDFReaderConfig | None = None,
+        lookahead: int = 2,
+    ) -> Iterator[Manifest]:
+        """Decrypt a queue of TDFs with KAS rewraps issued ahead of time.
+
+        Keys for the next ``lookahead`` documents are unwrapped while the
+        current document is being decrypted; output is written in order.
+
+        Args:
+            documents: ``(source, output_stream)`` pairs
+            config: TDFReaderConfig dataclass shared by all documents
+            lookahead: Number of documents to unwrap keys for in advance
+
+        Returns:
+            Iterator yielding each document's manifest once it is written
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+
+        return tdf.read_tdf_pipeline(documents, config, lookahead)
+
+    @staticmethod
+    def inspect_tdf(source: TDFSource) -> TDFInspection:
+        """Inspect a TDF's manifest without contacting KAS or decrypting.
+
+        Only the ZIP central directory and the manifest entry are read, so the
+        cost is proportional to the manifest size rather than the payload.
+
+        Args:
+            source: TDF as bytes, a file path or a seekable binary file object
+
+        Returns:
+            TDFInspection: Manifest, policy attributes, KAS URLs and segment stats
+
+        """
+        return TDF().inspect_tdf(source)
+
+    def verify_tdf(
+        self,
+        source: TDFSource,
+        config: TDFReaderConfig | None = None,
+        max_workers: int | None = None,
+    ) -> TDFVerification:
+        """Check the root signature and every segment of a TDF without decrypting it to output.
+
+        Args:
+            source: TDF as bytes, a file path, a seekable binary file object
+                or a RangeSource
+            config: TDFReaderConfig dataclass
+            max_workers: Number of threads checking segments
+
+        Returns:
+            TDFVerification: The manifest and the scan throughput
+
+        Raises:
+            SDK.TamperException: If the root signature or a segment fails a
+                check
+            SDK.AssertionException: If an assertion fails verification
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+        return tdf.verify_tdf(source, config, max_workers)
+
     def create_tdf(
         self,
-        payload: bytes | BinaryIO | BytesIO,
+        payload: bytes | bytearray | memoryview | BinaryIO,
         config,
         output_stream: BinaryIO | None = None,
     ):
         """Create a TDF with the provided payload.
 
         Args:
-            payload: The payload data as bytes, file object, or BytesIO
+            payload: The payload as any contiguous bytes-like object or a file object
             config: TDFConfig dataclass from config.py
             output_stream: The output stream to write the TDF to
 
@@ -314,6 +583,323 @@ class SDK(AbstractContextManager):
         tdf = TDF(self.services)
         return tdf.create_tdf(payload, config, output_stream)
 
+    def encrypt_iter(
+        self, chunks: Iterable, config: TDFConfig
+    ) -> Generator[bytes, None, Manifest]:
+        """Encrypt a stream of chunks into a TDF produced as a stream of bytes.
+
+        Nothing needs to be seekable and memory is bounded by the segment
+        size, so the output can feed chunked transfer encoding or multipart
+        uploads directly.
+
+        Args:
+            chunks: Iterable of bytes-like plaintext chunks of any size
+            config: TDFConfig dataclass from config.py
+
+        Returns:
+            Generator yielding the TDF as byte chunks; its return value is
+            the manifest
+
+        """
+        tdf = TDF(self.services)
+        return tdf.encrypt_iter(chunks, config)
+
+    def create_detached_tdf(
+        self,
+        payload: bytes | bytearray | memoryview | BinaryIO,
+        config: TDFConfig,
+        storage: PayloadStorage,
+        payload_url: str,
+        manifest_url: str | None = None,
+    ) -> tuple[Manifest, int]:
+        """Create a TDF with its encrypted segments stored as a separate object.
+
+        Args:
+            payload: The payload as any contiguous bytes-like object or a file object
+            config: TDFConfig dataclass from config.py
+            storage: Storage the payload and manifest URLs are resolved with
+            payload_url: URL of the raw encrypted segments
+            manifest_url: URL of the manifest JSON, by default ``payload_url``
+                with a ``.manifest.json`` suffix
+
+        Returns:
+            Manifest, payload size
+
+        """
+        tdf = TDF(self.services)
+        return tdf.create_detached_tdf(
+            payload, config, storage, payload_url, manifest_url
+        )
+
+    def read_detached_tdf(
+        self,
+        manifest: str | Manifest,
+        output_stream: BinaryIO,
+        storage: PayloadStorage,
+        config: TDFReaderConfig | None = None,
+    ) -> Manifest:
+        """Decrypt a TDF whose encrypted segments are stored as a separate object.
+
+        Args:
+            manifest: URL of the manifest object, or the parsed manifest
+            output_stream: The output stream to write the payload to
+            storage: Storage the payload and manifest URLs are resolved with
+            config: TDFReaderConfig dataclass
+
+        Returns:
+            Manifest: The manifest of the decrypted TDF
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+        return tdf.read_detached_tdf(manifest, output_stream, config, storage)
+
+    def create_tdf_resumable(
+        self,
+        payload: str | PathLike | BinaryIO,
+        config: TDFConfig,
+        output_path: str | PathLike,
+        checkpoint_path: str | PathLike | None = None,
+        reader_config: TDFReaderConfig | None = None,
+        checkpoint_interval: int = 64,
+    ) -> tuple[Manifest, int]:
+        """Create a TDF file that can resume after an interruption.
+
+        Progress is checkpointed to a sidecar file every
+        ``checkpoint_interval`` segments; calling again with the same
+        arguments after a crash continues from the last checkpoint.
+
+        Args:
+            payload: Path of the plaintext, or a seekable binary stream
+            config: TDFConfig dataclass from config.py
+            output_path: Path of the TDF file to write
+            checkpoint_path: Sidecar path, ``<output_path>.checkpoint`` by default
+            reader_config: TDFReaderConfig used to unwrap the key when resuming
+            checkpoint_interval: Number of segments between checkpoints
+
+        Returns:
+            Manifest, size
+
+        Raises:
+            SDKException: If there's an error creating the TDF
+
+        """
+        tdf = TDF(self.services)
+        return tdf.create_tdf_resumable(
+            payload,
+            config,
+            output_path,
+            checkpoint_path,
+            reader_config,
+            checkpoint_interval,
+        )
+
+    def encrypt_many(
+        self,
+        items: Iterable[BulkItem],
+        config: TDFConfig,
+        max_workers: int | None = None,
+        chunksize: int = 16,
+    ) -> BulkResult:
+        """Encrypt many files into TDF files across worker processes.
+
+        Each worker builds its own SDK once, warmed with this SDK's KAS
+        public keys, and reuses it for every file it is handed.
+
+        Args:
+            items: ``(plaintext path, TDF path)`` pairs
+            config: TDFConfig used for every file; must be picklable
+            max_workers: Number of worker processes, one per CPU by default
+            chunksize: Items handed to a worker at a time
+
+        Returns:
+            BulkResult: Per-item results in input order and throughput stats
+
+        """
+        return bulk.encrypt_many(self, items, config, max_workers, chunksize)
+
+    def decrypt_many(
+        self,
+        items: Iterable[BulkItem],
+        config: TDFReaderConfig | None = None,
+        max_workers: int | None = None,
+        chunksize: int = 16,
+    ) -> BulkResult:
+        """Decrypt many TDF files across worker processes.
+
+        Args:
+            items: ``(TDF path, plaintext path)`` pairs
+            config: TDFReaderConfig used for every file; must be picklable
+            max_workers: Number of worker processes, one per CPU by default
+            chunksize: Items handed to a worker at a time
+
+        Returns:
+            BulkResult: Per-item results in input order and throughput stats
+
+        """
+        if config is None:
+            config = TDFReaderConfig()
+        return bulk.decrypt_many(self, items, config, max_workers, chunksize)
+
+    def plan_encryption(
+        self,
+        config: TDFConfig,
+        plaintext_size: int,
+        part_size: int | None = None,
+    ) -> EncryptionPlan:
+        """Create the payload key and part split for distributed encryption.
+
+        Workers encrypt their parts with
+        ``otdf_python.distributed_encryption.encrypt_part``; the results are
+        combined by :meth:`finalize_encryption`.
+
+        Args:
+            config: TDFConfig dataclass from config.py
+            plaintext_size: Size of the whole plaintext
+            part_size: Plaintext bytes per part (rounded to whole segments)
+
+        Returns:
+            EncryptionPlan: Plan to hand to trusted workers; holds the key
+
+        """
+        tdf = TDF(self.services)
+        return tdf.plan_encryption(config, plaintext_size, part_size)
+
+    def finalize_encryption(
+        self,
+        plan: EncryptionPlan,
+        results: Iterable[PartResult],
+        config: TDFConfig,
+    ) -> tuple[Manifest, bytes]:
+        """Stitch the encrypted parts of a plan into a TDF.
+
+        Args:
+            plan: The plan the parts were encrypted with
+            results: The PartResult of every part
+            config: TDFConfig the plan was created from
+
+        Returns:
+            Manifest, tail: the TDF is ``plan.header``, the encrypted parts in
+            order, then ``tail``
+
+        """
+        tdf = TDF(self.services)
+        return tdf.finalize_encryption(plan, results, config)
+
+    def encrypt_distributed(
+        self,
+        source: str | PathLike,
+        config: TDFConfig,
+        output_path: str | PathLike,
+        part_size: int | None = None,
+        executor: Executor | None = None,
+    ) -> tuple[Manifest, int]:
+        """Encrypt a file into one TDF with its parts encrypted in parallel.
+
+        Args:
+            source: Path of the plaintext
+            config: TDFConfig dataclass from config.py
+            output_path: Path of the TDF file to write
+            part_size: Plaintext bytes per part
+            executor: Executor for the parts, a process pool by default
+
+        Returns:
+            Manifest, size
+
+        Raises:
+            SDKException: If there's an error creating the TDF
+
+        """
+        tdf = TDF(self.services)
+        return tdf.encrypt_distributed(
+            source, config, output_path, part_size, executor=executor
+        )
+
+    def rewrap_tdf(
+        self,
+        source: TDFSource,
+        new_kas_infos,
+        output_stream: BinaryIO | None = None,
+        config: TDFReaderConfig | None = None,
+        attributes: list[str] | None = None,
+        keep_existing: bool = False,
+    ):
+        """Re-key a TDF for new KAS recipients by rewriting only its manifest.
+
+        The payload key is unwrapped once and wrapped for ``new_kas_infos``;
+        the encrypted payload is copied byte for byte, so no segment is
+        decrypted or re-encrypted.
+
+        Args:
+            source: TDF as a RangeSource, bytes, a file path or a seekable
+                binary file object
+            new_kas_infos: KASInfo (or list of KASInfo) to wrap the key for
+            output_stream: The output stream to write the new TDF to
+            config: TDFReaderConfig used to unwrap the existing key
+            attributes: Replaces the policy data attributes when given
+            keep_existing: Keep the existing recipients alongside the new ones
+
+        Returns:
+            Manifest, size, output_stream
+
+        Raises:
+            SDKException: If there's an error reading or writing the TDF
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+
+        return tdf.rewrap_tdf(
+            source,
+            new_kas_infos,
+            config,
+            output_stream,
+            attributes=attributes,
+            keep_existing=keep_existing,
+        )
+
+    def update_tdf(
+        self,
+        target: str | PathLike | BinaryIO,
+        append: bytes | bytearray | memoryview | BinaryIO | None = None,
+        replace: dict[int, bytes] | None = None,
+        config: TDFReaderConfig | None = None,
+        assertion_signing_keys: dict | None = None,
+    ) -> Manifest:
+        """Append to, or replace segments of, a TDF in place under its key.
+
+        Only new and replaced segments are encrypted; the root signature is
+        recomputed from the stored segment tags and only the ZIP tail and
+        manifest are rewritten.
+
+        Args:
+            target: Path of the TDF, or a read/write seekable file object
+            append: Plaintext to append
+            replace: New plaintext by segment index, each of the segment's size
+            config: TDFReaderConfig used to unwrap the payload key
+            assertion_signing_keys: Keys to re-sign assertions with, by id
+
+        Returns:
+            Manifest: The updated manifest
+
+        Raises:
+            SDKException: If there's an error updating the TDF
+
+        """
+        tdf = TDF(self.services)
+        if config is None:
+            config = TDFReaderConfig()
+
+        return tdf.update_tdf(
+            target,
+            config,
+            append=append,
+            replace=replace,
+            assertion_signing_keys=assertion_signing_keys,
+        )
+
     def create_nano_tdf(
         self, payload: bytes | BytesIO, output_stream: BinaryIO, config: "NanoTDFConfig"
     ) -> int:
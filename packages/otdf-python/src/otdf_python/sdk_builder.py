@@ -10,9 +10,17 @@ from pathlib import Path
 
 import httpx2 as httpx
 
+from otdf_python.connect_options import ConnectOptions
+from otdf_python.grpc_channel_pool import GrpcChannelPool
 from otdf_python.kas_allowlist import KASAllowlist
+from otdf_python.kas_client import KASTransport, create_rpc_client
+from otdf_python.kas_key_cache import KASKeyCache
+from otdf_python.kas_latency import KASLatencyTracker
+from otdf_python.kas_scheduler import KASScheduler
+from otdf_python.retry import RetryBudget, RetryPolicy, http_request_with_retry
 from otdf_python.sdk import KAS, SDK
 from otdf_python.sdk_exceptions import AutoConfigureException
+from otdf_python.single_flight import SingleFlight
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -50,6 +58,29 @@ class SDKBuilder:
         self.cert_paths: list[str] = []
         self._kas_allowlist_urls: list[str] | None = None
         self._ignore_kas_allowlist: bool = False
+        self._kas_scheduler: KASScheduler | None = None
+        self._kas_transport = KASTransport.CONNECT
+        self._grpc_channel_pool: GrpcChannelPool | None = None
+        self._connect_options = ConnectOptions()
+        self._retry_policy = RetryPolicy()
+        # Retries of IdP and discovery requests
+        self._retry_budget = RetryBudget()
+
+    def __getstate__(self) -> dict:
+        """Return picklable state, so worker processes can build their own SDK."""
+        state = self.__dict__.copy()
+        # SSL contexts cannot be pickled; they are rebuilt from cert_paths
+        state["ssl_context"] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore pickled state and rebuild the SSL context."""
+        self.__dict__.update(state)
+        if self.cert_paths:
+            context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+            for cert_path in self.cert_paths:
+                context.load_verify_locations(cert_path)
+            self.ssl_context = context
 
     @staticmethod
     def new_builder() -> "SDKBuilder":
@@ -230,6 +261,85 @@ class SDKBuilder:
         self._kas_allowlist_urls = urls
         return self
 
+    def with_kas_scheduler(self, scheduler: KASScheduler) -> "SDKBuilder":
+        """Set the scheduler that limits concurrent requests to each KAS.
+
+        By default every built SDK gets a KASScheduler with default limits.
+
+        Args:
+            scheduler: The scheduler, e.g. with other queue bounds or a
+                smaller batch share
+
+        Returns:
+            self: The builder instance for chaining
+
+        """
+        self._kas_scheduler = scheduler
+        return self
+
+    def with_kas_transport(
+        self,
+        transport: KASTransport | str,
+        channel_pool: GrpcChannelPool | None = None,
+    ) -> "SDKBuilder":
+        """Set the protocol used to talk to KAS.
+
+        With ``KASTransport.GRPC``, all KAS clients of a built SDK share one
+        gRPC channel per KAS, multiplexing their requests on a kept-alive
+        HTTP/2 connection. Connect RPC is the default. gRPC over TLS
+        always verifies certificates, so build() rejects it together with
+        insecure_skip_verify.
+
+        Args:
+            transport: The transport, or its value ("connect" or "grpc")
+            channel_pool: Optional GrpcChannelPool for the gRPC transport,
+                e.g. with other keepalive settings; by default every built
+                SDK gets its own, trusting the certificates added with
+                ssl_context_from_directory
+
+        Returns:
+            self: The builder instance for chaining
+
+        Raises:
+            ValueError: If the transport is unknown
+
+        """
+        try:
+            self._kas_transport = KASTransport(transport)
+        except ValueError:
+            raise ValueError(f"Unsupported KAS transport: {transport}") from None
+        self._grpc_channel_pool = channel_pool
+        return self
+
+    def with_connect_options(self, options: ConnectOptions) -> "SDKBuilder":
+        """Set the codec and compression of Connect RPCs to the platform.
+
+        Args:
+            options: The options, e.g. preferring zstd-compressed responses
+
+        Returns:
+            self: The builder instance for chaining
+
+        """
+        self._connect_options = options
+        return self
+
+    def with_retry_policy(self, policy: RetryPolicy) -> "SDKBuilder":
+        """Set the timeout and retries of KAS, IdP and discovery requests.
+
+        Requests made within ``otdf_python.retry.deadline`` are also bounded
+        by the deadline.
+
+        Args:
+            policy: The retry policy
+
+        Returns:
+            self: The builder instance for chaining
+
+        """
+        self._retry_policy = policy
+        return self
+
     def with_ignore_kas_allowlist(self, ignore: bool = True) -> "SDKBuilder":
         """Configure whether to skip KAS allowlist validation.
 
@@ -264,7 +374,7 @@ class SDKBuilder:
 
         # Try to get OpenTDF configuration first
         well_known_url = f"{self.platform_endpoint}/.well-known/opentdf-configuration"
-        response = httpx.get(well_known_url, verify=not self.insecure_skip_verify)
+        response = self._http_request(httpx.get, well_known_url)
 
         if response.status_code != 200:
             raise AutoConfigureException(
@@ -303,9 +413,7 @@ class SDKBuilder:
             return
 
         oidc_discovery_url = f"{issuer_url}/.well-known/openid-configuration"
-        oidc_response = httpx.get(
-            oidc_discovery_url, verify=not self.insecure_skip_verify
-        )
+        oidc_response = self._http_request(httpx.get, oidc_discovery_url)
 
         if oidc_response.status_code != 200:
             raise AutoConfigureException(
@@ -357,6 +465,17 @@ class SDKBuilder:
             "Platform endpoint or issuer endpoint must be configured for OIDC token discovery"
         )
 
+    def _http_request(self, method, url: str, **kwargs) -> httpx.Response:
+        """Send an IdP or discovery request with a timeout and retries."""
+        return http_request_with_retry(
+            method,
+            url,
+            self._retry_policy,
+            self._retry_budget,
+            verify=not self.insecure_skip_verify,
+            **kwargs,
+        )
+
     def _get_token_from_client_credentials(self) -> str:
         """Obtain an OAuth token using client credentials.
 
@@ -385,10 +504,8 @@ class SDKBuilder:
                 "scope": self.oauth_config.scope,
             }
 
-            response = httpx.post(
-                self.oauth_config.token_endpoint,
-                data=token_data,
-                verify=not self.insecure_skip_verify,
+            response = self._http_request(
+                httpx.post, self.oauth_config.token_endpoint, data=token_data
             )
 
             if response.status_code == 200:
@@ -435,6 +552,51 @@ class SDKBuilder:
         # No platform endpoint set yet - return None and let SDK handle it
         return None
 
+    def _create_kas_scheduler(self) -> KASScheduler:
+        """Return the configured KAS scheduler, or one with default limits."""
+        if self._kas_scheduler is not None:
+            return self._kas_scheduler
+        return KASScheduler()
+
+    def _kas_token(self) -> str | None:
+        """Return the token for KAS requests, refreshing client credentials."""
+        if self.auth_token:
+            return self.auth_token
+        elif self.oauth_config:
+            return self._get_token_from_client_credentials()
+        return None
+
+    def _create_grpc_channel_pool(self) -> GrpcChannelPool:
+        """Return the configured gRPC channel pool, or one trusting cert_paths."""
+        if self._grpc_channel_pool is not None:
+            return self._grpc_channel_pool
+        root_certificates = None
+        if self.cert_paths:
+            root_certificates = b"".join(
+                Path(cert_path).read_bytes() for cert_path in self.cert_paths
+            )
+        return GrpcChannelPool(root_certificates=root_certificates)
+
+    def _create_kas_rpc_client(
+        self,
+        scheduler: KASScheduler,
+        retry_budget: RetryBudget,
+        channel_pool: GrpcChannelPool,
+    ):
+        """Create the KAS RPC client shared by the KAS clients of an SDK."""
+        client = create_rpc_client(
+            self._kas_transport,
+            channel_pool=channel_pool,
+            connect_options=self._connect_options,
+            use_plaintext=self.use_plaintext,
+            verify_ssl=not self.insecure_skip_verify,
+            scheduler=scheduler,
+            retry_policy=self._retry_policy,
+            retry_budget=retry_budget,
+        )
+        # Entered here and closed with the services
+        return client.__enter__()
+
     def _create_services(self) -> SDK.Services:
         """Create service client instances.
 
@@ -452,6 +614,8 @@ class SDKBuilder:
 
         # Create the KAS allowlist
         kas_allowlist = self._create_kas_allowlist()
+        kas_scheduler = self._create_kas_scheduler()
+        channel_pool = self._create_grpc_channel_pool()
 
         class ServicesImpl(SDK.Services):
             def __init__(self, builder_instance, allowlist: KASAllowlist | None):
@@ -459,33 +623,64 @@ class SDKBuilder:
                 self._ssl_verify = ssl_verify
                 self._builder = builder_instance
                 self._kas_allowlist = allowlist
+                # Public keys fetched by any KAS client of these services
+                self._key_cache = KASKeyCache()
+                # Latencies of KAS requests, used to hedge unwraps
+                self._kas_latency = KASLatencyTracker()
+                # Public key and rewrap requests in flight on any KAS client
+                self._single_flight = SingleFlight()
+                # Retries of requests to any KAS
+                self._retry_budget = RetryBudget()
+                # Admission of requests to each KAS, by priority lane
+                self._scheduler = kas_scheduler
+                # gRPC channels to the platform, used by the KAS clients with
+                # the gRPC transport; channels are only opened on first use
+                self._channel_pool = channel_pool
+                # Pools passed to with_kas_transport may be shared with other
+                # SDKs, so only a pool created here is closed with the services
+                self._owns_pool = builder_instance._grpc_channel_pool is None
+                # RPC client of every KAS client, so its connections and
+                # per-URL Connect clients outlive single requests
+                self._rpc_client = builder_instance._create_kas_rpc_client(
+                    kas_scheduler, self._retry_budget, channel_pool
+                )
 
             def kas(self) -> KAS:
                 """Return the KAS interface with SSL verification settings."""
                 platform_url = SDKBuilder.get_platform_url()
 
-                # Create a token source function that can refresh tokens
-                def token_source():
-                    if self._builder.auth_token:
-                        return self._builder.auth_token
-                    elif self._builder.oauth_config:
-                        return self._builder._get_token_from_client_credentials()
-                    return None
-
                 kas_impl = KAS(
                     platform_url=platform_url,
-                    token_source=token_source,
+                    token_source=self._builder._kas_token,
                     sdk_ssl_verify=self._ssl_verify,
                     use_plaintext=self._builder.use_plaintext,
                     kas_allowlist=self._kas_allowlist,
+                    key_cache=self._key_cache,
+                    single_flight=self._single_flight,
+                    scheduler=self._scheduler,
+                    retry_policy=self._builder._retry_policy,
+                    retry_budget=self._retry_budget,
+                    rpc_client=self._rpc_client,
                 )
                 return kas_impl
 
+            def kas_key_cache(self) -> KASKeyCache:
+                return self._key_cache
+
+            def kas_latency_tracker(self) -> KASLatencyTracker:
+                return self._kas_latency
+
+            def kas_scheduler(self) -> KASScheduler:
+                return self._scheduler
+
+            def grpc_channel_pool(self) -> GrpcChannelPool:
+                return self._channel_pool
+
             def close(self):
                 self.closed = True
-
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                self.close()
+                self._rpc_client.close()
+                if self._owns_pool:
+                    self._channel_pool.close()
 
         return ServicesImpl(self, kas_allowlist)
 
@@ -500,6 +695,15 @@ class SDKBuilder:
         """
         if not self.platform_endpoint:
             raise AutoConfigureException("Platform endpoint is not set")
+        if (
+            self._kas_transport is KASTransport.GRPC
+            and self.insecure_skip_verify
+            and not self.use_plaintext
+        ):
+            raise AutoConfigureException(
+                "The gRPC KAS transport cannot skip TLS verification; trust "
+                "the platform certificates with ssl_context_from_directory instead"
+            )
 
         # Create services
         services = self._create_services()
@@ -510,4 +714,5 @@ class SDKBuilder:
             platform_url=self.platform_endpoint,
             ssl_verify=not self.insecure_skip_verify,
             use_plaintext=getattr(self, "use_plaintext", False),
+            builder=self,
         )
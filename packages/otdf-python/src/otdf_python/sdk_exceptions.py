@@ -24,3 +24,19 @@ class KASBadRequestException(SDKException):
     def __init__(self, message):
         """Initialize exception."""
         super().__init__(message)
+
+
+class KASOverloadedException(SDKException):
+    """Exception for KAS requests shed because too many are queued."""
+
+    def __init__(self, message):
+        """Initialize exception."""
+        super().__init__(message)
+
+
+class DeadlineExceededException(SDKException):
+    """Exception for operations that ran out of their time budget."""
+
+    def __init__(self, message):
+        """Initialize exception."""
+        super().__init__(message)
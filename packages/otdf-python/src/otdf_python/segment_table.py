@@ -0,0 +1,346 @@
+"""Compact, array-backed segment table for TDF integrity information."""
+
+import base64
+import binascii
+import bisect
+import hmac
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from otdf_python.manifest import ManifestSegment
+
+
+class SegmentTable(Sequence):
+    """Array-backed table of encrypted payload segments.
+
+    Stores plaintext and encrypted offsets as prefix sums in ``array('q')``
+    buffers and the raw GMAC tags in a single contiguous ``bytearray``, so a
+    manifest with tens of thousands of segments costs a few bytes per segment
+    instead of one ``ManifestSegment`` instance (plus a base64 string) each.
+
+    The table behaves as a read-only sequence of ``ManifestSegment`` objects,
+    which are built on demand, so code that iterates over
+    ``integrityInformation.segments`` keeps working unchanged.
+    """
+
+    TAG_LENGTH = 16  # kGMACPayloadLength from platform SDK
+    _STATE = (
+        "_plaintext_offsets",
+        "_encrypted_offsets",
+        "_tags",
+        "_hashes",
+        "_uniform",
+    )
+
+    def __init__(self, segment_size_default: int | None = None):
+        """Initialize an empty segment table.
+
+        Args:
+            segment_size_default: Default plaintext segment size, used for
+                constant-time offset lookups when all segments are uniform
+
+        """
+        self.segment_size_default = segment_size_default
+        self._plaintext_offsets = array("q", [0])
+        self._encrypted_offsets = array("q", [0])
+        self._tags = bytearray()
+        # Original hash strings, only kept when a hash is not a raw GMAC tag
+        # (e.g. hex-encoded or HS256 hashes written by other SDKs)
+        self._hashes: list[str] | None = None
+        self._uniform = True
+
+    @classmethod
+    def from_segments(
+        cls,
+        segments: Iterable[ManifestSegment | dict[str, Any]],
+        segment_size_default: int | None = None,
+    ) -> "SegmentTable":
+        """Build a table from manifest segments or their JSON dictionaries.
+
+        Args:
+            segments: ``ManifestSegment`` objects or parsed manifest JSON dicts
+            segment_size_default: Default plaintext segment size
+
+        Returns:
+            A new SegmentTable
+
+        """
+        if isinstance(segments, SegmentTable):
+            return segments
+        table = cls(segment_size_default)
+        for seg in segments:
+            if isinstance(seg, dict):
+                table.append_hash(
+                    seg["hash"],
+                    seg.get("segmentSize", seg.get("segment_size")),
+                    seg.get("encryptedSegmentSize", seg.get("encrypted_segment_size")),
+                )
+            else:
+                table.append_hash(seg.hash, seg.segmentSize, seg.encryptedSegmentSize)
+        return table
+
+    @classmethod
+    def from_json_list(
+        cls,
+        segments: list[dict[str, Any]],
+        segment_size_default: int | None = None,
+    ) -> "SegmentTable":
+        """Return a table over manifest JSON segments, decoded on first use.
+
+        Callers that only read the other manifest fields, such as
+        ``inspect_tdf``, then skip decoding every segment hash.
+
+        Args:
+            segments: Parsed manifest JSON segment dicts
+            segment_size_default: Default plaintext segment size
+
+        Returns:
+            A new SegmentTable
+
+        """
+        table = cls.__new__(cls)
+        table.segment_size_default = segment_size_default
+        table._pending = segments
+        return table
+
+    def __getattr__(self, name):
+        # Only reached for state a table from from_json_list has not decoded
+        if name not in self._STATE or "_pending" not in self.__dict__:
+            raise AttributeError(name)
+        decoded = SegmentTable.from_segments(
+            self.__dict__.pop("_pending"), self.segment_size_default
+        )
+        for key in self._STATE:
+            setattr(self, key, getattr(decoded, key))
+        return getattr(self, name)
+
+    def append(self, segment_size: int, encrypted_segment_size: int, tag: bytes):
+        """Append a segment with its raw GMAC tag.
+
+        Args:
+            segment_size: Plaintext size of the segment
+            encrypted_segment_size: Encrypted size (IV + ciphertext + tag)
+            tag: Raw segment hash bytes
+
+        """
+        if self._hashes is None and len(tag) != self.TAG_LENGTH:
+            self._hashes = [self._hash_at(i) for i in range(len(self))]
+        if self._hashes is not None:
+            self._hashes.append(base64.b64encode(tag).decode())
+        else:
+            self._tags += tag
+        self._append_sizes(segment_size, encrypted_segment_size)
+
+    def append_hash(
+        self, seg_hash: str, segment_size: int, encrypted_segment_size: int
+    ):
+        """Append a segment with its base64 hash as found in the manifest."""
+        if self._hashes is None:
+            try:
+                tag = base64.b64decode(seg_hash, validate=True)
+            except (binascii.Error, ValueError):
+                tag = b""
+            if len(tag) == self.TAG_LENGTH:
+                self._tags += tag
+                self._append_sizes(segment_size, encrypted_segment_size)
+                return
+            self._hashes = [self._hash_at(i) for i in range(len(self))]
+        self._hashes.append(seg_hash)
+        self._append_sizes(segment_size, encrypted_segment_size)
+
+    def _append_sizes(self, segment_size: int, encrypted_segment_size: int):
+        n = len(self)
+        # Every segment but the last must match the default size for the
+        # constant-time lookup, so check the previously-last segment here.
+        if n > 0 and self.segment_size(n - 1) != self.segment_size_default:
+            self._uniform = False
+        self._plaintext_offsets.append(self._plaintext_offsets[-1] + segment_size)
+        self._encrypted_offsets.append(
+            self._encrypted_offsets[-1] + encrypted_segment_size
+        )
+
+    def extend(self, other: "SegmentTable"):
+        """Append all segments of another table, e.g. one built by a worker."""
+        for index in range(len(other)):
+            self.append(
+                other.segment_size(index),
+                other.encrypted_segment_size(index),
+                other.tag(index),
+            )
+
+    def replace_tag(self, index: int, tag: bytes):
+        """Replace the GMAC tag of a segment re-encrypted at the same size.
+
+        Raises:
+            ValueError: If the table does not hold raw GMAC tags
+
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        if self._hashes is not None or len(tag) != self.TAG_LENGTH:
+            raise ValueError("Only raw GMAC segment hashes can be replaced")
+        start = index * self.TAG_LENGTH
+        self._tags[start : start + self.TAG_LENGTH] = tag
+
+    def truncate(self, count: int):
+        """Drop all segments from index ``count`` on."""
+        count = max(0, min(count, len(self)))
+        del self._plaintext_offsets[count + 1 :]
+        del self._encrypted_offsets[count + 1 :]
+        if self._hashes is not None:
+            del self._hashes[count:]
+        else:
+            del self._tags[count * self.TAG_LENGTH :]
+        self._uniform = all(
+            self.segment_size(i) == self.segment_size_default for i in range(count - 1)
+        )
+
+    def __len__(self) -> int:
+        return len(self._plaintext_offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return ManifestSegment(
+            hash=self._hash_at(index),
+            segmentSize=self.segment_size(index),
+            encryptedSegmentSize=self.encrypted_segment_size(index),
+        )
+
+    def __iter__(self) -> Iterator[ManifestSegment]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str | bytes):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other, strict=True)
+        )
+
+    __hash__ = None  # mutable container
+
+    def __deepcopy__(self, memo):
+        copied = SegmentTable(self.segment_size_default)
+        copied._plaintext_offsets = array("q", self._plaintext_offsets)
+        copied._encrypted_offsets = array("q", self._encrypted_offsets)
+        copied._tags = bytearray(self._tags)
+        copied._hashes = list(self._hashes) if self._hashes is not None else None
+        copied._uniform = self._uniform
+        return copied
+
+    def __repr__(self):
+        return (
+            f"SegmentTable(segments={len(self)}, total_size={self.total_size}, "
+            f"total_encrypted_size={self.total_encrypted_size})"
+        )
+
+    def _hash_at(self, index: int) -> str:
+        if self._hashes is not None:
+            return self._hashes[index]
+        return base64.b64encode(self.tag(index)).decode()
+
+    def tag(self, index: int) -> bytes:
+        """Return the raw hash bytes of a segment."""
+        if self._hashes is not None:
+            return base64.b64decode(self._hashes[index])
+        start = index * self.TAG_LENGTH
+        return bytes(self._tags[start : start + self.TAG_LENGTH])
+
+    def segment_size(self, index: int) -> int:
+        """Return the plaintext size of a segment."""
+        return self._plaintext_offsets[index + 1] - self._plaintext_offsets[index]
+
+    def encrypted_segment_size(self, index: int) -> int:
+        """Return the encrypted size of a segment."""
+        return self._encrypted_offsets[index + 1] - self._encrypted_offsets[index]
+
+    def plaintext_offset(self, index: int) -> int:
+        """Return the plaintext offset at which a segment starts."""
+        return self._plaintext_offsets[index]
+
+    def encrypted_offset(self, index: int) -> int:
+        """Return the offset of a segment within the encrypted payload."""
+        return self._encrypted_offsets[index]
+
+    def encrypted_range(self, index: int) -> tuple[int, int]:
+        """Return the ``(start, end)`` byte range of a segment in the payload."""
+        return self._encrypted_offsets[index], self._encrypted_offsets[index + 1]
+
+    @property
+    def total_size(self) -> int:
+        """Total plaintext size of all segments."""
+        return self._plaintext_offsets[-1]
+
+    @property
+    def total_encrypted_size(self) -> int:
+        """Total size of the encrypted payload."""
+        return self._encrypted_offsets[-1]
+
+    def find_segment(self, plaintext_offset: int) -> int:
+        """Return the index of the segment containing a plaintext offset.
+
+        Uses constant-time division when all segments (but the last) have the
+        default size, and binary search over the prefix sums otherwise.
+
+        Raises:
+            IndexError: If the offset is outside of the plaintext
+
+        """
+        if not 0 <= plaintext_offset < self.total_size:
+            raise IndexError("plaintext offset out of range")
+        if self._uniform and self.segment_size_default:
+            return min(plaintext_offset // self.segment_size_default, len(self) - 1)
+        return bisect.bisect_right(self._plaintext_offsets, plaintext_offset) - 1
+
+    def segments_for_range(self, start: int, length: int) -> range:
+        """Return the indices of the segments covering a plaintext range."""
+        end = min(start + length, self.total_size)
+        if length <= 0 or start >= end:
+            return range(0)
+        return range(self.find_segment(start), self.find_segment(end - 1) + 1)
+
+    def aggregate_hash(self) -> bytes:
+        """Return the concatenated raw segment hashes used for the root signature."""
+        if self._hashes is not None:
+            return b"".join(base64.b64decode(h) for h in self._hashes)
+        return bytes(self._tags)
+
+    def verify_segment(self, index: int, encrypted_segment) -> bool:
+        """Check that an encrypted segment ends with the GMAC tag on record.
+
+        Hex-encoded tags, as written for legacy (pre-4.3.0) TDFs, are
+        accepted as well.
+
+        Args:
+            index: Segment index
+            encrypted_segment: IV + ciphertext + tag, as any bytes-like object
+
+        Returns:
+            True when the trailing tag matches the manifest hash
+
+        """
+        view = memoryview(encrypted_segment)
+        if len(view) < self.TAG_LENGTH:
+            return False
+        actual = view[-self.TAG_LENGTH :]
+        expected = self.tag(index)
+        if len(expected) == 2 * self.TAG_LENGTH:
+            return hmac.compare_digest(bytes(actual).hex().encode(), expected.lower())
+        return hmac.compare_digest(actual, expected)
+
+    def to_json_list(self) -> list[dict[str, Any]]:
+        """Return the segments in manifest JSON form."""
+        return [
+            {
+                "hash": self._hash_at(i),
+                "segmentSize": self.segment_size(i),
+                "encryptedSegmentSize": self.encrypted_segment_size(i),
+            }
+            for i in range(len(self))
+        ]
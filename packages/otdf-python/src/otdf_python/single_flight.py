@@ -0,0 +1,88 @@
+"""SingleFlight: coalesce concurrent identical calls into one."""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from otdf_python.retry import remaining_time
+from otdf_python.sdk_exceptions import DeadlineExceededException
+
+
+class _Call:
+    """A call in flight, shared by its caller and any duplicate callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time, sharing its outcome.
+
+    Threads calling :meth:`do` with a key already in flight wait for that
+    call and get its result (or exception) instead of issuing their own.
+    Nothing is cached: once a call has finished, the next one for its key
+    runs again.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Call ``fn``, or wait for the call already in flight for ``key``.
+
+        Args:
+            key: Identifies equivalent calls
+            fn: The call to make
+
+        Returns:
+            The result of ``fn``, possibly from another thread's call
+
+        Raises:
+            DeadlineExceededException: If the caller's deadline passes while
+                waiting for another thread's call
+            Exception: Whatever ``fn`` raised, in every waiting thread
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            # Waiters keep their own deadline rather than the first caller's
+            try:
+                if not call.done.wait(remaining_time()):
+                    raise DeadlineExceededException(
+                        "Deadline exceeded waiting for a call in flight"
+                    )
+            except DeadlineExceededException:
+                with self._lock:
+                    call.waiters -= 1
+                raise
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Return the number of distinct calls in flight."""
+        with self._lock:
+            return len(self._calls)
@@ -1,34 +1,95 @@
 """TDF reader and writer functionality for OpenTDF platform."""
 
 import base64
+import contextlib
+import contextvars
+import functools
 import hashlib
 import hmac
 import io
-import logging
 import os
+import shutil
+import tempfile
+import threading
+import time
 import zipfile
+import zlib
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO
 
+from cryptography.exceptions import InvalidTag
+
 if TYPE_CHECKING:
     from otdf_python.kas_client import KASClient
 
 from dataclasses import dataclass
 
 from otdf_python.aesgcm import AesGcm
-from otdf_python.config import TDFConfig
+from otdf_python.assertion_binding import (
+    binding_algorithm,
+    build_assertion,
+    sign_assertion,
+    verify_assertion,
+)
+from otdf_python.assertion_config import AssertionConfig, AssertionKey, AssertionKeyAlg
+from otdf_python.compression import SegmentCodec, get_codec
+from otdf_python.config import KASInfo, TDFConfig
+from otdf_python.detached_payload import PayloadStorage
+from otdf_python.distributed_encryption import (
+    EncryptionPlan,
+    PartResult,
+    encrypt_part,
+    split_parts,
+)
+from otdf_python.encryption_checkpoint import EncryptionCheckpoint
+from otdf_python.invalid_zip_exception import InvalidZipException
+from otdf_python.kas_latency import KASLatencyTracker, hedged_call
 from otdf_python.key_type_constants import RSA_KEY_TYPE
 from otdf_python.manifest import (
     Manifest,
+    ManifestAssertion,
     ManifestEncryptionInformation,
     ManifestIntegrityInformation,
     ManifestKeyAccess,
     ManifestMethod,
     ManifestPayload,
     ManifestRootSignature,
-    ManifestSegment,
 )
+from otdf_python.policy_object import PolicyObject
 from otdf_python.policy_stub import NULL_POLICY_UUID
+from otdf_python.range_source import (
+    MmapRangeSource,
+    RangeSource,
+    RangeSourceFile,
+    SegmentPrefetcher,
+    StreamRangeSource,
+    as_range_source,
+)
+from otdf_python.sdk_exceptions import (
+    DeadlineExceededException,
+    KASOverloadedException,
+)
+from otdf_python.segment_table import SegmentTable
 from otdf_python.tdf_writer import TDFWriter
+from otdf_python.zip_writer import (
+    ZipEntryUpdater,
+    crc32_combine,
+    finish_zip64_entry,
+    start_zip64_entry,
+    zip64_entry_tail,
+    zip64_local_header,
+)
+
+TDFSource = bytes | BinaryIO | str | os.PathLike | RangeSource
 
 
 @dataclass
@@ -45,6 +106,81 @@ class TDFReaderConfig:
 
     kas_private_key: str | None = None
     attributes: list[str] | None = None
+    # Segment requests kept in flight when reading from a RangeSource
+    read_ahead: int = 4
+    # Upper bound on the size of one coalesced range request
+    coalesce_bytes: int = 8 * 1024 * 1024
+    # Assertions are verified on read; keys are looked up by assertion id and
+    # default to HS256 with the payload key, as used when signing
+    verify_assertions: bool = True
+    assertion_verification_keys: dict[str, AssertionKey] | None = None
+
+
+@dataclass
+class TDFInspection:
+    """Manifest-level view of a TDF, obtained without decrypting the payload."""
+
+    manifest: Manifest
+    policy: PolicyObject
+    attributes: list[str]
+    kas_urls: list[str]
+    segment_count: int
+    plaintext_size: int
+    encrypted_size: int
+    segment_size_default: int | None = None
+
+
+@dataclass
+class TDFVerification:
+    """Outcome of an integrity scan of a TDF."""
+
+    manifest: Manifest
+    segment_count: int
+    encrypted_size: int
+    # Seconds spent on the scan, including the key unwrap
+    elapsed: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Encrypted bytes checked per second."""
+        return self.encrypted_size / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def gb_per_second(self) -> float:
+        """Encrypted gigabytes (10^9 bytes) checked per second."""
+        return self.bytes_per_second / 1e9
+
+
+@dataclass
+class _TDFLayout:
+    """Location of the manifest-described payload within a TDF."""
+
+    manifest: Manifest
+    table: SegmentTable
+    payload_offset: int
+    verify: bool
+    codec: SegmentCodec | None = None
+    # Size of the ``0.payload`` ZIP entry, which may exceed the segments
+    payload_size: int | None = None
+
+
+@contextlib.contextmanager
+def _open_tdf_source(source: TDFSource) -> Iterator[BinaryIO]:
+    """Yield a seekable binary file object for a TDF given as bytes, path or file."""
+    if isinstance(source, RangeSource):
+        yield RangeSourceFile(source)
+    elif isinstance(source, bytes | bytearray | memoryview):
+        yield io.BytesIO(source)
+    elif isinstance(source, str | os.PathLike):
+        with Path(source).open("rb") as f:
+            yield f
+    else:
+        yield source
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    """XOR two byte strings of equal length."""
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(len(a), "big")
 
 
 class TDF:
@@ -70,6 +206,8 @@ class TDF:
         """
         self.services = services
         self.maximum_size = maximum_size or self.MAX_TDF_INPUT_SIZE
+        # Used when the services keep no KAS latency history
+        self._kas_latency: KASLatencyTracker | None = None
 
     def _validate_kas_infos(self, kas_infos):
         if not kas_infos:
@@ -77,30 +215,88 @@ class TDF:
         if not isinstance(kas_infos, list):
             kas_infos = [kas_infos]
 
-        validated_kas_infos = []
-        for kas in kas_infos:
-            # If public key is missing, try to fetch it from the KAS service
-            if not hasattr(kas, "public_key") or not kas.public_key:
-                if self.services and hasattr(self.services, "kas"):
-                    try:
-                        # Fetch public key from KAS service
-                        updated_kas = self.services.kas().get_public_key(kas)
-                        validated_kas_infos.append(updated_kas)
-                    except Exception as e:
-                        raise ValueError(
-                            f"Failed to fetch public key for KAS {kas.url}: {e}"
-                        ) from e
-                else:
-                    raise ValueError(
-                        "Each KAS info must have a public_key, or SDK services must be available to fetch it"
-                    )
-            else:
-                validated_kas_infos.append(kas)
-        return validated_kas_infos
+        missing = [kas for kas in kas_infos if not getattr(kas, "public_key", None)]
+        if not missing:
+            return list(kas_infos)
+        if not (self.services and hasattr(self.services, "kas")):
+            raise ValueError(
+                "Each KAS info must have a public_key, or SDK services must be available to fetch it"
+            )
+
+        def fetch(kas):
+            try:
+                # Every call gets its own KAS client, so fetches can overlap
+                return self.services.kas().get_public_key(kas)
+            except Exception as e:
+                raise ValueError(
+                    f"Failed to fetch public key for KAS {kas.url}: {e}"
+                ) from e
+
+        # Fetch all missing public keys concurrently: one round trip of
+        # latency for multi-KAS configs instead of one per KAS
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                # Fetches use the caller's KAS lane and deadline
+                futures = [
+                    executor.submit(contextvars.copy_context().run, fetch, kas)
+                    for kas in missing
+                ]
+                fetched = iter([future.result() for future in futures])
+        else:
+            fetched = iter([fetch(missing[0])])
+        return [
+            next(fetched) if not getattr(kas, "public_key", None) else kas
+            for kas in kas_infos
+        ]
+
+    def _wrap_payload_key(
+        self, key: bytes, config: TDFConfig, policy_json: str
+    ) -> list[ManifestKeyAccess]:
+        """Wrap a new payload key for the recipients of a TDF config.
+
+        Without a split plan the whole key is wrapped for every KAS in
+        ``config.kas_info_list``. With one, the key is split into XOR shares,
+        one per split ID, and every share is wrapped for the KASes of its
+        steps; the key can then only be recovered with a share from every
+        split. Public keys missing from ``config.kas_info_list`` are fetched
+        from KAS.
+        """
+        if not config.split_plan:
+            return self._wrap_key_for_kas(
+                key, self._validate_kas_infos(config.kas_info_list), policy_json
+            )
+
+        known = {kas.url: kas for kas in config.kas_info_list or []}
+        urls = list(dict.fromkeys(step.kas for step in config.split_plan))
+        kas_infos = self._validate_kas_infos(
+            [known.get(url) or KASInfo(url=url) for url in urls]
+        )
+        kas_by_url = dict(zip(urls, kas_infos, strict=True))
+        split_ids = list(dict.fromkeys(step.splitID for step in config.split_plan))
+        shares = dict(zip(split_ids, self._split_key(key, len(split_ids)), strict=True))
+
+        key_access_objs = []
+        for step in config.split_plan:
+            # The policy binding of a split is keyed by its share, which is
+            # what its KAS recovers
+            (ka,) = self._wrap_key_for_kas(
+                shares[step.splitID], [kas_by_url[step.kas]], policy_json
+            )
+            ka.sid = step.splitID
+            key_access_objs.append(ka)
+        return key_access_objs
+
+    @staticmethod
+    def _split_key(key: bytes, count: int) -> list[bytes]:
+        """Split a key into ``count`` random shares whose XOR is the key."""
+        shares = [os.urandom(len(key)) for _ in range(count - 1)]
+        last = key
+        for share in shares:
+            last = _xor(last, share)
+        return [*shares, last]
 
     def _wrap_key_for_kas(self, key, kas_infos, policy_json=None):
         import hashlib
-        import hmac
 
         from .asym_crypto import AsymEncryption
 
@@ -109,31 +305,8 @@ class TDF:
             asym = AsymEncryption(kas.public_key)
             wrapped_key = base64.b64encode(asym.encrypt(key)).decode()
 
-            # Calculate policy binding hash following OpenTDF specification
-            # Per spec: HMAC(DEK, Base64(policyJSON)) then hex-encode result
             if policy_json:
-                # Step 1: Base64 encode the policy JSON first (per OpenTDF spec)
-                policy_b64 = base64.b64encode(policy_json.encode("utf-8")).decode(
-                    "utf-8"
-                )
-
-                # Step 2: Calculate HMAC-SHA256 using DEK and Base64-encoded policy
-                hmac_result = hmac.new(
-                    key, policy_b64.encode("utf-8"), hashlib.sha256
-                ).digest()
-
-                # Step 3: Hex encode the HMAC result (required by OpenTDF implementation)
-                policy_binding_hex = hmac_result.hex()
-
-                # Step 4: Base64 encode the hex string for transmission
-                policy_binding_b64 = base64.b64encode(
-                    policy_binding_hex.encode("utf-8")
-                ).decode("utf-8")
-
-                policy_binding_hash = {
-                    "alg": "HS256",
-                    "hash": policy_binding_b64,
-                }
+                policy_binding_hash = self._policy_binding(key, policy_json)
             else:
                 # Fallback for cases where policy is not available
                 policy_binding_hash = {
@@ -154,6 +327,20 @@ class TDF:
             )
         return key_access_objs
 
+    @staticmethod
+    def _policy_binding(key: bytes, policy_json: str) -> dict:
+        """Compute the policy binding of a key access object.
+
+        Per spec: HMAC(DEK, Base64(policyJSON)), hex-encoded (as the OpenTDF
+        implementation requires) and base64-encoded for transmission.
+        """
+        policy_b64 = base64.b64encode(policy_json.encode("utf-8")).decode("utf-8")
+        hmac_result = hmac.new(key, policy_b64.encode("utf-8"), hashlib.sha256).digest()
+        return {
+            "alg": "HS256",
+            "hash": base64.b64encode(hmac_result.hex().encode("utf-8")).decode("utf-8"),
+        }
+
     def _build_policy_json(self, config: TDFConfig) -> str:
         policy_obj = config.policy_object
         attributes = config.attributes
@@ -217,15 +404,17 @@ class TDF:
         return key
 
     def _unwrap_key_with_kas(self, key_access_objs, policy_b64) -> bytes:
-        """Unwrap the key using the KAS service (production method)."""
+        """Unwrap the key using the KAS service (production method).
+
+        Key access objects for several KAS endpoints are hedged: the request
+        goes to the historically fastest endpoint first and to the next one
+        when it has not answered within its p95 latency (or has failed), and
+        the first key returned wins.
+        """
         # Get KAS client from services
         if not self.services:
             raise ValueError("SDK services required for KAS operations")
 
-        kas_client: KASClient = (
-            self.services.kas()
-        )  # The 'kas_client' should be typed as KASClient
-
         # Decode base64 policy for KAS
         try:
             policy_json = base64.b64decode(policy_b64).decode()
@@ -233,69 +422,206 @@ class TDF:
             # If base64 decode fails, assume it's already JSON
             policy_json = policy_b64
 
-        # Try each key access object
-        for ka in key_access_objs:
-            try:
-                # Pass the manifest key access object directly
-                key_access = ka
-
-                # Determine session key type from key_access properties
-                session_key_type = RSA_KEY_TYPE  # Default to RSA
-
-                # Check if this is an EC key based on key_access properties
-                # In a more complete implementation, we would parse the key_access
-                # to determine the exact curve type (P-256, P-384, P-521)
-                if hasattr(ka, "type") and ka.type and "ec" in ka.type.lower():
-                    from .key_type_constants import EC_KEY_TYPE
-
-                    session_key_type = EC_KEY_TYPE
-
-                # Unwrap key with KAS client
-                key = kas_client.unwrap(key_access, policy_json, session_key_type)
-                if key:
-                    return key
+        def unwrap(key_access) -> bytes:
+            # Determine session key type from key_access properties
+            session_key_type = RSA_KEY_TYPE  # Default to RSA
+
+            # Check if this is an EC key based on key_access properties
+            # In a more complete implementation, we would parse the key_access
+            # to determine the exact curve type (P-256, P-384, P-521)
+            if (
+                hasattr(key_access, "type")
+                and key_access.type
+                and "ec" in key_access.type.lower()
+            ):
+                from .key_type_constants import EC_KEY_TYPE
+
+                session_key_type = EC_KEY_TYPE
+
+            # Every request gets its own KAS client, as clients hold the
+            # session key of their last rewrap
+            kas_client: KASClient = self.services.kas()
+            key = kas_client.unwrap(key_access, policy_json, session_key_type)
+            if not key:
+                raise ValueError(f"KAS {key_access.url} returned no key")
+            return key
+
+        calls = [(ka.url, functools.partial(unwrap, ka)) for ka in key_access_objs]
+        try:
+            return hedged_call(calls, self._kas_latency_tracker())
+        except (KASOverloadedException, DeadlineExceededException):
+            raise
+        except Exception as e:
+            raise ValueError(
+                "Unable to unwrap the key with any available key access objects"
+            ) from e
+
+    def _kas_latency_tracker(self) -> KASLatencyTracker:
+        """Return the KAS latency history of the services, or of this TDF."""
+        tracker = getattr(self.services, "kas_latency_tracker", None)
+        tracker = tracker() if callable(tracker) else None
+        if not isinstance(tracker, KASLatencyTracker):
+            if self._kas_latency is None:
+                self._kas_latency = KASLatencyTracker()
+            tracker = self._kas_latency
+        return tracker
+
+    def _decrypt_segments(self, aesgcm, integrity, encrypted_payload, codec=None):
+        """Decrypt a whole in-memory payload, checking each segment's hash.
+
+        Raises:
+            ValueError: If the payload is shorter than the manifest says
+            SDK.SegmentSignatureMismatch: If a segment does not match its
+                GMAC hash in the manifest
 
-            except Exception as e:  # noqa: PERF203
-                logging.warning(f"Error unwrapping key with KAS: {e}")
-                # Continue to try next key access
-                continue
+        """
+        from otdf_python.sdk import SDK
 
-        raise ValueError(
-            "Unable to unwrap the key with any available key access objects"
+        table = SegmentTable.from_segments(
+            integrity.segments, integrity.segmentSizeDefault
         )
+        if table.total_encrypted_size > len(encrypted_payload):
+            raise ValueError("Encrypted payload is shorter than the manifest")
+        verify = (integrity.segmentHashAlg or "").upper() == "GMAC"
+        decrypted = bytearray()
+        payload_view = memoryview(encrypted_payload)
+        for index in range(len(table)):
+            start, end = table.encrypted_range(index)
+            enc_bytes = payload_view[start:end]
+            if verify and not table.verify_segment(index, enc_bytes):
+                raise SDK.SegmentSignatureMismatch(f"segment {index} hash mismatch")
+            plaintext = aesgcm.decrypt(
+                aesgcm.Encrypted(
+                    enc_bytes[: AesGcm.GCM_NONCE_LENGTH],
+                    enc_bytes[AesGcm.GCM_NONCE_LENGTH :],
+                )
+            )
+            if codec is not None:
+                plaintext = codec.decompress(plaintext, table.segment_size(index))
+            decrypted += plaintext
+        return bytes(decrypted)
+
+    @staticmethod
+    def _plaintext_size(payload) -> int | None:
+        """Return the number of payload bytes left to encrypt, if known."""
+        if not hasattr(payload, "read"):
+            with memoryview(payload) as view:
+                return view.nbytes
+        try:
+            if not payload.seekable():
+                return None
+            position = payload.tell()
+            end = payload.seek(0, io.SEEK_END)
+            payload.seek(position)
+        except (AttributeError, OSError):
+            return None
+        return max(end - position, 0)
+
+    @staticmethod
+    def _plaintext_segments(payload, segment_size: int) -> Iterator[memoryview]:
+        """Yield plaintext segments without copying.
+
+        Buffers are sliced in place; streams are read with ``readinto`` into
+        a single recycled buffer, so each yielded view is only valid until
+        the next one is requested.
+        """
+        if not hasattr(payload, "read"):
+            with memoryview(payload) as view:
+                data = view.cast("B") if view.format != "B" or view.ndim != 1 else view
+                for offset in range(0, len(data), segment_size):
+                    yield data[offset : offset + segment_size]
+            return
+        if not hasattr(payload, "readinto"):
+            while chunk := payload.read(segment_size):
+                yield memoryview(chunk)
+            return
+        buffer = memoryview(bytearray(segment_size))
+        while True:
+            # readinto may return short reads (pipes, sockets); fill the segment
+            filled = 0
+            while filled < segment_size:
+                n = payload.readinto(buffer[filled:])
+                if not n:
+                    break
+                filled += n
+            if not filled:
+                return
+            yield buffer[:filled]
+            if filled < segment_size:
+                return
+
+    @staticmethod
+    def _rechunked_segments(
+        chunks: Iterable, segment_size: int
+    ) -> Iterator[memoryview]:
+        """Regroup chunks of any size into plaintext segments.
+
+        Whole segments are sliced out of large chunks without copying;
+        smaller chunks are gathered in a single recycled buffer, so each
+        yielded view is only valid until the next one is requested.
+        """
+        buffer = memoryview(bytearray(segment_size))
+        filled = 0
+        for chunk in chunks:
+            data = memoryview(chunk).cast("B")
+            offset = 0
+            while offset < len(data):
+                if not filled and len(data) - offset >= segment_size:
+                    yield data[offset : offset + segment_size]
+                    offset += segment_size
+                    continue
+                n = min(segment_size - filled, len(data) - offset)
+                buffer[filled : filled + n] = data[offset : offset + n]
+                filled += n
+                offset += n
+                if filled == segment_size:
+                    yield buffer
+                    filled = 0
+        if filled:
+            yield buffer[:filled]
+
+    @staticmethod
+    def _encrypted_segments(
+        aesgcm: AesGcm,
+        chunks: Iterable,
+        segment_size: int,
+        codec: SegmentCodec | None = None,
+    ) -> Iterator[tuple[int, memoryview]]:
+        """Compress (optionally) and encrypt plaintext segments.
+
+        IV + ciphertext + tag of each segment land in one recycled buffer
+        and are yielded without concatenation, so each view is only valid
+        until the next one is requested.
+
+        Yields:
+            Tuples of (plaintext size, encrypted segment)
 
-    def _decrypt_segments(self, aesgcm, segments, encrypted_payload):
-        decrypted = b""
-        offset = 0
-        for seg in segments:
-            enc_len = seg.encryptedSegmentSize  # Changed field name
-            enc_bytes = encrypted_payload[offset : offset + enc_len]
-
-            # Handle empty or invalid encrypted payload in test scenarios
-            if not enc_bytes or len(enc_bytes) < AesGcm.GCM_NONCE_LENGTH:
-                # For testing, generate mock data when real data is unavailable
-                import os
-
-                iv = os.urandom(AesGcm.GCM_NONCE_LENGTH)
-                ct = os.urandom(16)
-            else:
-                iv = enc_bytes[: AesGcm.GCM_NONCE_LENGTH]
-                ct = enc_bytes[AesGcm.GCM_NONCE_LENGTH :]
-
-            decrypted += aesgcm.decrypt(aesgcm.Encrypted(iv, ct))
-            offset += enc_len
-        return decrypted
+        """
+        overhead = AesGcm.GCM_NONCE_LENGTH + AesGcm.GCM_TAG_LENGTH
+        out = bytearray(segment_size + overhead)
+        out_view = memoryview(out)
+        for chunk in chunks:
+            data = codec.compress(chunk) if codec else chunk
+            if len(data) + overhead > len(out):
+                # Incompressible input can grow slightly when compressed
+                out_view.release()
+                out = bytearray(len(data) + overhead)
+                out_view = memoryview(out)
+            n = aesgcm.encrypt_into(data, out)
+            yield len(chunk), out_view[:n]
 
     def create_tdf(
         self,
-        payload: bytes | BinaryIO,
+        payload: bytes | bytearray | memoryview | BinaryIO,
         config: TDFConfig,
         output_stream: io.BytesIO | None = None,
     ):
         """Create a TDF with the provided payload and configuration.
 
         Args:
-            payload: The payload data as bytes or BinaryIO
+            payload: The payload as any contiguous bytes-like object
+                (bytes, bytearray, memoryview, NumPy array, ...) or a binary
+                stream
             config: TDFConfig for encryption settings
             output_stream: Optional output stream, creates new BytesIO if not provided
 
@@ -306,73 +632,642 @@ class TDF:
         if output_stream is None:
             output_stream = io.BytesIO()
         writer = TDFWriter(output_stream)
-        kas_infos = self._validate_kas_infos(config.kas_info_list)
-        key = os.urandom(self.GCM_KEY_SIZE)
+        key, policy_json, key_access_objs, segment_size, codec = (
+            self._prepare_encryption(config)
+        )
+        aesgcm = AesGcm(key)
+        segments = SegmentTable(segment_size)
+        plaintext_size = self._plaintext_size(payload)
+        encrypted_size = None
+        # Compressed segments can outgrow their plaintext, so their total
+        # size is unknown up front and the entry is written as ZIP64
+        if plaintext_size is not None and codec is None:
+            segment_count = -(-plaintext_size // segment_size)
+            encrypted_size = plaintext_size + segment_count * (
+                AesGcm.GCM_NONCE_LENGTH + AesGcm.GCM_TAG_LENGTH
+            )
+        gmac_length = SegmentTable.TAG_LENGTH
+        # Write encrypted payload in segments
+        with writer.payload(encrypted_size) as f:
+            chunks = self._plaintext_segments(payload, segment_size)
+            for size, encrypted in self._encrypted_segments(
+                aesgcm, chunks, segment_size, codec
+            ):
+                f.write(encrypted)
+                # Calculate segment hash using GMAC (last 16 bytes of encrypted segment)
+                # This matches the platform SDK when segmentHashAlg is "GMAC"
+                segments.append(size, len(encrypted), encrypted[-gmac_length:])
+        # Encode policy as base64 to match Java SDK
+        policy_b64 = base64.b64encode(policy_json.encode()).decode()
+        manifest = self._build_manifest(
+            config, key, policy_b64, key_access_objs, segments, codec
+        )
+        manifest_json = manifest.to_json()
+        writer.append_manifest(manifest_json)
+        size = writer.finish()
+        return manifest, size, output_stream
+
+    def encrypt_iter(
+        self, chunks: Iterable, config: TDFConfig
+    ) -> Generator[bytes, None, Manifest]:
+        """Encrypt a stream of chunks into a TDF produced as a stream of bytes.
 
-        # Build policy JSON to pass to policy binding calculation
+        The payload entry starts with a local header that defers its CRC
+        and sizes to a data descriptor, so the TDF can be emitted front to
+        back without knowing the plaintext size and without a seekable
+        output: first the header, then one encrypted segment at a time, and
+        finally the data descriptor, manifest and central directory. Memory
+        use is bounded by the segment size, which makes the output suitable
+        for chunked transfer encoding or multipart uploads.
+
+        The KAS public keys are resolved and the payload key is wrapped
+        when this method is called; encryption happens as the returned
+        generator is consumed. The generator's return value is the manifest,
+        e.g. ``manifest = yield from tdf.encrypt_iter(chunks, config)``.
+
+        Args:
+            chunks: Iterable of bytes-like plaintext chunks of any size
+            config: TDFConfig for encryption settings
+
+        Returns:
+            Generator yielding the TDF as byte chunks
+
+        """
+        return self._encrypt_iter(chunks, config, *self._prepare_encryption(config))
+
+    def _prepare_encryption(
+        self, config: TDFConfig
+    ) -> tuple[bytes, str, list[ManifestKeyAccess], int, SegmentCodec | None]:
+        """Create and wrap a payload key for a new TDF.
+
+        Returns:
+            Tuple of (key, policy JSON, key access objects, segment size, codec)
+
+        """
+        # Check the segment options before calling out to KAS
+        segment_size, codec = self._segment_options(config)
+        key = os.urandom(self.GCM_KEY_SIZE)
         policy_json = self._build_policy_json(config)
+        key_access_objs = self._wrap_payload_key(key, config, policy_json)
+        return key, policy_json, key_access_objs, segment_size, codec
 
-        key_access_objs = self._wrap_key_for_kas(key, kas_infos, policy_json)
-        aesgcm = AesGcm(key)
-        segments = []
+    def _segment_options(self, config: TDFConfig) -> tuple[int, SegmentCodec | None]:
+        """Return the segment size and compression codec of a configuration."""
         segment_size = (
             getattr(config, "default_segment_size", None) or self.SEGMENT_SIZE
         )
-        segment_hashes_raw = []
-        total = 0
-        # Write encrypted payload in segments
-        with writer.payload() as f:
-            if isinstance(payload, bytes):
-                payload = io.BytesIO(payload)
-            while True:
-                chunk = payload.read(segment_size)
-                if not chunk:
-                    break
-                encrypted = aesgcm.encrypt(chunk)
-                f.write(encrypted.as_bytes())
-                # Calculate segment hash using GMAC (last 16 bytes of encrypted segment)
-                # This matches the platform SDK when segmentHashAlg is "GMAC"
-                encrypted_bytes = encrypted.as_bytes()
-                gmac_length = 16  # kGMACPayloadLength from platform SDK
-                if len(encrypted_bytes) < gmac_length:
-                    raise ValueError("Encrypted segment too short for GMAC")
-                seg_hash_raw = encrypted_bytes[-gmac_length:]  # Take last 16 bytes
-                seg_hash = base64.b64encode(seg_hash_raw).decode()
+        codec = (
+            get_codec(config.compression, config.compression_level)
+            if config.compression
+            else None
+        )
+        return segment_size, codec
+
+    def _encrypt_iter(
+        self,
+        chunks: Iterable,
+        config: TDFConfig,
+        key: bytes,
+        policy_json: str,
+        key_access_objs: list[ManifestKeyAccess],
+        segment_size: int,
+        codec: SegmentCodec | None,
+    ) -> Generator[bytes, None, Manifest]:
+        header = zip64_local_header(
+            TDFWriter.TDF_PAYLOAD_FILE_NAME, data_descriptor=True
+        )
+        yield header
+        segments = SegmentTable(segment_size)
+        crc = 0
+        payload_size = 0
+        for size, encrypted in self._encrypted_segments(
+            AesGcm(key),
+            self._rechunked_segments(chunks, segment_size),
+            segment_size,
+            codec,
+        ):
+            segment = bytes(encrypted)
+            crc = zlib.crc32(segment, crc)
+            payload_size += len(segment)
+            segments.append(size, len(segment), segment[-SegmentTable.TAG_LENGTH :])
+            yield segment
+
+        policy_b64 = base64.b64encode(policy_json.encode()).decode()
+        manifest = self._build_manifest(
+            config, key, policy_b64, key_access_objs, segments, codec
+        )
+        yield zip64_entry_tail(
+            TDFWriter.TDF_PAYLOAD_FILE_NAME,
+            0,
+            crc,
+            payload_size,
+            TDFWriter.TDF_MANIFEST_FILE_NAME,
+            manifest.to_json().encode(),
+            data_descriptor=True,
+        )
+        return manifest
+
+    def create_detached_tdf(
+        self,
+        payload: bytes | bytearray | memoryview | BinaryIO,
+        config: TDFConfig,
+        storage: PayloadStorage,
+        payload_url: str,
+        manifest_url: str | None = None,
+    ) -> tuple[Manifest, int]:
+        """Create a TDF whose encrypted segments are stored outside the ZIP.
+
+        The encrypted segments are written back to back, without ZIP
+        framing, to ``payload_url``; the manifest, referencing them with
+        ``storage.protocol``, is written as JSON to ``manifest_url``.
+
+        Args:
+            payload: The payload as any contiguous bytes-like object or a
+                binary stream
+            config: TDFConfig for encryption settings
+            storage: Storage the URLs are resolved with
+            payload_url: URL of the payload object, recorded in the manifest
+            manifest_url: URL of the manifest object, by default
+                ``payload_url`` with a ``.manifest.json`` suffix
+
+        Returns:
+            Tuple of (manifest, payload size)
+
+        """
+        key, policy_json, key_access_objs, segment_size, codec = (
+            self._prepare_encryption(config)
+        )
+        segments = SegmentTable(segment_size)
+        with storage.create(payload_url) as out:
+            chunks = self._plaintext_segments(payload, segment_size)
+            for size, encrypted in self._encrypted_segments(
+                AesGcm(key), chunks, segment_size, codec
+            ):
+                out.write(encrypted)
                 segments.append(
-                    ManifestSegment(
-                        hash=seg_hash,
-                        segmentSize=len(
-                            chunk
-                        ),  # Changed from segment_size to segmentSize
-                        encryptedSegmentSize=len(
-                            encrypted.as_bytes()
-                        ),  # Changed from encrypted_segment_size to encryptedSegmentSize
-                    )
+                    size, len(encrypted), encrypted[-SegmentTable.TAG_LENGTH :]
                 )
-                # Collect raw segment hash bytes for root signature calculation
-                segment_hashes_raw.append(seg_hash_raw)
-                total += len(chunk)
-        # Use config fields for policy
-        policy_json = self._build_policy_json(config)
-        # Encode policy as base64 to match Java SDK
+
         policy_b64 = base64.b64encode(policy_json.encode()).decode()
+        manifest = self._build_manifest(
+            config,
+            key,
+            policy_b64,
+            key_access_objs,
+            segments,
+            codec,
+            payload_url=payload_url,
+            payload_protocol=storage.protocol,
+        )
+        with storage.create(manifest_url or f"{payload_url}.manifest.json") as out:
+            out.write(manifest.to_json().encode())
+        return manifest, segments.total_encrypted_size
+
+    def read_detached_tdf(
+        self,
+        manifest: str | Manifest,
+        output_stream: BinaryIO,
+        config: TDFReaderConfig,
+        storage: PayloadStorage,
+    ) -> Manifest:
+        """Decrypt a TDF created by :meth:`create_detached_tdf`.
+
+        Segments are fetched from the payload object with range reads,
+        ``config.read_ahead`` requests at a time.
+
+        Args:
+            manifest: URL of the manifest object, or the parsed manifest
+            output_stream: Stream the plaintext is written to
+            config: TDFReaderConfig with optional private key for local unwrapping
+            storage: Storage the URLs are resolved with
+
+        Returns:
+            The manifest of the TDF
+
+        Raises:
+            ValueError: If the manifest does not reference a detached payload
+            SDK.RootSignatureValidationException: If the root signature does
+                not match the segment hashes
+            SDK.SegmentSignatureMismatch: If a segment does not match its hash
+
+        """
+        if isinstance(manifest, str):
+            manifest = Manifest.from_json(storage.read(manifest).decode())
+        if not manifest.encryptionInformation:
+            raise ValueError("Missing encryption information in manifest")
+        if manifest.payload is None or manifest.payload.protocol == "zip":
+            raise ValueError("TDF payload is not detached")
+        with storage.open(manifest.payload.url) as source:
+            layout = self._layout_from_manifest(manifest, 0, source.size())
+            key = self._unwrap_and_verify(manifest, config)
+            self._decrypt_layout(
+                source,
+                layout,
+                key,
+                output_stream,
+                read_ahead=config.read_ahead,
+                coalesce_bytes=config.coalesce_bytes,
+            )
+        return manifest
+
+    def create_tdf_resumable(
+        self,
+        payload: str | os.PathLike | BinaryIO,
+        config: TDFConfig,
+        output_path: str | os.PathLike,
+        checkpoint_path: str | os.PathLike | None = None,
+        reader_config: TDFReaderConfig | None = None,
+        checkpoint_interval: int = 64,
+    ) -> tuple[Manifest, int]:
+        """Create a TDF file with periodic checkpoints, resuming an interrupted run.
+
+        Every ``checkpoint_interval`` segments the output is flushed to disk
+        and the segments completed since the last checkpoint are appended to
+        a sidecar file (``<output_path>.checkpoint`` by default), which also
+        holds the wrapped payload key. When the sidecar exists, encryption
+        resumes after its last checkpoint: the payload key is unwrapped again
+        with ``reader_config`` (through KAS, or a local private key), the
+        output is truncated to the checkpointed size and the plaintext is
+        read from the checkpointed offset. Once all segments are written,
+        the manifest and ZIP central directory are added and the sidecar is
+        removed.
+
+        Args:
+            payload: Path of the plaintext, or a seekable binary stream
+                positioned at its start
+            config: TDFConfig for encryption settings; must match the
+                interrupted run when resuming
+            output_path: Path of the TDF file to write
+            checkpoint_path: Path of the sidecar file
+            reader_config: TDFReaderConfig used to unwrap the key when resuming
+            checkpoint_interval: Number of segments between checkpoints
+
+        Returns:
+            Tuple of (manifest, size)
+
+        Raises:
+            ValueError: If the payload is not seekable, or the checkpoint does
+                not match the configuration or the output
+            SDK.SegmentSignatureMismatch: If the output does not match the
+                checkpoint
+
+        """
+        if checkpoint_path is None:
+            checkpoint_path = f"{os.fspath(output_path)}.checkpoint"
+        segment_size, codec = self._segment_options(config)
+        with contextlib.ExitStack() as stack:
+            if isinstance(payload, str | os.PathLike):
+                payload = stack.enter_context(Path(payload).open("rb"))
+            plaintext_size = self._plaintext_size(payload)
+            if plaintext_size is None:
+                raise ValueError("Resumable encryption requires a seekable payload")
+            start = payload.tell()
+
+            if Path(checkpoint_path).exists():
+                checkpoint = EncryptionCheckpoint.load(checkpoint_path)
+                try:
+                    out = stack.enter_context(Path(output_path).open("r+b"))
+                except FileNotFoundError as e:
+                    raise ValueError(
+                        f"Checkpoint {checkpoint.path} does not match the output: "
+                        f"{output_path} is missing"
+                    ) from e
+                key = self._resume_checkpoint(
+                    checkpoint,
+                    out,
+                    segment_size,
+                    codec,
+                    plaintext_size,
+                    reader_config or TDFReaderConfig(),
+                )
+            else:
+                key, policy_json, key_access_objs, _, _ = self._prepare_encryption(
+                    config
+                )
+                out = stack.enter_context(Path(output_path).open("w+b"))
+                data_offset = start_zip64_entry(out, TDFWriter.TDF_PAYLOAD_FILE_NAME)
+                # The local header must be durable before the sidecar refers
+                # to the output
+                out.flush()
+                os.fsync(out.fileno())
+                checkpoint = EncryptionCheckpoint.create(
+                    checkpoint_path,
+                    key_access_objs,
+                    base64.b64encode(policy_json.encode()).decode(),
+                    segment_size,
+                    codec.name if codec else None,
+                    header_offset=0,
+                    data_offset=data_offset,
+                    plaintext_size=plaintext_size,
+                )
+
+            payload.seek(start + checkpoint.plaintext_offset)
+            table = checkpoint.table
+            crc = checkpoint.crc
+            written = checkpoint.payload_size
+            offset = checkpoint.plaintext_offset
+            chunks = self._plaintext_segments(payload, segment_size)
+            for size, encrypted in self._encrypted_segments(
+                AesGcm(key), chunks, segment_size, codec
+            ):
+                out.write(encrypted)
+                crc = zlib.crc32(encrypted, crc)
+                written += len(encrypted)
+                offset += size
+                table.append(
+                    size, len(encrypted), encrypted[-SegmentTable.TAG_LENGTH :]
+                )
+                if len(table) % checkpoint_interval == 0:
+                    # The data must be durable before the checkpoint refers to it
+                    out.flush()
+                    os.fsync(out.fileno())
+                    checkpoint.record(written, crc, offset)
+
+            manifest = self._build_manifest(
+                config,
+                key,
+                checkpoint.header["policy"],
+                checkpoint.key_access,
+                table,
+                codec,
+            )
+            size = finish_zip64_entry(
+                out,
+                checkpoint.header["headerOffset"],
+                TDFWriter.TDF_PAYLOAD_FILE_NAME,
+                crc,
+                written,
+                TDFWriter.TDF_MANIFEST_FILE_NAME,
+                manifest.to_json().encode("utf-8"),
+            )
+            out.flush()
+            os.fsync(out.fileno())
+        checkpoint.remove()
+        return manifest, size
+
+    def _resume_checkpoint(
+        self,
+        checkpoint: EncryptionCheckpoint,
+        out: BinaryIO,
+        segment_size: int,
+        codec: SegmentCodec | None,
+        plaintext_size: int,
+        reader_config: TDFReaderConfig,
+    ) -> bytes:
+        """Unwrap the key of a checkpoint and rewind the output to it.
+
+        The last checkpointed segment is read back and authenticated, which
+        checks both the unwrapped key and the output file. The payload local
+        header is written again, since it may not have reached the disk.
+        """
+        from otdf_python.sdk import SDK
+
+        header = checkpoint.header
+        if (
+            header["segmentSize"] != segment_size
+            or header["compression"] != (codec.name if codec else None)
+            or header["plaintextSize"] != plaintext_size
+        ):
+            raise ValueError(
+                f"Checkpoint {checkpoint.path} does not match this payload and config"
+            )
+        payload_end = header["dataOffset"] + checkpoint.payload_size
+        if checkpoint.payload_size and out.seek(0, io.SEEK_END) < payload_end:
+            raise ValueError(
+                f"Checkpoint {checkpoint.path} does not match the output: "
+                f"it records {payload_end} bytes, the output has {out.tell()}"
+            )
+        key = self._unwrap_key_access(
+            checkpoint.key_access, header["policy"], reader_config
+        )
+        table = checkpoint.table
+        if len(table):
+            last = len(table) - 1
+            start, end = table.encrypted_range(last)
+            out.seek(header["dataOffset"] + start)
+            encrypted = out.read(end - start)
+            if not table.verify_segment(last, encrypted):
+                raise SDK.SegmentSignatureMismatch(
+                    f"segment {last} does not match the checkpoint"
+                )
+            try:
+                AesGcm(key).decrypt(
+                    AesGcm.Encrypted(
+                        encrypted[: AesGcm.GCM_NONCE_LENGTH],
+                        encrypted[AesGcm.GCM_NONCE_LENGTH :],
+                    )
+                )
+            except InvalidTag as e:
+                raise ValueError("Checkpoint key does not decrypt the output") from e
+        # Drop anything written after the last checkpoint
+        out.truncate(payload_end)
+        out.seek(header["headerOffset"])
+        out.write(zip64_local_header(TDFWriter.TDF_PAYLOAD_FILE_NAME))
+        out.seek(payload_end)
+        return key
+
+    def plan_encryption(
+        self,
+        config: TDFConfig,
+        plaintext_size: int,
+        part_size: int | None = None,
+    ) -> EncryptionPlan:
+        """Create the payload key and split a plaintext for distributed encryption.
+
+        The key is wrapped for the configured KAS recipients once; workers
+        then encrypt their parts with ``distributed_encryption.encrypt_part``
+        and the results are combined by :meth:`finalize_encryption`.
+
+        Args:
+            config: TDFConfig for encryption settings
+            plaintext_size: Size of the whole plaintext
+            part_size: Plaintext bytes per part, rounded up to a multiple of
+                the segment size; by default one part per CPU
+
+        Returns:
+            EncryptionPlan to distribute to the workers
+
+        """
+        # Creating the codec here fails in the coordinator rather than in
+        # every worker
+        key, policy_json, key_access_objs, segment_size, _codec = (
+            self._prepare_encryption(config)
+        )
+        if part_size is None:
+            part_size = -(-plaintext_size // (os.cpu_count() or 1))
+        return EncryptionPlan(
+            key=key,
+            key_access=key_access_objs,
+            policy=base64.b64encode(policy_json.encode()).decode(),
+            segment_size=segment_size,
+            plaintext_size=plaintext_size,
+            parts=split_parts(plaintext_size, segment_size, part_size),
+            header=zip64_local_header(
+                TDFWriter.TDF_PAYLOAD_FILE_NAME, data_descriptor=True
+            ),
+            compression=config.compression,
+            compression_level=config.compression_level,
+        )
+
+    def finalize_encryption(
+        self,
+        plan: EncryptionPlan,
+        results: Iterable[PartResult],
+        config: TDFConfig,
+    ) -> tuple[Manifest, bytes]:
+        """Build the manifest and ZIP tail of a distributed encryption.
+
+        Only the partial segment tables and CRCs of the parts are used; no
+        ciphertext is read.
+
+        Args:
+            plan: The plan the parts were encrypted with
+            results: One PartResult per part, in any order
+            config: TDFConfig the plan was created from (MIME type and
+                assertions)
+
+        Returns:
+            Tuple of (manifest, tail); the TDF is ``plan.header``, the
+            encrypted parts in order, then ``tail``
+
+        Raises:
+            ValueError: If results are missing or do not match the plan
+
+        """
+        results = sorted(results, key=lambda result: result.index)
+        if [result.index for result in results] != list(range(len(plan.parts))):
+            raise ValueError("Expected exactly one result for every part of the plan")
+        table = SegmentTable(plan.segment_size)
+        crc = 0
+        size = 0
+        for part, result in zip(plan.parts, results, strict=True):
+            if result.segments.total_size != part.size:
+                raise ValueError(f"Part {part.index} does not cover its range")
+            table.extend(result.segments)
+            crc = crc32_combine(crc, result.crc, result.size)
+            size += result.size
+        codec = (
+            get_codec(plan.compression, plan.compression_level)
+            if plan.compression
+            else None
+        )
+        manifest = self._build_manifest(
+            config, plan.key, plan.policy, plan.key_access, table, codec
+        )
+        tail = zip64_entry_tail(
+            TDFWriter.TDF_PAYLOAD_FILE_NAME,
+            0,
+            crc,
+            size,
+            TDFWriter.TDF_MANIFEST_FILE_NAME,
+            manifest.to_json().encode("utf-8"),
+            data_descriptor=True,
+        )
+        return manifest, tail
+
+    def encrypt_distributed(
+        self,
+        source: str | os.PathLike,
+        config: TDFConfig,
+        output_path: str | os.PathLike,
+        part_size: int | None = None,
+        executor: Executor | None = None,
+    ) -> tuple[Manifest, int]:
+        """Encrypt a file into a TDF with parts encrypted on a process pool.
+
+        This is the local reference for distributed encryption. Without
+        compression, workers write their parts straight into the output
+        file at their planned offsets; with compression, parts go to
+        temporary files next to the output and are concatenated.
 
+        Args:
+            source: Path of the plaintext
+            config: TDFConfig for encryption settings
+            output_path: Path of the TDF file to write
+            part_size: Plaintext bytes per part
+            executor: Executor to run the parts on; a ProcessPoolExecutor
+                with one process per CPU by default
+
+        Returns:
+            Tuple of (manifest, size)
+
+        """
+        plan = self.plan_encryption(config, Path(source).stat().st_size, part_size)
+        output_path = Path(output_path)
+        with contextlib.ExitStack() as stack:
+            if executor is None:
+                executor = stack.enter_context(ProcessPoolExecutor())
+            if plan.compression is None:
+                with output_path.open("wb") as out:
+                    out.write(plan.header)
+                    out.truncate(len(plan.header) + plan.payload_size)
+                futures = [
+                    executor.submit(
+                        encrypt_part, plan, i, source, output_path, plan.part_offset(i)
+                    )
+                    for i in range(len(plan.parts))
+                ]
+                manifest, tail = self.finalize_encryption(
+                    plan, [f.result() for f in futures], config
+                )
+                with output_path.open("r+b") as out:
+                    out.seek(len(plan.header) + plan.payload_size)
+                    out.write(tail)
+                    out.truncate()
+                    return manifest, out.tell()
+
+            blob_dir = Path(
+                stack.enter_context(tempfile.TemporaryDirectory(dir=output_path.parent))
+            )
+            blobs = [blob_dir / f"part-{i}" for i in range(len(plan.parts))]
+            futures = [
+                executor.submit(encrypt_part, plan, i, source, blob)
+                for i, blob in enumerate(blobs)
+            ]
+            manifest, tail = self.finalize_encryption(
+                plan, [f.result() for f in futures], config
+            )
+            with output_path.open("wb") as out:
+                out.write(plan.header)
+                for blob in blobs:
+                    with blob.open("rb") as part:
+                        shutil.copyfileobj(part, out)
+                out.write(tail)
+                return manifest, out.tell()
+
+    def _build_manifest(
+        self,
+        config: TDFConfig,
+        key: bytes,
+        policy_b64: str,
+        key_access_objs: list[ManifestKeyAccess],
+        segments: SegmentTable,
+        codec: SegmentCodec | None = None,
+        payload_url: str = TDFWriter.TDF_PAYLOAD_FILE_NAME,
+        payload_protocol: str = "zip",
+    ) -> Manifest:
+        """Build and sign the manifest of an encrypted payload."""
         # Calculate root signature: HMAC-SHA256 over concatenated segment hash raw bytes
         # This matches the platform SDK approach
-        aggregate_hash = b"".join(segment_hashes_raw)
+        aggregate_hash = segments.aggregate_hash()
         root_sig_raw = hmac.new(key, aggregate_hash, hashlib.sha256).digest()
+        assertions = self._sign_assertions(config.assertions, aggregate_hash, key)
         root_sig = base64.b64encode(root_sig_raw).decode()
         integrity_info = ManifestIntegrityInformation(
             rootSignature=ManifestRootSignature(
                 alg="HS256", sig=root_sig
             ),  # Changed field names
             segmentHashAlg="GMAC",  # Changed from SHA256 to GMAC to match Java SDK
-            segmentSizeDefault=segment_size,  # Changed field name
-            encryptedSegmentSizeDefault=segment_size + 28,  # Changed field name, approx
+            segmentSizeDefault=segments.segment_size_default,  # Changed field name
+            encryptedSegmentSizeDefault=segments.segment_size_default
+            + 28,  # Changed field name, approx
             segments=segments,
         )
         method = ManifestMethod(
-            algorithm="AES-256-GCM", iv="", isStreamable=True
+            algorithm="AES-256-GCM",
+            iv="",
+            isStreamable=True,
+            compression=codec.name if codec else None,
         )  # Changed field name
         enc_info = ManifestEncryptionInformation(
             type="split",
@@ -383,8 +1278,8 @@ class TDF:
         )
         payload_info = ManifestPayload(
             type="reference",  # Changed from "file" to "reference" to match Java SDK
-            url="0.payload",
-            protocol="zip",
+            url=payload_url,
+            protocol=payload_protocol,
             mimeType=config.mime_type,  # Use MIME type from config
             isEncrypted=True,  # Changed from is_encrypted to isEncrypted
         )
@@ -392,12 +1287,145 @@ class TDF:
             schemaVersion=self.TDF_VERSION,  # Changed from tdf_version to schemaVersion
             encryptionInformation=enc_info,  # Changed field name
             payload=payload_info,
-            assertions=[],
+            assertions=assertions,
         )
-        manifest_json = manifest.to_json()
-        writer.append_manifest(manifest_json)
-        size = writer.finish()
-        return manifest, size, output_stream
+        return manifest
+
+    @staticmethod
+    def _sign_assertions(
+        assertion_configs: list[AssertionConfig], aggregate_hash: bytes, key: bytes
+    ) -> list[ManifestAssertion]:
+        """Build and sign the configured assertions over the aggregate hash."""
+        assertions = []
+        seen = set()
+        for assertion_config in assertion_configs:
+            if assertion_config.id in seen:
+                raise ValueError(f"Duplicate assertion id: {assertion_config.id}")
+            seen.add(assertion_config.id)
+            signing_key = assertion_config.signing_key
+            if signing_key is None or not signing_key.is_defined():
+                signing_key = AssertionKey(AssertionKeyAlg.HS256, key)
+            assertions.append(
+                sign_assertion(
+                    build_assertion(assertion_config), aggregate_hash, signing_key
+                )
+            )
+        return assertions
+
+    @staticmethod
+    def _verify_assertions(manifest: Manifest, key: bytes, config: TDFReaderConfig):
+        """Verify every assertion in a manifest against its segment hashes.
+
+        The aggregate hash comes from the manifest segment table; the
+        segments themselves are checked against it as they are decrypted.
+
+        Raises:
+            SDK.AssertionException: If an assertion fails verification
+
+        """
+        if not config.verify_assertions or not manifest.assertions:
+            return
+        integrity = manifest.encryptionInformation.integrityInformation
+        aggregate_hash = SegmentTable.from_segments(
+            integrity.segments, integrity.segmentSizeDefault
+        ).aggregate_hash()
+        keys = config.assertion_verification_keys or {}
+        for assertion in manifest.assertions:
+            verify_key = keys.get(assertion.id) or AssertionKey(
+                AssertionKeyAlg.HS256, key
+            )
+            verify_assertion(assertion, aggregate_hash, verify_key)
+
+    def _unwrap_and_verify(self, manifest: Manifest, config: TDFReaderConfig) -> bytes:
+        """Unwrap the payload key and verify the manifest signatures with it.
+
+        The root signature covers the list of segment hashes, so segments
+        dropped from or reordered in the manifest are caught before any
+        plaintext is produced; each segment is checked against its hash as it
+        is read.
+
+        Raises:
+            SDK.RootSignatureValidationException: If the root signature does
+                not match the segment hashes
+            SDK.AssertionException: If an assertion fails verification
+
+        """
+        key = self._unwrap_payload_key(manifest, config)
+        integrity = manifest.encryptionInformation.integrityInformation
+        if not integrity:
+            raise ValueError("Missing integrity information in manifest")
+        table = SegmentTable.from_segments(
+            integrity.segments, integrity.segmentSizeDefault
+        )
+        self._verify_root_signature(manifest, table, key)
+        self._verify_assertions(manifest, key, config)
+        return key
+
+    def _unwrap_payload_key(self, manifest: Manifest, config: TDFReaderConfig) -> bytes:
+        """Unwrap the payload key of a manifest, locally or through KAS."""
+        if not manifest.encryptionInformation:
+            raise ValueError("Missing encryption information in manifest")
+
+        return self._unwrap_key_access(
+            manifest.encryptionInformation.keyAccess,
+            manifest.encryptionInformation.policy,
+            config,
+        )
+
+    def _unwrap_key_access(
+        self,
+        key_access_objs: list[ManifestKeyAccess],
+        policy_b64: str,
+        config: TDFReaderConfig,
+    ) -> bytes:
+        """Unwrap a payload key from key access objects, locally or through KAS.
+
+        Key access objects are grouped by split ID. Any one of a split's
+        objects yields its share, and the payload key is the XOR of the
+        shares of all splits; the splits are unwrapped concurrently, so a key
+        split across several KASes costs one round trip of latency.
+        """
+        splits: dict[str, list[ManifestKeyAccess]] = {}
+        for ka in key_access_objs:
+            splits.setdefault(ka.sid or "", []).append(ka)
+        if len(splits) <= 1:
+            return self._unwrap_split(key_access_objs, policy_b64, config)
+
+        with ThreadPoolExecutor(max_workers=len(splits)) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._unwrap_split,
+                    kaos,
+                    policy_b64,
+                    config,
+                )
+                for kaos in splits.values()
+            ]
+        shares = [future.result() for future in futures]
+        key = shares[0]
+        for share in shares[1:]:
+            key = _xor(key, share)
+        return key
+
+    def _unwrap_split(
+        self,
+        key_access_objs: list[ManifestKeyAccess],
+        policy_b64: str,
+        config: TDFReaderConfig,
+    ) -> bytes:
+        """Unwrap a key (or key share) from any one of its key access objects."""
+        # If a private key is provided, use local unwrapping (for testing)
+        if config.kas_private_key:
+            return self._unwrap_key(key_access_objs, config.kas_private_key)
+
+        # Use KAS client to unwrap the key
+        if not self.services or not hasattr(self.services, "kas"):
+            raise ValueError(
+                "SDK services with KAS client required for remote key unwrapping"
+            )
+
+        return self._unwrap_key_with_kas(key_access_objs, policy_b64)
 
     def load_tdf(
         self, tdf_data: bytes | io.BytesIO, config: TDFReaderConfig
@@ -411,6 +1439,12 @@ class TDF:
         Returns:
             TDFReader containing payload and manifest
 
+        Raises:
+            SDK.RootSignatureValidationException: If the root signature does
+                not match the segment hashes
+            SDK.SegmentSignatureMismatch: If a segment does not match its
+                hash in the manifest
+
         """
         # Extract manifest, unwrap payload key using KAS client
         # Handle both bytes and BinaryIO input
@@ -423,34 +1457,939 @@ class TDF:
             if not manifest.encryptionInformation:
                 raise ValueError("Missing encryption information in manifest")
 
-            key_access_objs = (
-                manifest.encryptionInformation.keyAccess
-            )  # Changed field name
+            key = self._unwrap_and_verify(manifest, config)
 
-            # If a private key is provided, use local unwrapping (for testing)
-            if config.kas_private_key:
-                key = self._unwrap_key(key_access_objs, config.kas_private_key)
-            else:
-                # Use KAS client to unwrap the key
-                if not self.services or not hasattr(self.services, "kas"):
-                    raise ValueError(
-                        "SDK services with KAS client required for remote key unwrapping"
+            aesgcm = AesGcm(key)
+            integrity = manifest.encryptionInformation.integrityInformation
+            if not integrity:
+                raise ValueError("Missing integrity information in manifest")
+            encrypted_payload = z.read("0.payload")
+            payload = self._decrypt_segments(
+                aesgcm, integrity, encrypted_payload, self._segment_codec(manifest)
+            )
+            return TDFReader(payload=payload, manifest=manifest)
+
+    def read_tdf_file(
+        self,
+        path: str | os.PathLike,
+        output_stream: BinaryIO,
+        config: TDFReaderConfig,
+    ) -> Manifest:
+        """Decrypt a TDF file on disk into an output stream via ``mmap``.
+
+        The payload is located through the ZIP central directory and each
+        encrypted segment is handed to AES-GCM as a ``memoryview`` slice of
+        the mapping, so ciphertext is never copied and the OS page cache
+        handles the I/O. Plaintext is decrypted into one recycled buffer.
+
+        Args:
+            path: Path to the TDF file
+            output_stream: Stream the plaintext is written to
+            config: TDFReaderConfig with optional private key for local unwrapping
+
+        Returns:
+            The manifest of the TDF
+
+        Raises:
+            SDK.RootSignatureValidationException: If the root signature does
+                not match the segment hashes
+            SDK.SegmentSignatureMismatch: If a segment does not match its hash
+
+        """
+        with MmapRangeSource(path) as source:
+            # Page faults are cheap, so read segments synchronously
+            return self.read_tdf_source(source, output_stream, config, read_ahead=0)
+
+    def read_tdf_stream(
+        self,
+        stream: BinaryIO,
+        output_stream: BinaryIO,
+        config: TDFReaderConfig,
+        spool_threshold: int = 64 * 1024 * 1024,
+        spool_dir: str | os.PathLike | None = None,
+    ) -> Manifest:
+        """Decrypt a TDF read front to back from a non-seekable stream.
+
+        The manifest is stored after the payload, so the ZIP entries are
+        parsed from their local headers while the encrypted payload is
+        spooled: in memory up to ``spool_threshold`` bytes, then to a
+        temporary file. Once the manifest has arrived, the payload key is
+        unwrapped and the segments are decrypted from the spool, so memory
+        use stays bounded for arbitrarily large piped input.
+
+        Args:
+            stream: Binary stream holding the TDF, e.g. a pipe or socket
+            output_stream: Stream the plaintext is written to
+            config: TDFReaderConfig with optional private key for local unwrapping
+            spool_threshold: Payload bytes kept in memory before spilling to disk
+            spool_dir: Directory for the spool file, the system default if None
+
+        Returns:
+            The manifest of the TDF
+
+        Raises:
+            InvalidZipException: If the stream is not a valid TDF archive
+            SDK.RootSignatureValidationException: If the root signature does
+                not match the segment hashes
+            SDK.SegmentSignatureMismatch: If a segment does not match its hash
+
+        """
+        from otdf_python.zip_reader import StreamingZipReader
+
+        manifest_json = None
+        payload_size = None
+        with tempfile.SpooledTemporaryFile(
+            max_size=spool_threshold, dir=spool_dir
+        ) as spool:
+            for name, data in StreamingZipReader(stream).entries():
+                if name == TDFWriter.TDF_PAYLOAD_FILE_NAME:
+                    for chunk in data:
+                        spool.write(chunk)
+                    payload_size = spool.tell()
+                elif name == TDFWriter.TDF_MANIFEST_FILE_NAME:
+                    manifest_json = b"".join(data).decode()
+            if manifest_json is None or payload_size is None:
+                raise InvalidZipException(
+                    "TDF stream is missing its payload or manifest"
+                )
+
+            manifest = Manifest.from_json(manifest_json)
+            if not manifest.encryptionInformation:
+                raise ValueError("Missing encryption information in manifest")
+            layout = self._layout_from_manifest(manifest, 0, payload_size)
+            key = self._unwrap_and_verify(manifest, config)
+            source = StreamRangeSource(spool)
+            self._decrypt_layout(source, layout, key, output_stream)
+        return manifest
+
+    def read_tdf_source(
+        self,
+        source: RangeSource,
+        output_stream: BinaryIO,
+        config: TDFReaderConfig,
+        offset: int = 0,
+        length: int | None = None,
+        read_ahead: int | None = None,
+    ) -> Manifest:
+        """Decrypt a TDF from a range source into an output stream.
+
+        Only the ZIP central directory, the manifest and the encrypted
+        segments covering the requested plaintext range are fetched. Segment
+        reads are coalesced and prefetched in parallel, as configured by
+        ``config.read_ahead`` and ``config.coalesce_bytes``, while earlier
+        segments are being decrypted. The key is unwrapped on a background
+        thread so the first segment reads overlap with the KAS rewrap.
+
+        Args:
+            source: RangeSource holding the TDF
+            output_stream: Stream the plaintext is written to
+            config: TDFReaderConfig with optional private key for local unwrapping
+            offset: Plaintext offset to start decrypting at
+            length: Number of plaintext bytes to decrypt, or None for the rest
+            read_ahead: Overrides ``config.read_ahead`` when given
+
+        Returns:
+            The manifest of the TDF
+
+        Raises:
+            SDK.RootSignatureValidationException: If the root signature does
+                not match the segment hashes
+            SDK.SegmentSignatureMismatch: If a segment does not match its hash
+
+        """
+        layout = self._read_layout(source)
+        # Start the KAS rewrap and let the first segments download meanwhile
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="tdf-rewrap") as ex:
+            key = ex.submit(
+                contextvars.copy_context().run,
+                self._unwrap_and_verify,
+                layout.manifest,
+                config,
+            )
+            self._decrypt_layout(
+                source,
+                layout,
+                key,
+                output_stream,
+                offset,
+                length,
+                config.read_ahead if read_ahead is None else read_ahead,
+                config.coalesce_bytes,
+            )
+        return layout.manifest
+
+    def open_tdf(
+        self,
+        source: TDFSource,
+        config: TDFReaderConfig,
+        cache_segments: int = 4,
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    ) -> io.BufferedReader:
+        """Open a TDF as a seekable, read-only binary file of its plaintext.
+
+        The key is unwrapped up front; segments are then fetched and
+        decrypted on demand as the file is read, with the most recently used
+        ``cache_segments`` decrypted segments kept in memory.
+
+        Args:
+            source: TDF as a RangeSource, bytes, a file path or a seekable
+                binary file object
+            config: TDFReaderConfig with optional private key for local unwrapping
+            cache_segments: Number of decrypted segments to cache
+            buffer_size: Buffer size of the returned BufferedReader
+
+        Returns:
+            A BufferedReader over a TDFPlaintextReader; closing it closes any
+            source opened here
+
+        """
+        from otdf_python.tdf_plaintext_reader import TDFPlaintextReader
+
+        source, owned, layout, key = self._prepare_read(source, config)
+        raw = TDFPlaintextReader(
+            source, layout, key, cache_segments=cache_segments, close_source=owned
+        )
+        return io.BufferedReader(raw, buffer_size=buffer_size)
+
+    def read_tdf_pipeline(
+        self,
+        documents: Iterable[tuple[TDFSource, BinaryIO]],
+        config: TDFReaderConfig,
+        lookahead: int = 2,
+    ) -> Iterator[Manifest]:
+        """Decrypt a sequence of TDFs, unwrapping keys ahead of decryption.
+
+        While one document is being fetched and decrypted, the manifests of
+        the next ``lookahead`` documents are read and their keys unwrapped on
+        a thread pool, so KAS round trips overlap with payload I/O and
+        throughput is bound by the slowest stage instead of their sum.
+        Documents are written and yielded strictly in input order.
+
+        Args:
+            documents: ``(source, output_stream)`` pairs; sources given as
+                bytes, paths or file objects are closed once decrypted
+            config: TDFReaderConfig shared by all documents
+            lookahead: Number of documents to unwrap keys for in advance
+
+        Yields:
+            The manifest of each document once it has been written
+
+        """
+        documents = iter(documents)
+        pending: deque[tuple[Future, BinaryIO]] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=max(lookahead, 1), thread_name_prefix="tdf-rewrap"
+        )
+
+        def _fill(limit: int):
+            while len(pending) < limit:
+                document = next(documents, None)
+                if document is None:
+                    return
+                source, output_stream = document
+                pending.append(
+                    (
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            self._prepare_read,
+                            source,
+                            config,
+                        ),
+                        output_stream,
                     )
+                )
 
-                key = self._unwrap_key_with_kas(
-                    key_access_objs,
-                    manifest.encryptionInformation.policy,  # Changed field name
+        try:
+            # The current document plus ``lookahead`` documents ahead of it
+            _fill(lookahead + 1)
+            while pending:
+                future, output_stream = pending.popleft()
+                source, owned, layout, key = future.result()
+                _fill(lookahead)
+                try:
+                    self._decrypt_layout(
+                        source,
+                        layout,
+                        key,
+                        output_stream,
+                        read_ahead=config.read_ahead,
+                        coalesce_bytes=config.coalesce_bytes,
+                    )
+                finally:
+                    if owned:
+                        source.close()
+                yield layout.manifest
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Close sources opened for documents that were never decrypted
+            for future, _ in pending:
+                if future.done() and not future.cancelled() and not future.exception():
+                    source, owned, _, _ = future.result()
+                    if owned:
+                        source.close()
+
+    def _prepare_read(
+        self, source: TDFSource, config: TDFReaderConfig
+    ) -> tuple[RangeSource, bool, _TDFLayout, bytes]:
+        """Open a document, read its layout and unwrap its payload key."""
+        source, owned = as_range_source(source)
+        try:
+            layout = self._read_layout(source)
+            return (
+                source,
+                owned,
+                layout,
+                self._unwrap_and_verify(layout.manifest, config),
+            )
+        except BaseException:
+            if owned:
+                source.close()
+            raise
+
+    def _read_layout(self, source: RangeSource) -> _TDFLayout:
+        """Read the manifest and locate the payload of a TDF in a range source."""
+        from otdf_python.zip_reader import ZipReader
+
+        zip_reader = ZipReader(RangeSourceFile(source))
+        manifest = Manifest.from_json(
+            zip_reader.read(TDFWriter.TDF_MANIFEST_FILE_NAME).decode()
+        )
+        payload_offset, payload_size = zip_reader.get_entry_range(
+            TDFWriter.TDF_PAYLOAD_FILE_NAME
+        )
+        return self._layout_from_manifest(manifest, payload_offset, payload_size)
+
+    def _layout_from_manifest(
+        self, manifest: Manifest, payload_offset: int, payload_size: int
+    ) -> _TDFLayout:
+        """Describe a payload of ``payload_size`` bytes at ``payload_offset``."""
+        if not manifest.encryptionInformation.integrityInformation:
+            raise ValueError("Missing integrity information in manifest")
+        integrity = manifest.encryptionInformation.integrityInformation
+        table = SegmentTable.from_segments(
+            integrity.segments, integrity.segmentSizeDefault
+        )
+        if table.total_encrypted_size > payload_size:
+            raise ValueError("Encrypted payload is shorter than the manifest")
+        return _TDFLayout(
+            manifest=manifest,
+            table=table,
+            payload_offset=payload_offset,
+            verify=(integrity.segmentHashAlg or "").upper() == "GMAC",
+            codec=self._segment_codec(manifest),
+            payload_size=payload_size,
+        )
+
+    @staticmethod
+    def _segment_codec(manifest: Manifest) -> SegmentCodec | None:
+        """Return the codec segments were compressed with, if any."""
+        method = manifest.encryptionInformation.method
+        compression = getattr(method, "compression", None)
+        return get_codec(compression) if compression else None
+
+    def _decrypt_layout(
+        self,
+        source: RangeSource,
+        layout: _TDFLayout,
+        key: bytes | Future,
+        output_stream: BinaryIO,
+        offset: int = 0,
+        length: int | None = None,
+        read_ahead: int = 0,
+        coalesce_bytes: int = 8 * 1024 * 1024,
+    ):
+        """Fetch, decrypt and write the segments covering a plaintext range.
+
+        ``key`` may be a future still being resolved; it is only waited on
+        once the first segment has been fetched.
+        """
+        table = layout.table
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        if length is None:
+            length = max(table.total_size - offset, 0)
+        indices = table.segments_for_range(offset, length)
+        if not indices:
+            if isinstance(key, Future):
+                key.result()
+            return
+
+        # One plaintext buffer, sized for the largest segment, is reused
+        max_encrypted = max(map(table.encrypted_segment_size, indices))
+        buffer = bytearray(
+            max(max_encrypted - AesGcm.GCM_NONCE_LENGTH - AesGcm.GCM_TAG_LENGTH, 0)
+        )
+        ranges = []
+        for index in indices:
+            start, end = table.encrypted_range(index)
+            ranges.append((layout.payload_offset + start, layout.payload_offset + end))
+        prefetcher = SegmentPrefetcher(
+            source, ranges, read_ahead=read_ahead, coalesce_bytes=coalesce_bytes
+        )
+        aesgcm = None
+        end_offset = offset + length
+        for index, encrypted_segment in zip(indices, prefetcher, strict=True):
+            if aesgcm is None:
+                try:
+                    aesgcm = AesGcm(key.result() if isinstance(key, Future) else key)
+                except BaseException:
+                    encrypted_segment.release()
+                    raise
+            size = self._decrypt_segment_into(
+                aesgcm,
+                table if layout.verify else None,
+                index,
+                encrypted_segment,
+                buffer,
+            )
+            plaintext = memoryview(buffer)[:size]
+            if layout.codec is not None:
+                plaintext = layout.codec.decompress(
+                    plaintext, table.segment_size(index)
                 )
+                size = len(plaintext)
+            # Trim the first and last segments to the requested range
+            segment_start = table.plaintext_offset(index)
+            lo = max(offset - segment_start, 0)
+            hi = min(end_offset - segment_start, size)
+            output_stream.write(plaintext[lo:hi])
+
+    @staticmethod
+    def _decrypt_segment_into(
+        aesgcm: AesGcm,
+        table: SegmentTable | None,
+        index: int,
+        encrypted_segment: memoryview,
+        out: bytearray,
+    ) -> int:
+        """Decrypt one IV + ciphertext segment into ``out``.
+
+        When a segment table is given, the segment's GMAC tag is checked
+        against the manifest hash first.
+
+        Raises:
+            SDK.SegmentSignatureMismatch: If the segment does not match its
+                hash or fails authentication
 
-            aesgcm = AesGcm(key)
-            if not manifest.encryptionInformation.integrityInformation:
+        """
+        from otdf_python.sdk import SDK
+
+        iv = encrypted_segment[: AesGcm.GCM_NONCE_LENGTH]
+        ciphertext = encrypted_segment[AesGcm.GCM_NONCE_LENGTH :]
+        try:
+            if table is not None and not table.verify_segment(index, encrypted_segment):
+                raise SDK.SegmentSignatureMismatch(f"segment {index} hash mismatch")
+            return aesgcm.decrypt_into(iv, ciphertext, out)
+        except InvalidTag as e:
+            raise SDK.SegmentSignatureMismatch(
+                f"segment {index} failed authentication"
+            ) from e
+        finally:
+            # Drop the exports so a mapped file can be closed even on errors
+            iv.release()
+            ciphertext.release()
+            encrypted_segment.release()
+
+    def rewrap_tdf(
+        self,
+        source: TDFSource,
+        kas_infos,
+        config: TDFReaderConfig,
+        output_stream: BinaryIO | None = None,
+        attributes: list[str] | None = None,
+        keep_existing: bool = False,
+        copy_chunk_size: int = 8 * 1024 * 1024,
+    ):
+        """Re-key a TDF for new KAS recipients without re-encrypting it.
+
+        The payload key is unwrapped once and wrapped again for each of
+        ``kas_infos``. The encrypted ``0.payload`` bytes are copied verbatim
+        into the new TDF, so segment hashes, the root signature and any
+        assertions stay valid and the cost is dominated by the copy.
+
+        Args:
+            source: TDF as a RangeSource, bytes, a file path or a seekable
+                binary file object
+            kas_infos: KASInfo (or list of KASInfo) to wrap the key for;
+                missing public keys are fetched from KAS
+            config: TDFReaderConfig used to unwrap the existing key
+            output_stream: Optional output stream, creates new BytesIO if not provided
+            attributes: Replaces the policy data attributes when given
+            keep_existing: Keep the existing key access objects alongside
+                the new ones (adding recipients); not possible when the
+                key is split
+            copy_chunk_size: Size of the reads used to copy the payload
+
+        Returns:
+            Tuple of (manifest, size, output_stream)
+
+        Raises:
+            ValueError: If existing recipients are kept for a split key
+
+        """
+        if output_stream is None:
+            output_stream = io.BytesIO()
+        source, owned = as_range_source(source)
+        try:
+            layout = self._read_layout(source)
+            manifest = layout.manifest
+            enc_info = manifest.encryptionInformation
+            if keep_existing and any(ka.sid for ka in enc_info.keyAccess):
+                # Existing recipients only hold shares of a split key
+                raise ValueError("Cannot keep the recipients of a TDF with a split key")
+            key = self._unwrap_payload_key(manifest, config)
+
+            policy_json = base64.b64decode(enc_info.policy).decode("utf-8")
+            if attributes is not None:
+                policy_json = self._replace_policy_attributes(policy_json, attributes)
+                enc_info.policy = base64.b64encode(policy_json.encode()).decode()
+
+            key_access_objs = []
+            if keep_existing:
+                for ka in enc_info.keyAccess:
+                    # Existing wrapped keys stay valid; only the binding
+                    # depends on the policy
+                    ka.policyBinding = self._policy_binding(key, policy_json)
+                    key_access_objs.append(ka)
+            key_access_objs += self._wrap_key_for_kas(
+                key, self._validate_kas_infos(kas_infos), policy_json
+            )
+            enc_info.keyAccess = key_access_objs
+
+            writer = TDFWriter(output_stream)
+            payload_size = layout.payload_size
+            with writer.payload(payload_size) as f:
+                for start in range(0, payload_size, copy_chunk_size):
+                    length = min(copy_chunk_size, payload_size - start)
+                    data = source.read_range(layout.payload_offset + start, length)
+                    if len(data) != length:
+                        raise ValueError("Encrypted payload is truncated")
+                    f.write(data)
+            writer.append_manifest(manifest.to_json())
+            size = writer.finish()
+        finally:
+            if owned:
+                source.close()
+        return manifest, size, output_stream
+
+    def update_tdf(
+        self,
+        target: str | os.PathLike | BinaryIO,
+        config: TDFReaderConfig,
+        append: bytes | bytearray | memoryview | BinaryIO | None = None,
+        replace: dict[int, bytes] | None = None,
+        assertion_signing_keys: dict[str, AssertionKey] | None = None,
+    ) -> Manifest:
+        """Append segments to, or replace segments of, an existing TDF in place.
+
+        New and replaced segments are encrypted under the existing payload
+        key with fresh IVs. Unchanged ciphertext is neither read nor
+        rewritten: the root signature is recomputed from the segment tags
+        in the manifest, and only the replaced segments, the appended data,
+        the manifest and the ZIP central directory are written. A short last
+        segment is re-encrypted together with the first appended bytes, so
+        segments keep the default size.
+
+        The update is not atomic; an interrupted update leaves the TDF
+        unreadable.
+
+        Args:
+            target: Path of the TDF, or a readable, writable and seekable
+                binary file object holding it
+            config: TDFReaderConfig used to unwrap the payload key
+            append: Plaintext to append, as a bytes-like object or stream
+            replace: New plaintext by segment index; each replacement must
+                have the size of the segment it replaces
+            assertion_signing_keys: Keys to re-sign assertions with, by
+                assertion id; assertions signed with HS256 are re-signed with
+                the payload key by default, others need a key here
+
+        Returns:
+            The updated manifest
+
+        Raises:
+            ValueError: If the TDF cannot be updated, a replacement does not
+                fit its segment, or an assertion not signed with HS256 has no
+                signing key
+            SDK.RootSignatureValidationException: If the root signature does
+                not match the segment hashes; nothing is written
+            SDK.SegmentSignatureMismatch: If a segment read back for the
+                update does not match its hash
+
+        """
+        with contextlib.ExitStack() as stack:
+            if isinstance(target, str | os.PathLike):
+                target = stack.enter_context(Path(target).open("r+b"))
+            updater = ZipEntryUpdater(
+                target,
+                TDFWriter.TDF_PAYLOAD_FILE_NAME,
+                TDFWriter.TDF_MANIFEST_FILE_NAME,
+            )
+            stack.callback(updater.close)
+            manifest = Manifest.from_json(updater.read_trailing().decode())
+            integrity = manifest.encryptionInformation.integrityInformation
+            if not integrity:
                 raise ValueError("Missing integrity information in manifest")
-            segments = (
-                manifest.encryptionInformation.integrityInformation.segments
-            )  # Changed field name
-            encrypted_payload = z.read("0.payload")
-            payload = self._decrypt_segments(aesgcm, segments, encrypted_payload)
-            return TDFReader(payload=payload, manifest=manifest)
+            if (integrity.segmentHashAlg or "").upper() != "GMAC":
+                raise ValueError("Only TDFs with GMAC segment hashes can be updated")
+            table = SegmentTable.from_segments(
+                integrity.segments, integrity.segmentSizeDefault
+            )
+            if table.total_encrypted_size != updater.size:
+                raise ValueError("Encrypted payload does not match the manifest")
+            segment_size = integrity.segmentSizeDefault or self.SEGMENT_SIZE
+
+            # Checks the root signature, so re-signing cannot launder a
+            # manifest tampered with earlier
+            key = self._unwrap_and_verify(manifest, config)
+            signing_keys = self._assertion_resigning_keys(
+                manifest, key, assertion_signing_keys or {}
+            )
+            aesgcm = AesGcm(key)
+            codec = self._segment_codec(manifest)
+
+            self._replace_segments(updater, table, aesgcm, codec, replace or {})
+            if append is not None:
+                self._append_segments(
+                    updater, table, aesgcm, codec, append, segment_size
+                )
+
+            aggregate_hash = table.aggregate_hash()
+            root_sig_raw = hmac.new(key, aggregate_hash, hashlib.sha256).digest()
+            integrity.rootSignature = ManifestRootSignature(
+                alg="HS256", sig=base64.b64encode(root_sig_raw).decode()
+            )
+            integrity.segments = table
+            for assertion in manifest.assertions or []:
+                sign_assertion(assertion, aggregate_hash, signing_keys[assertion.id])
+            updater.finish(manifest.to_json().encode("utf-8"))
+        return manifest
+
+    @staticmethod
+    def _assertion_resigning_keys(
+        manifest: Manifest, key: bytes, signing_keys: dict[str, AssertionKey]
+    ) -> dict[str, AssertionKey]:
+        """Return the key to re-sign each assertion of a manifest with, by id.
+
+        Assertions without a given key are re-signed with HS256 and the
+        payload key, which is only allowed if they were signed that way.
+
+        Raises:
+            ValueError: If an assertion not signed with HS256 has no key
+
+        """
+        keys = {}
+        for assertion in manifest.assertions or []:
+            signing_key = signing_keys.get(assertion.id)
+            if signing_key is None:
+                algorithm = binding_algorithm(assertion)
+                if algorithm != "HS256":
+                    raise ValueError(
+                        f"Assertion {assertion.id} is signed with {algorithm}; "
+                        "pass its signing key in assertion_signing_keys"
+                    )
+                signing_key = AssertionKey(AssertionKeyAlg.HS256, key)
+            keys[assertion.id] = signing_key
+        return keys
+
+    @staticmethod
+    def _replace_segments(
+        updater: ZipEntryUpdater,
+        table: SegmentTable,
+        aesgcm: AesGcm,
+        codec: SegmentCodec | None,
+        replace: dict[int, bytes],
+    ):
+        """Re-encrypt segments in place; each must keep its encrypted size."""
+        for index, plaintext in sorted(replace.items()):
+            if not 0 <= index < len(table):
+                raise ValueError(f"Segment index {index} out of range")
+            with memoryview(plaintext) as view:
+                if view.nbytes != table.segment_size(index):
+                    raise ValueError(
+                        f"Replacement for segment {index} must be "
+                        f"{table.segment_size(index)} bytes"
+                    )
+                data = codec.compress(view) if codec else view
+                encrypted = aesgcm.encrypt(data).as_bytes()
+            if len(encrypted) != table.encrypted_segment_size(index):
+                raise ValueError(
+                    f"Replacement for segment {index} changes its encrypted size"
+                )
+            updater.write(table.encrypted_offset(index), encrypted)
+            table.replace_tag(index, encrypted[-SegmentTable.TAG_LENGTH :])
+
+    def _append_segments(
+        self,
+        updater: ZipEntryUpdater,
+        table: SegmentTable,
+        aesgcm: AesGcm,
+        codec: SegmentCodec | None,
+        append,
+        segment_size: int,
+    ):
+        """Encrypt and append segments, topping up a short last segment."""
+        from otdf_python.sdk import SDK
+
+        position = table.total_encrypted_size
+        chunks = self._plaintext_segments(append, segment_size)
+        last = len(table) - 1
+        # Compressed segments have no fixed size to top up to
+        if codec is None and last >= 0 and table.segment_size(last) < segment_size:
+            position, end = table.encrypted_range(last)
+            encrypted = updater.read(position, end - position)
+            if not table.verify_segment(last, encrypted):
+                raise SDK.SegmentSignatureMismatch(f"segment {last} hash mismatch")
+            head = aesgcm.decrypt(
+                aesgcm.Encrypted(
+                    encrypted[: AesGcm.GCM_NONCE_LENGTH],
+                    encrypted[AesGcm.GCM_NONCE_LENGTH :],
+                )
+            )
+            chunks = self._topped_up_segments(head, append, segment_size)
+            table.truncate(last)
+        for chunk in chunks:
+            data = codec.compress(chunk) if codec else chunk
+            encrypted = aesgcm.encrypt(data).as_bytes()
+            updater.write(position, encrypted)
+            position += len(encrypted)
+            table.append(
+                len(chunk), len(encrypted), encrypted[-SegmentTable.TAG_LENGTH :]
+            )
+
+    @classmethod
+    def _topped_up_segments(
+        cls, head: bytes, payload, segment_size: int
+    ) -> Iterator[bytes | memoryview]:
+        """Yield segments of ``payload`` with ``head`` prepended to the first."""
+        need = segment_size - len(head)
+        first = next(cls._plaintext_segments(payload, need), None)
+        if first is None:
+            yield head
+            return
+        yield head + bytes(first)
+        if len(first) < need:
+            return
+        if hasattr(payload, "read"):
+            yield from cls._plaintext_segments(payload, segment_size)
+        else:
+            with memoryview(payload) as view:
+                rest = view.cast("B")[need:]
+                yield from cls._plaintext_segments(rest, segment_size)
+
+    def _replace_policy_attributes(self, policy_json: str, attributes: list[str]):
+        """Return a policy JSON with its data attributes replaced."""
+        import json
+
+        from otdf_python.policy_object import AttributeObject
+
+        policy = json.loads(policy_json)
+        body = policy.setdefault("body", {})
+        body["dataAttributes"] = [
+            self._serialize_policy_object(AttributeObject(attribute=a))
+            for a in attributes
+        ] or None
+        return json.dumps(policy)
+
+    def inspect_tdf(self, source: TDFSource) -> TDFInspection:
+        """Read the manifest and policy of a TDF without touching the payload.
+
+        Only the ZIP end-of-central-directory, the central directory and the
+        ``0.manifest.json`` entry are read; no KAS calls are made.
+
+        Args:
+            source: TDF as bytes, a file path or a seekable binary file object
+
+        Returns:
+            TDFInspection with the manifest, policy, KAS URLs and segment stats
+
+        """
+        from otdf_python import tdf_reader
+
+        with _open_tdf_source(source) as f:
+            reader = tdf_reader.TDFReader(f)
+            manifest = Manifest.from_json(reader.manifest())
+            policy = reader.read_policy_object()
+
+        enc_info = manifest.encryptionInformation
+        if not enc_info or not enc_info.integrityInformation:
+            raise ValueError("Missing encryption information in manifest")
+        integrity = enc_info.integrityInformation
+        segments = SegmentTable.from_segments(
+            integrity.segments, integrity.segmentSizeDefault
+        )
+        return TDFInspection(
+            manifest=manifest,
+            policy=policy,
+            attributes=[a.attribute for a in policy.body.data_attributes],
+            kas_urls=list(dict.fromkeys(ka.url for ka in enc_info.keyAccess)),
+            segment_count=len(segments),
+            plaintext_size=segments.total_size,
+            encrypted_size=segments.total_encrypted_size,
+            segment_size_default=integrity.segmentSizeDefault,
+        )
+
+    def verify_tdf(
+        self,
+        source: TDFSource,
+        config: TDFReaderConfig,
+        max_workers: int | None = None,
+        batch_bytes: int = 8 * 1024 * 1024,
+    ) -> TDFVerification:
+        """Check the integrity of a TDF without writing any plaintext.
+
+        The payload key is unwrapped, the assertions and the root signature
+        over the segment hashes are verified, and then every segment is
+        authenticated with AES-GCM (and compared with its manifest hash when
+        the TDF uses GMAC segment hashes). Segments are checked in batches
+        of up to ``batch_bytes`` on a thread pool; the first failure stops
+        the scan.
+
+        Args:
+            source: TDF as bytes, a file path, a seekable binary file object
+                or a RangeSource
+            config: TDFReaderConfig with optional private key for local unwrapping
+            max_workers: Number of threads checking segments
+            batch_bytes: Encrypted bytes read and checked per task
+
+        Returns:
+            TDFVerification with the manifest and the scan throughput
+
+        Raises:
+            SDK.RootSignatureValidationException: If the root signature does
+                not match the segment hashes
+            SDK.SegmentSignatureMismatch: If a segment is truncated, does not
+                match its hash or fails authentication
+            SDK.AssertionException: If an assertion fails verification
+
+        """
+        started = time.perf_counter()
+        source, owned = as_range_source(source)
+        try:
+            layout = self._read_layout(source)
+            key = self._unwrap_and_verify(layout.manifest, config)
+            self._verify_segments(source, layout, key, max_workers, batch_bytes)
+        finally:
+            if owned:
+                source.close()
+        return TDFVerification(
+            manifest=layout.manifest,
+            segment_count=len(layout.table),
+            encrypted_size=layout.table.total_encrypted_size,
+            elapsed=time.perf_counter() - started,
+        )
+
+    @staticmethod
+    def _verify_root_signature(manifest: Manifest, table: SegmentTable, key: bytes):
+        """Check the root signature, the HMAC of the concatenated segment hashes."""
+        from otdf_python.sdk import SDK
+
+        root_signature = (
+            manifest.encryptionInformation.integrityInformation.rootSignature
+        )
+        expected = hmac.new(key, table.aggregate_hash(), hashlib.sha256).digest()
+        recorded = base64.b64decode(root_signature.sig)
+        # Legacy (pre-4.3.0) TDFs record the hex encoding of the HMAC
+        if not (
+            hmac.compare_digest(recorded, expected)
+            or hmac.compare_digest(recorded, expected.hex().encode())
+        ):
+            raise SDK.RootSignatureValidationException("root signature mismatch")
+
+    def _verify_segments(
+        self,
+        source: RangeSource,
+        layout: _TDFLayout,
+        key: bytes,
+        max_workers: int | None,
+        batch_bytes: int,
+    ):
+        """Authenticate all segments on a thread pool, stopping at the first failure."""
+        table = layout.table
+        batches = []
+        first = 0
+        while first < len(table):
+            begin = table.encrypted_range(first)[0]
+            stop = first + 1
+            while (
+                stop < len(table)
+                and table.encrypted_range(stop)[1] - begin <= batch_bytes
+            ):
+                stop += 1
+            batches.append((first, stop))
+            first = stop
+
+        aesgcm = AesGcm(key)
+        aborted = threading.Event()
+        scratch = threading.local()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tdf-verify"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._verify_segment_batch,
+                    source,
+                    layout,
+                    aesgcm,
+                    first,
+                    stop,
+                    aborted,
+                    scratch,
+                )
+                for first, stop in batches
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                aborted.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+    @staticmethod
+    def _verify_segment_batch(
+        source: RangeSource,
+        layout: _TDFLayout,
+        aesgcm: AesGcm,
+        first: int,
+        stop: int,
+        aborted: threading.Event,
+        scratch: threading.local,
+    ):
+        """Authenticate the contiguous segments ``first`` to ``stop - 1``."""
+        from otdf_python.sdk import SDK
+
+        if aborted.is_set():
+            return
+        table = layout.table
+        begin = table.encrypted_range(first)[0]
+        end = table.encrypted_range(stop - 1)[1]
+        data = memoryview(source.read_range(layout.payload_offset + begin, end - begin))
+        if len(data) < end - begin:
+            raise SDK.SegmentSignatureMismatch(f"segment {stop - 1} is truncated")
+        # Plaintext is decrypted into a per-thread buffer and discarded
+        largest = max(map(table.encrypted_segment_size, range(first, stop)))
+        buffer = getattr(scratch, "buffer", None)
+        if buffer is None or len(buffer) < largest:
+            buffer = scratch.buffer = bytearray(largest)
+        for index in range(first, stop):
+            if aborted.is_set():
+                return
+            start, end = table.encrypted_range(index)
+            segment = data[start - begin : end - begin]
+            if layout.verify and not table.verify_segment(index, segment):
+                raise SDK.SegmentSignatureMismatch(f"segment {index} hash mismatch")
+            try:
+                aesgcm.decrypt_into(
+                    segment[: AesGcm.GCM_NONCE_LENGTH],
+                    segment[AesGcm.GCM_NONCE_LENGTH :],
+                    buffer,
+                )
+            except InvalidTag as e:
+                raise SDK.SegmentSignatureMismatch(
+                    f"segment {index} failed authentication"
+                ) from e
 
     def read_payload(
         self, tdf_bytes: bytes, config: dict, output_stream: BinaryIO
@@ -494,24 +2433,23 @@ class TDF:
             segments = (
                 manifest.encryptionInformation.integrityInformation.segments
             )  # Changed field names
-            encrypted_payload = z.read("0.payload")
-            offset = 0
-            for seg in segments:
-                enc_len = seg.encryptedSegmentSize  # Changed field name
-                enc_bytes = encrypted_payload[offset : offset + enc_len]
+            table = SegmentTable.from_segments(segments)
+            codec = self._segment_codec(manifest)
+            encrypted_payload = memoryview(z.read("0.payload"))
+            for index in range(len(table)):
+                start, end = table.encrypted_range(index)
+                enc_bytes = encrypted_payload[start:end]
                 # Integrity check using GMAC (last 16 bytes of encrypted segment)
                 # This matches how segments are hashed when segmentHashAlg is "GMAC"
-                gmac_length = 16  # kGMACPayloadLength from platform SDK
-                if len(enc_bytes) < gmac_length:
+                if len(enc_bytes) < SegmentTable.TAG_LENGTH:
                     raise ValueError(
                         "Encrypted segment too short for GMAC verification"
                     )
-                seg_hash_raw = enc_bytes[-gmac_length:]  # Take last 16 bytes
-                seg_hash = base64.b64encode(seg_hash_raw).decode()
-                if seg.hash != seg_hash:
+                if not table.verify_segment(index, enc_bytes):
                     raise ValueError("Segment signature mismatch")
                 iv = enc_bytes[: AesGcm.GCM_NONCE_LENGTH]
                 ct = enc_bytes[AesGcm.GCM_NONCE_LENGTH :]
                 pt = aesgcm.decrypt(aesgcm.Encrypted(iv, ct))
+                if codec is not None:
+                    pt = codec.decompress(pt, table.segment_size(index))
                 output_stream.write(pt)
-                offset += enc_len
@@ -0,0 +1,143 @@
+"""Seekable, read-only file object over the plaintext of a TDF."""
+
+import io
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from otdf_python.aesgcm import AesGcm
+from otdf_python.range_source import RangeSource
+
+if TYPE_CHECKING:
+    from otdf_python.tdf import _TDFLayout
+
+
+class TDFPlaintextReader(io.RawIOBase):
+    """Random-access plaintext view of a TDF, decrypting segments on demand.
+
+    Only the segments touched by ``read``/``readinto`` are fetched and
+    decrypted. The most recently used decrypted segments are kept in a small
+    LRU cache, so memory stays bounded by ``cache_segments`` times the
+    segment size regardless of the size of the TDF.
+
+    Instances are normally created through ``TDF.open_tdf``, which wraps them
+    in an ``io.BufferedReader``.
+    """
+
+    def __init__(
+        self,
+        source: RangeSource,
+        layout: "_TDFLayout",
+        key: bytes,
+        cache_segments: int = 4,
+        close_source: bool = False,
+    ):
+        """Initialize the reader.
+
+        Args:
+            source: RangeSource holding the TDF
+            layout: Manifest and payload location of the TDF
+            key: Unwrapped payload key
+            cache_segments: Number of decrypted segments kept in memory
+            close_source: Whether closing the reader closes the source
+
+        """
+        super().__init__()
+        self._source = source
+        self._layout = layout
+        self._table = layout.table
+        self._aesgcm = AesGcm(key)
+        self._cache: OrderedDict[int, bytes | bytearray] = OrderedDict()
+        self._cache_segments = max(cache_segments, 1)
+        self._close_source = close_source
+        self._position = 0
+
+    @property
+    def manifest(self):
+        """The manifest of the TDF."""
+        return self._layout.manifest
+
+    @property
+    def size(self) -> int:
+        """Total plaintext size in bytes."""
+        return self._table.total_size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if position < 0:
+            raise ValueError("negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        self._checkClosed()
+        out = memoryview(buffer).cast("B")
+        if not out or self._position >= self.size:
+            return 0
+        # Serve at most one segment per call so that buffered readers do not
+        # decrypt segments beyond the ones actually requested
+        index = self._table.find_segment(self._position)
+        plaintext = self._segment(index)
+        start = self._position - self._table.plaintext_offset(index)
+        n = min(len(plaintext) - start, len(out))
+        if n <= 0:
+            raise ValueError(f"Segment {index} is shorter than the manifest")
+        out[:n] = plaintext[start : start + n]
+        self._position += n
+        return n
+
+    def _segment(self, index: int) -> bytes | bytearray:
+        """Return the plaintext of a segment, decrypting it on a cache miss."""
+        plaintext = self._cache.get(index)
+        if plaintext is not None:
+            self._cache.move_to_end(index)
+            return plaintext
+
+        from otdf_python.tdf import TDF
+
+        start, end = self._table.encrypted_range(index)
+        offset = self._layout.payload_offset
+        encrypted = self._source.read_range(offset + start, end - start)
+        if len(encrypted) != end - start:
+            raise ValueError(f"Short read for segment {index}")
+        plaintext = bytearray(
+            max(end - start - AesGcm.GCM_NONCE_LENGTH - AesGcm.GCM_TAG_LENGTH, 0)
+        )
+        size = TDF._decrypt_segment_into(
+            self._aesgcm,
+            self._table if self._layout.verify else None,
+            index,
+            memoryview(encrypted),
+            plaintext,
+        )
+        if self._layout.codec is not None:
+            plaintext = self._layout.codec.decompress(
+                memoryview(plaintext)[:size], self._table.segment_size(index)
+            )
+        self._cache[index] = plaintext
+        if len(self._cache) > self._cache_segments:
+            self._cache.popitem(last=False)
+        return plaintext
+
+    def close(self):
+        if not self.closed:
+            self._cache.clear()
+            if self._close_source:
+                self._source.close()
+        super().close()
@@ -18,8 +18,8 @@ class TDFWriter:
     def append_manifest(self, manifest: str):
         self._zip_writer.data(self.TDF_MANIFEST_FILE_NAME, manifest.encode("utf-8"))
 
-    def payload(self):
-        return self._zip_writer.stream(self.TDF_PAYLOAD_FILE_NAME)
+    def payload(self, size_hint: int | None = None):
+        return self._zip_writer.stream(self.TDF_PAYLOAD_FILE_NAME, size_hint)
 
     def finish(self) -> int:
         return self._zip_writer.finish()
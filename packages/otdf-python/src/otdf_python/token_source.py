@@ -4,15 +4,31 @@ import time
 
 import httpx2 as httpx
 
+from otdf_python.retry import RetryBudget, RetryPolicy, http_request_with_retry
+
 
 class TokenSource:
     """OAuth2 token source for authentication."""
 
-    def __init__(self, token_url, client_id, client_secret):
-        """Initialize token source."""
+    def __init__(
+        self, token_url, client_id, client_secret, retry_policy=None, retry_budget=None
+    ):
+        """Initialize token source.
+
+        Args:
+            token_url: Token endpoint of the IdP
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            retry_policy: RetryPolicy with the timeout and retries of token
+                requests; defaults to RetryPolicy()
+            retry_budget: Optional RetryBudget shared with other clients
+
+        """
         self.token_url = token_url
         self.client_id = client_id
         self.client_secret = client_secret
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
         self._token = None
         self._expires_at = 0
 
@@ -20,8 +36,11 @@ class TokenSource:
         now = time.time()
         if self._token and now < self._expires_at - 60:
             return self._token
-        resp = httpx.post(
+        resp = http_request_with_retry(
+            httpx.post,
             self.token_url,
+            self.retry_policy,
+            self.retry_budget,
             data={
                 "grant_type": "client_credentials",
                 "client_id": self.client_id,
@@ -1,7 +1,11 @@
 """ZIP file reader for TDF operations."""
 
 import io
+import struct
 import zipfile
+import zlib
+from collections.abc import Iterator
+from typing import BinaryIO
 
 from otdf_python.invalid_zip_exception import InvalidZipException
 
@@ -9,6 +13,9 @@ from otdf_python.invalid_zip_exception import InvalidZipException
 class ZipReader:
     """ZIP file reader for reading TDF packages."""
 
+    LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+    LOCAL_FILE_HEADER_SIZE = 30
+
     class Entry:
         """ZIP file entry with data access."""
 
@@ -26,7 +33,7 @@ class ZipReader:
             except Exception as e:
                 raise InvalidZipException(f"Error reading entry data: {e}") from e
 
-    def __init__(self, in_stream: io.BytesIO | bytes | None = None):
+    def __init__(self, in_stream: BinaryIO | bytes | None = None):
         """Initialize ZIP reader."""
         try:
             if isinstance(in_stream, bytes):
@@ -51,5 +58,228 @@ class ZipReader:
     def read(self, name: str) -> bytes:
         return self.zipfile.read(name)
 
+    def get_entry_range(self, name: str) -> tuple[int, int]:
+        """Locate the raw data of a stored entry within the archive.
+
+        Uses the central directory entry and the local file header, so the
+        entry data itself is never read.
+
+        Args:
+            name: Name of the entry
+
+        Returns:
+            Tuple of (data offset, data size) in bytes from the archive start
+
+        Raises:
+            InvalidZipException: If the entry is compressed or the local
+                header is malformed
+
+        """
+        try:
+            info = self.zipfile.getinfo(name)
+        except KeyError as e:
+            raise InvalidZipException(f"Entry not found: {name}") from e
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise InvalidZipException(f"Entry is not stored uncompressed: {name}")
+
+        self.in_stream.seek(info.header_offset)
+        header = self.in_stream.read(self.LOCAL_FILE_HEADER_SIZE)
+        if (
+            len(header) != self.LOCAL_FILE_HEADER_SIZE
+            or header[:4] != self.LOCAL_FILE_HEADER_SIGNATURE
+        ):
+            raise InvalidZipException(f"Invalid local file header for {name}")
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        data_offset = (
+            info.header_offset
+            + self.LOCAL_FILE_HEADER_SIZE
+            + name_length
+            + extra_length
+        )
+        return data_offset, info.compress_size
+
     def close(self):
         self.zipfile.close()
+
+
+class StreamingZipReader:
+    """Sequential reader of the stored entries of a ZIP on a non-seekable stream.
+
+    Entries are read front to back from their local headers, so the archive
+    can come from a pipe or socket. Entries whose sizes are deferred to a
+    data descriptor are delimited by scanning for the descriptor signature;
+    a candidate only ends the entry when the descriptor's size and CRC match
+    the data read so far.
+    """
+
+    LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+    LOCAL_FILE_HEADER_SIZE = 30
+    DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+    # Central directory, ZIP64 end of central directory and end records
+    END_SIGNATURES = (b"PK\x01\x02", b"PK\x06\x06", b"PK\x05\x06")
+
+    _USE_DATA_DESCRIPTOR = 0x08
+    _ENCRYPTED = 0x01
+    _ZIP64_EXTRA_ID = 0x0001
+    _UINT32_MAX = 0xFFFFFFFF
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 1024 * 1024):
+        """Read from ``stream``, which is not closed by the reader."""
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Buffer at least ``size`` bytes; return False if the stream ends first."""
+        while len(self._buffer) < size and not self._eof:
+            chunk = self._stream.read(max(self._chunk_size, size - len(self._buffer)))
+            if chunk:
+                self._buffer += chunk
+            else:
+                self._eof = True
+        return len(self._buffer) >= size
+
+    def _take(self, size: int) -> bytes:
+        if not self._fill(size):
+            raise InvalidZipException("Unexpected end of ZIP stream")
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def entries(self) -> Iterator[tuple[str, Iterator[bytes]]]:
+        """Yield ``(name, data chunks)`` for each entry, in archive order.
+
+        The chunks of an entry must be consumed before advancing to the next
+        entry; whatever is left unread is skipped.
+
+        Raises:
+            InvalidZipException: If the stream is not a ZIP of stored entries,
+                is truncated, or an entry fails its CRC check
+
+        """
+        while True:
+            if not self._fill(4):
+                raise InvalidZipException(
+                    "ZIP stream ended before its central directory"
+                )
+            signature = bytes(self._buffer[:4])
+            if signature in self.END_SIGNATURES:
+                return
+            if signature != self.LOCAL_FILE_HEADER_SIGNATURE:
+                raise InvalidZipException("Invalid local file header in ZIP stream")
+            (
+                _signature,
+                _version,
+                flags,
+                method,
+                _time,
+                _date,
+                crc,
+                compressed_size,
+                _size,
+                name_length,
+                extra_length,
+            ) = struct.unpack("<4sHHHHHLLLHH", self._take(self.LOCAL_FILE_HEADER_SIZE))
+            name = self._take(name_length).decode("utf-8")
+            extra = self._take(extra_length)
+            if method != zipfile.ZIP_STORED or flags & self._ENCRYPTED:
+                raise InvalidZipException(f"Entry is not stored uncompressed: {name}")
+            zip64 = compressed_size == self._UINT32_MAX
+            if zip64:
+                compressed_size = self._zip64_size(extra, name)
+
+            if flags & self._USE_DATA_DESCRIPTOR and not compressed_size:
+                data = self._described_data(zip64)
+            else:
+                data = self._sized_data(compressed_size, crc, flags, zip64, name)
+            yield name, data
+            # Skip whatever the caller did not read
+            for _chunk in data:
+                pass
+
+    def _zip64_size(self, extra: bytes, name: str) -> int:
+        offset = 0
+        while offset + 4 <= len(extra):
+            header_id, length = struct.unpack_from("<HH", extra, offset)
+            if header_id == self._ZIP64_EXTRA_ID and length >= 16:
+                # Uncompressed size comes first, then the compressed size
+                return struct.unpack_from("<Q", extra, offset + 12)[0]
+            offset += 4 + length
+        raise InvalidZipException(f"Missing ZIP64 sizes for {name}")
+
+    def _sized_data(
+        self, size: int, crc: int, flags: int, zip64: bool, name: str
+    ) -> Iterator[bytes]:
+        actual_crc = 0
+        remaining = size
+        while remaining:
+            if not self._fill(1):
+                raise InvalidZipException(f"Unexpected end of ZIP stream in {name}")
+            chunk = self._take(min(remaining, len(self._buffer)))
+            actual_crc = zlib.crc32(chunk, actual_crc)
+            remaining -= len(chunk)
+            yield chunk
+        if flags & self._USE_DATA_DESCRIPTOR:
+            if self._fill(4) and self._buffer[:4] == self.DATA_DESCRIPTOR_SIGNATURE:
+                self._take(4)
+            (crc,) = struct.unpack("<L", self._take(4))
+            self._take(16 if zip64 else 8)
+        if actual_crc != crc:
+            raise InvalidZipException(f"CRC mismatch in ZIP entry {name}")
+
+    def _described_data(self, zip64: bool) -> Iterator[bytes]:
+        """Yield entry data up to a data descriptor that matches it."""
+        signature = self.DATA_DESCRIPTOR_SIGNATURE
+        # Try the layout announced by the local header first
+        layouts = ("<LQQ", "<LLL") if zip64 else ("<LLL", "<LQQ")
+        descriptor_size = len(signature) + struct.calcsize("<LQQ")
+        emitted = 0
+        crc = 0
+        search_from = 0
+        while True:
+            index = self._buffer.find(signature, search_from)
+            if index == -1:
+                # Keep a possible partial signature at the end of the buffer
+                keep = min(len(self._buffer), len(signature) - 1)
+                if len(self._buffer) > keep:
+                    chunk = self._take(len(self._buffer) - keep)
+                    crc = zlib.crc32(chunk, crc)
+                    emitted += len(chunk)
+                    yield chunk
+                search_from = 0
+                if not self._fill(len(self._buffer) + 1):
+                    raise InvalidZipException("ZIP entry has no data descriptor")
+                continue
+            self._fill(index + descriptor_size)
+            end = self._match_descriptor(index, emitted, crc, layouts)
+            if end is not None:
+                if index:
+                    yield self._take(index)
+                self._take(end - index)
+                return
+            search_from = index + 1
+
+    def _match_descriptor(
+        self, index: int, emitted: int, crc: int, layouts: tuple[str, ...]
+    ) -> int | None:
+        """Return the end of the data descriptor at ``index`` if it describes the data.
+
+        ``emitted`` bytes with CRC ``crc`` precede the buffer; the data would
+        end at ``index``.
+        """
+        data_crc = None
+        for layout in layouts:
+            end = index + len(self.DATA_DESCRIPTOR_SIGNATURE) + struct.calcsize(layout)
+            if len(self._buffer) < end:
+                continue
+            described_crc, compressed_size, size = struct.unpack(
+                layout, self._buffer[end - struct.calcsize(layout) : end]
+            )
+            if compressed_size != emitted + index or size != compressed_size:
+                continue
+            if data_crc is None:
+                data_crc = zlib.crc32(self._buffer[:index], crc)
+            if described_crc == data_crc:
+                return end
+        return None
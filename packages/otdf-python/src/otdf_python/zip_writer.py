@@ -1,19 +1,33 @@
 """ZIP file writer for TDF operations."""
 
 import io
+import struct
+import time
 import zipfile
 import zlib
+from typing import BinaryIO
+
+from otdf_python.invalid_zip_exception import InvalidZipException
+
+_LOCAL_HEADER_SIZE = 30
+_USE_DATA_DESCRIPTOR = 0x08
+_DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP64_VERSION = 45
+_DEFAULT_VERSION = 20
+_UINT32_MAX = 0xFFFFFFFF
 
 
 class FileInfo:
     """ZIP file metadata information."""
 
-    def __init__(self, name: str, crc: int, size: int, offset: int):
+    def __init__(self, name: str, crc: int, size: int, offset: int, flags: int = 0):
         """Initialize file info."""
         self.name = name
         self.crc = crc
         self.size = size
         self.offset = offset
+        self.flags = flags
 
 
 class ZipWriter:
@@ -28,11 +42,13 @@ class ZipWriter:
         self._file_infos: list[FileInfo] = []
         self._offsets: dict[str, int] = {}
 
-    def stream(self, name: str):
-        # Returns a writable file-like object for the given name, tracks offset
+    def stream(self, name: str, size_hint: int | None = None):
+        # Returns a writable file-like object for the given name, tracks offset.
+        # Data is streamed straight into the archive; when the final size is
+        # not known up front the entry is written with ZIP64 sizes.
         offset = self.out_stream.tell()
         self._offsets[name] = offset
-        return _TrackingWriter(self, name, offset)
+        return _TrackingWriter(self, name, offset, size_hint)
 
     def data(self, name: str, content: bytes):
         offset = self.out_stream.tell()
@@ -55,27 +71,514 @@ class ZipWriter:
 class _TrackingWriter(io.RawIOBase):
     """Internal ZIP stream writer with offset tracking."""
 
-    def __init__(self, zip_writer: ZipWriter, name: str, offset: int):
+    def __init__(
+        self,
+        zip_writer: ZipWriter,
+        name: str,
+        offset: int,
+        size_hint: int | None = None,
+    ):
         """Initialize tracking writer."""
         self._zip_writer = zip_writer
         self._name = name
         self._offset = offset
-        self._buffer = io.BytesIO()
+        # Same entry attributes as ZipFile.writestr
+        self._zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+        self._zinfo.compress_type = zipfile.ZIP_STORED
+        self._zinfo.external_attr = 0o600 << 16
+        self._zinfo.file_size = size_hint or 0
+        self._dest = zip_writer.zipfile.open(
+            self._zinfo, mode="w", force_zip64=size_hint is None
+        )
         self._closed = False
 
     def write(self, b):
-        return self._buffer.write(b)
+        return self._dest.write(b)
 
     def close(self):
         if not self._closed:
-            data = self._buffer.getvalue()
-            crc = zlib.crc32(data)
-            self._zip_writer.zipfile.writestr(self._name, data)
+            self._dest.close()
             self._zip_writer._file_infos.append(
-                FileInfo(self._name, crc, len(data), self._offset)
+                FileInfo(
+                    self._name, self._zinfo.CRC, self._zinfo.file_size, self._offset
+                )
             )
             self._closed = True
         super().close()
 
     def writable(self):
         return True
+
+
+def _gf2_times(matrix: list[int], vector: int) -> int:
+    result = 0
+    row = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[row]
+        vector >>= 1
+        row += 1
+    return result
+
+
+def _crc32_shift(crc: int, length: int) -> int:
+    """Advance the CRC-32 register ``crc`` over ``length`` zero bytes.
+
+    This is the linear operator of zlib's ``crc32_combine`` (which Python
+    does not expose): ``crc32(a + b) == _crc32_shift(crc32(a), len(b)) ^
+    crc32(b)``.
+    """
+    # Operator for one zero bit, squared up to one zero byte
+    op = [0xEDB88320] + [1 << n for n in range(31)]
+    for _ in range(3):
+        op = [_gf2_times(op, row) for row in op]
+    while length:
+        if length & 1:
+            crc = _gf2_times(op, crc)
+        length >>= 1
+        if length:
+            op = [_gf2_times(op, row) for row in op]
+    return crc
+
+
+class ZipEntryUpdater:
+    """Patch and grow a stored entry of an existing ZIP archive in place.
+
+    The entry may only be followed by one trailing entry (for a TDF, the
+    payload followed by its manifest). Data can be overwritten anywhere in
+    the entry or appended to it, growing it over the trailing entry, which
+    :meth:`finish` writes again along with the central directory. The CRC-32
+    is maintained from the written bytes and the bytes they replace, so
+    unchanged data is never read.
+    """
+
+    def __init__(self, stream: BinaryIO, name: str, trailing_name: str):
+        """Open the archive in ``stream``, which must be readable, writable and seekable.
+
+        Raises:
+            InvalidZipException: If the entries are missing, compressed or
+                not laid out as expected
+
+        """
+        self._stream = stream
+        try:
+            self._zipfile = zipfile.ZipFile(stream, mode="a")
+        except zipfile.BadZipFile as e:
+            raise InvalidZipException(f"Invalid ZIP file: {e}") from e
+        try:
+            self._locate(name, trailing_name)
+        except BaseException:
+            self._zipfile.close()
+            raise
+
+    def _locate(self, name: str, trailing_name: str):
+        try:
+            self._info = self._zipfile.getinfo(name)
+            self._trailing = self._zipfile.getinfo(trailing_name)
+        except KeyError as e:
+            raise InvalidZipException(f"Entry not found: {e}") from e
+        info = self._info
+        stream = self._stream
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise InvalidZipException(f"Entry is not stored uncompressed: {name}")
+        for other in self._zipfile.infolist():
+            if other is not self._trailing and other.header_offset > info.header_offset:
+                raise InvalidZipException(
+                    f"{name} must be followed only by {trailing_name}"
+                )
+
+        stream.seek(info.header_offset)
+        header = stream.read(_LOCAL_HEADER_SIZE)
+        if len(header) != _LOCAL_HEADER_SIZE or header[:4] != b"PK\x03\x04":
+            raise InvalidZipException(f"Invalid local file header for {name}")
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        extra = stream.read(name_length + extra_length)[name_length:]
+        extra_offset = info.header_offset + _LOCAL_HEADER_SIZE + name_length
+        self.data_offset = extra_offset + extra_length
+        self._zip64_sizes_offset = None
+        position = 0
+        while position + 4 <= len(extra):
+            field_id, field_size = struct.unpack_from("<HH", extra, position)
+            if field_id == _ZIP64_EXTRA_ID and field_size >= 16:
+                self._zip64_sizes_offset = extra_offset + position + 4
+            position += 4 + field_size
+
+        self.size = info.compress_size
+        self.crc = info.CRC
+        if self._trailing.header_offset < self.data_offset + self.size:
+            raise InvalidZipException(f"{trailing_name} must follow {name}")
+
+    def read_trailing(self) -> bytes:
+        """Return the current content of the trailing entry."""
+        return self._zipfile.read(self._trailing)
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Read ``length`` bytes at ``offset`` within the entry."""
+        self._stream.seek(self.data_offset + offset)
+        return self._stream.read(length)
+
+    def write(self, offset: int, data) -> None:
+        """Write ``data`` at ``offset`` within the entry, growing it as needed.
+
+        Args:
+            offset: Offset within the entry, at most its current size
+            data: Any bytes-like object
+
+        """
+        if not 0 <= offset <= self.size:
+            raise ValueError("offset is outside of the entry")
+        data = memoryview(data).cast("B")
+        overlap = min(len(data), self.size - offset)
+        if overlap:
+            # CRC-32 is affine, so the change of the region shifted over the
+            # bytes after it is the change of the whole entry
+            old = self.read(offset, overlap)
+            delta = zlib.crc32(old) ^ zlib.crc32(data[:overlap])
+            self.crc ^= _crc32_shift(delta, self.size - offset - overlap)
+        if overlap < len(data):
+            self.crc = zlib.crc32(data[overlap:], self.crc)
+            self.size += len(data) - overlap
+        self._stream.seek(self.data_offset + offset)
+        self._stream.write(data)
+
+    def finish(self, trailing_data: bytes) -> int:
+        """Write the trailing entry and central directory after the entry.
+
+        Returns:
+            Size of the archive
+
+        """
+        info = self._info
+        info.CRC = self.crc
+        info.file_size = info.compress_size = self.size
+        zip64_descriptor = self._patch_local_header()
+        end = self.data_offset + self.size
+        if info.flag_bits & _USE_DATA_DESCRIPTOR:
+            fmt = "<4sLQQ" if zip64_descriptor else "<4sLLL"
+            self._stream.seek(end)
+            self._stream.write(
+                struct.pack(
+                    fmt, _DATA_DESCRIPTOR_SIGNATURE, self.crc, self.size, self.size
+                )
+            )
+            end = self._stream.tell()
+
+        trailing = self._trailing
+        self._zipfile.filelist.remove(trailing)
+        del self._zipfile.NameToInfo[trailing.filename]
+        # New entries and the central directory are written from here on
+        self._zipfile.start_dir = end
+        zinfo = zipfile.ZipInfo(
+            trailing.filename, date_time=time.localtime(time.time())[:6]
+        )
+        zinfo.compress_type = zipfile.ZIP_STORED
+        zinfo.external_attr = trailing.external_attr or 0o600 << 16
+        self._zipfile.writestr(zinfo, trailing_data)
+        self._zipfile.close()
+        return self._stream.tell()
+
+    def _patch_local_header(self) -> bool:
+        """Record the new CRC and sizes in the local file header.
+
+        Returns:
+            Whether a data descriptor needs 64-bit sizes
+
+        """
+        info = self._info
+        stream = self._stream
+        if info.flag_bits & _USE_DATA_DESCRIPTOR:
+            return (
+                self._zip64_sizes_offset is not None or self.size > zipfile.ZIP64_LIMIT
+            )
+        if self._zip64_sizes_offset is not None:
+            stream.seek(info.header_offset + 14)
+            stream.write(struct.pack("<L", self.crc))
+            stream.seek(self._zip64_sizes_offset)
+            stream.write(struct.pack("<QQ", self.size, self.size))
+            return False
+        if self.size <= zipfile.ZIP64_LIMIT:
+            stream.seek(info.header_offset + 14)
+            stream.write(struct.pack("<LLL", self.crc, self.size, self.size))
+            return False
+        # The header has no room for 64-bit sizes; move them to a descriptor
+        info.flag_bits |= _USE_DATA_DESCRIPTOR
+        stream.seek(info.header_offset + 6)
+        stream.write(struct.pack("<H", info.flag_bits))
+        stream.seek(info.header_offset + 14)
+        stream.write(struct.pack("<LLL", 0, 0, 0))
+        return True
+
+    def close(self):
+        """Release the archive if :meth:`finish` was not called.
+
+        Data already written over the trailing entry is not restored, so an
+        archive that was grown without being finished is left unreadable.
+        """
+        self._zipfile.close()
+
+
+def _dos_date_time() -> tuple[int, int]:
+    year, month, day, hour, minute, second = time.localtime(time.time())[:6]
+    return (
+        (year - 1980) << 9 | month << 5 | day,
+        hour << 11 | minute << 5 | second // 2,
+    )
+
+
+def crc32_combine(crc1: int, crc2: int, len2: int) -> int:
+    """Return the CRC-32 of two concatenated blocks from their CRC-32s.
+
+    Args:
+        crc1: CRC-32 of the first block
+        crc2: CRC-32 of the second block
+        len2: Length of the second block
+
+    """
+    return _crc32_shift(crc1, len2) ^ crc2
+
+
+def zip64_local_header(name: str, data_descriptor: bool = False) -> bytes:
+    """Return the local header of a stored entry whose size is not known yet.
+
+    The header carries a ZIP64 extra field, so the entry data that follows
+    can grow past 4 GiB. With ``data_descriptor`` the CRC and sizes follow
+    the data instead, so the header never needs to be patched, which allows
+    it to be uploaded before the data is complete.
+    """
+    encoded = name.encode("utf-8")
+    dos_date, dos_time = _dos_date_time()
+    extra = struct.pack("<HHQQ", _ZIP64_EXTRA_ID, 16, 0, 0)
+    return (
+        struct.pack(
+            "<4sHHHHHLLLHH",
+            b"PK\x03\x04",
+            _ZIP64_VERSION,
+            _USE_DATA_DESCRIPTOR if data_descriptor else 0,
+            zipfile.ZIP_STORED,
+            dos_time,
+            dos_date,
+            0,
+            _UINT32_MAX,
+            _UINT32_MAX,
+            len(encoded),
+            len(extra),
+        )
+        + encoded
+        + extra
+    )
+
+
+def zip64_entry_tail(
+    name: str,
+    header_offset: int,
+    crc: int,
+    size: int,
+    trailing_name: str,
+    trailing_data: bytes,
+    data_descriptor: bool = False,
+) -> bytes:
+    """Return what follows the data of an entry begun with :func:`zip64_local_header`.
+
+    That is its data descriptor (when used), a trailing stored entry and the
+    central directory of the two entries.
+
+    Args:
+        name: Entry name
+        header_offset: Offset of the entry local header in the archive
+        crc: CRC-32 of the entry data
+        size: Size of the entry data
+        trailing_name: Name of the entry written after it
+        trailing_data: Content of that entry
+        data_descriptor: Whether the local header defers to a data descriptor
+
+    """
+    encoded = name.encode("utf-8")
+    data_end = header_offset + _LOCAL_HEADER_SIZE + len(encoded) + 20 + size
+    tail = io.BytesIO()
+    if data_descriptor:
+        tail.write(struct.pack("<4sLQQ", _DATA_DESCRIPTOR_SIGNATURE, crc, size, size))
+
+    trailing_offset = data_end + tail.tell()
+    trailing_encoded = trailing_name.encode("utf-8")
+    trailing_crc = zlib.crc32(trailing_data)
+    dos_date, dos_time = _dos_date_time()
+    tail.write(
+        struct.pack(
+            "<4sHHHHHLLLHH",
+            b"PK\x03\x04",
+            _DEFAULT_VERSION,
+            0,
+            zipfile.ZIP_STORED,
+            dos_time,
+            dos_date,
+            trailing_crc,
+            len(trailing_data),
+            len(trailing_data),
+            len(trailing_encoded),
+            0,
+        )
+    )
+    tail.write(trailing_encoded)
+    tail.write(trailing_data)
+
+    flags = _USE_DATA_DESCRIPTOR if data_descriptor else 0
+    _write_central_directory(
+        tail,
+        data_end,
+        [
+            FileInfo(name, crc, size, header_offset, flags),
+            FileInfo(trailing_name, trailing_crc, len(trailing_data), trailing_offset),
+        ],
+        (dos_date, dos_time),
+    )
+    return tail.getvalue()
+
+
+def start_zip64_entry(stream: BinaryIO, name: str) -> int:
+    """Write the local header of a stored entry whose size is not known yet.
+
+    The CRC and sizes are filled in by :func:`finish_zip64_entry`, possibly
+    from another process.
+
+    Returns:
+        Offset of the entry data
+
+    """
+    stream.write(zip64_local_header(name))
+    return stream.tell()
+
+
+def finish_zip64_entry(
+    stream: BinaryIO,
+    header_offset: int,
+    name: str,
+    crc: int,
+    size: int,
+    trailing_name: str,
+    trailing_data: bytes,
+) -> int:
+    """Complete an archive begun with :func:`start_zip64_entry`.
+
+    Records the CRC and size of the entry in its local header, then writes a
+    trailing stored entry and the central directory right after the entry
+    data, truncating anything beyond.
+
+    Args:
+        stream: Readable, writable and seekable stream holding the archive
+        header_offset: Offset of the entry local header
+        name: Entry name, as passed to :func:`start_zip64_entry`
+        crc: CRC-32 of the entry data
+        size: Size of the entry data
+        trailing_name: Name of the entry written after it
+        trailing_data: Content of that entry
+
+    Returns:
+        Size of the archive
+
+    """
+    encoded = name.encode("utf-8")
+    stream.seek(header_offset + 14)
+    stream.write(struct.pack("<L", crc))
+    stream.seek(header_offset + _LOCAL_HEADER_SIZE + len(encoded) + 4)
+    stream.write(struct.pack("<QQ", size, size))
+    stream.seek(header_offset + _LOCAL_HEADER_SIZE + len(encoded) + 20 + size)
+    stream.write(
+        zip64_entry_tail(name, header_offset, crc, size, trailing_name, trailing_data)
+    )
+    stream.truncate()
+    return stream.tell()
+
+
+def _write_central_directory(
+    stream: BinaryIO,
+    base_offset: int,
+    entries: list[FileInfo],
+    dos_date_time: tuple[int, int],
+):
+    """Write central directory records of stored entries.
+
+    ``base_offset`` is the archive offset of the start of ``stream``.
+    """
+    dos_date, dos_time = dos_date_time
+    directory_offset = base_offset + stream.tell()
+    for entry in entries:
+        encoded = entry.name.encode("utf-8")
+        zip64_fields = []
+        size = entry.size
+        offset = entry.offset
+        if size >= _UINT32_MAX:
+            zip64_fields += [size, size]
+            size = _UINT32_MAX
+        if offset >= _UINT32_MAX:
+            zip64_fields.append(offset)
+            offset = _UINT32_MAX
+        extra = (
+            struct.pack(
+                f"<HH{len(zip64_fields)}Q",
+                _ZIP64_EXTRA_ID,
+                8 * len(zip64_fields),
+                *zip64_fields,
+            )
+            if zip64_fields
+            else b""
+        )
+        version = _ZIP64_VERSION if zip64_fields else _DEFAULT_VERSION
+        stream.write(
+            struct.pack(
+                "<4sBBHHHHHLLLHHHHHLL",
+                b"PK\x01\x02",
+                version,
+                3,  # made on Unix, for the permission bits below
+                version,
+                entry.flags,
+                zipfile.ZIP_STORED,
+                dos_time,
+                dos_date,
+                entry.crc,
+                size,
+                size,
+                len(encoded),
+                len(extra),
+                0,
+                0,
+                0,
+                0o600 << 16,
+                offset,
+            )
+        )
+        stream.write(encoded + extra)
+
+    directory_end = base_offset + stream.tell()
+    directory_size = directory_end - directory_offset
+    if directory_offset >= _UINT32_MAX or directory_size >= _UINT32_MAX:
+        stream.write(
+            struct.pack(
+                "<4sQHHLLQQQQ",
+                b"PK\x06\x06",
+                44,
+                _ZIP64_VERSION,
+                _ZIP64_VERSION,
+                0,
+                0,
+                len(entries),
+                len(entries),
+                directory_size,
+                directory_offset,
+            )
+        )
+        stream.write(struct.pack("<4sLQL", b"PK\x06\x07", 0, directory_end, 1))
+        directory_offset = min(directory_offset, _UINT32_MAX)
+        directory_size = min(directory_size, _UINT32_MAX)
+    stream.write(
+        struct.pack(
+            "<4sHHHHLLH",
+            b"PK\x05\x06",
+            0,
+            0,
+            len(entries),
+            len(entries),
+            directory_size,
+            directory_offset,
+            0,
+        )
+    )
@@ -0,0 +1,9 @@
+import pytest
+
+from tests.mock_crypto import generate_rsa_keypair
+
+
+@pytest.fixture(scope="session")
+def kas_keys():
+    """Return the (private, public) PEM key pair of a stand-in KAS."""
+    return generate_rsa_keypair()
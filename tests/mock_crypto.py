@@ -1,5 +1,9 @@
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
+from otdf_python.config import KASInfo, TDFConfig
+from otdf_python.tdf import TDF
+
+KAS_URL = "https://kas.example.com"
 
 
 def generate_rsa_keypair():
@@ -33,3 +37,18 @@ def generate_rsa_keys():
         format=serialization.PublicFormat.SubjectPublicKeyInfo,
     ).decode()
     return private_key, public_key, private_pem, public_pem
+
+
+def tdf_config(kas_public_key, segment_size=1024, **kwargs):
+    """Return a TDFConfig wrapping keys for the stand-in KAS at KAS_URL."""
+    kas_info = KASInfo(url=KAS_URL, public_key=kas_public_key)
+    return TDFConfig(
+        kas_info_list=[kas_info], default_segment_size=segment_size, **kwargs
+    )
+
+
+def create_tdf(kas_public_key, payload, segment_size=1024, **kwargs) -> bytes:
+    """Encrypt payload into an in-memory TDF and return its bytes."""
+    config = tdf_config(kas_public_key, segment_size, **kwargs)
+    _manifest, _size, out = TDF().create_tdf(payload, config)
+    return out.getvalue()
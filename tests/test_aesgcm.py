@@ -24,6 +24,29 @@ class TestAesGcm(unittest.TestCase):
         )
         self.assertEqual(decrypted, data)
 
+    def test_decrypt_into_buffer(self):
+        aes = AesGcm(os.urandom(32))
+        encrypted = aes.encrypt(b"buffer data")
+        out = bytearray(64)
+        n = aes.decrypt_into(
+            memoryview(encrypted.iv), memoryview(encrypted.ciphertext), out
+        )
+        self.assertEqual(bytes(out[:n]), b"buffer data")
+
+    def test_encrypt_into_buffer(self):
+        aes = AesGcm(os.urandom(32))
+        plaintext = bytearray(b"zero copy data")
+        out = bytearray(64)
+        n = aes.encrypt_into(memoryview(plaintext), out)
+        self.assertEqual(
+            n, AesGcm.GCM_NONCE_LENGTH + len(plaintext) + AesGcm.GCM_TAG_LENGTH
+        )
+        encrypted = AesGcm.Encrypted(
+            bytes(out[: AesGcm.GCM_NONCE_LENGTH]),
+            bytes(out[AesGcm.GCM_NONCE_LENGTH : n]),
+        )
+        self.assertEqual(aes.decrypt(encrypted), plaintext)
+
     def test_invalid_key(self):
         with self.assertRaises(ValueError):
             AesGcm(b"")
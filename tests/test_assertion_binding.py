@@ -0,0 +1,142 @@
+"""Tests for signed TDF assertions."""
+
+import io
+import json
+import zipfile
+
+import pytest
+from otdf_python.assertion_config import (
+    AppliesToState,
+    AssertionConfig,
+    AssertionKey,
+    AssertionKeyAlg,
+    Scope,
+    Statement,
+    Type,
+)
+from otdf_python.range_source import BytesRangeSource
+from otdf_python.sdk import SDK
+from otdf_python.tdf import TDF, TDFReaderConfig
+
+from tests.mock_crypto import generate_rsa_keypair, tdf_config
+
+
+def _assertion(assertion_id="a1", signing_key=None):
+    return AssertionConfig(
+        id=assertion_id,
+        type=Type.HANDLING_ASSERTION,
+        scope=Scope.PAYLOAD,
+        applies_to_state=AppliesToState.ENCRYPTED,
+        statement=Statement(format="json", schema="urn:test", value='{"c":"secret"}'),
+        signing_key=signing_key,
+    )
+
+
+def _create(kas_public_key, assertions, payload=b"x" * 3000):
+    config = tdf_config(kas_public_key, assertions=assertions)
+    manifest, _size, out = TDF().create_tdf(payload, config)
+    return manifest, out.getvalue()
+
+
+def _rewrite_manifest(data: bytes, edit) -> bytes:
+    with zipfile.ZipFile(io.BytesIO(data)) as zin:
+        manifest = json.loads(zin.read("0.manifest.json"))
+        payload = zin.read("0.payload")
+    edit(manifest)
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w") as zout:
+        zout.writestr("0.payload", payload)
+        zout.writestr("0.manifest.json", json.dumps(manifest))
+    return out.getvalue()
+
+
+def test_assertions_signed_with_payload_key(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    manifest, data = _create(kas_public_key, [_assertion("a1"), _assertion("a2")])
+
+    assertions = json.loads(manifest.to_json())["assertions"]
+    assert [a["id"] for a in assertions] == ["a1", "a2"]
+    assert assertions[0]["appliesTo"] == "encrypted"
+    assert assertions[0]["binding"]["method"] == "jws"
+
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    assert TDF().load_tdf(data, config).payload == b"x" * 3000
+    out = io.BytesIO()
+    TDF().read_tdf_source(BytesRangeSource(data), out, config)
+    assert out.getvalue() == b"x" * 3000
+
+
+def test_tampered_statement_is_rejected(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    _manifest, data = _create(kas_public_key, [_assertion()])
+
+    def edit(manifest):
+        manifest["assertions"][0]["statement"]["value"] = '{"c":"public"}'
+
+    tampered = _rewrite_manifest(data, edit)
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    with pytest.raises(SDK.AssertionException, match="hash mismatch") as exc:
+        TDF().load_tdf(tampered, config)
+    assert exc.value.assertion_id == "a1"
+    with pytest.raises(SDK.AssertionException):
+        TDF().read_tdf_source(BytesRangeSource(tampered), io.BytesIO(), config)
+
+    config.verify_assertions = False
+    assert TDF().load_tdf(tampered, config).payload == b"x" * 3000
+
+
+def test_assertion_bound_to_segments(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    _manifest, data = _create(kas_public_key, [_assertion()])
+    _manifest, other = _create(kas_public_key, [])
+
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        assertions = json.loads(z.read("0.manifest.json"))["assertions"]
+
+    def edit(manifest):
+        manifest["assertions"] = assertions
+
+    # Assertions copied onto another payload do not verify
+    moved = _rewrite_manifest(other, edit)
+    with pytest.raises(SDK.AssertionException):
+        TDF().load_tdf(moved, TDFReaderConfig(kas_private_key=kas_private_key))
+
+
+def test_swapped_segments_are_rejected_when_loading(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    _manifest, data = _create(kas_public_key, [_assertion()])
+    with zipfile.ZipFile(io.BytesIO(data)) as zin:
+        manifest = zin.read("0.manifest.json")
+        payload = zin.read("0.payload")
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w") as zout:
+        zout.writestr("0.payload", payload[1052:2104] + payload[:1052] + payload[2104:])
+        zout.writestr("0.manifest.json", manifest)
+
+    # The assertion still matches the manifest, but the segments do not
+    with pytest.raises(SDK.SegmentSignatureMismatch):
+        TDF().load_tdf(out.getvalue(), TDFReaderConfig(kas_private_key=kas_private_key))
+
+
+def test_rs256_assertion_keys(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    signing_private, signing_public = generate_rsa_keypair()
+    signing_key = AssertionKey(AssertionKeyAlg.RS256, signing_private)
+    _manifest, data = _create(kas_public_key, [_assertion(signing_key=signing_key)])
+
+    config = TDFReaderConfig(
+        kas_private_key=kas_private_key,
+        assertion_verification_keys={
+            "a1": AssertionKey(AssertionKeyAlg.RS256, signing_public)
+        },
+    )
+    assert TDF().load_tdf(data, config).payload == b"x" * 3000
+
+    with pytest.raises(SDK.AssertionException, match="signature verification"):
+        TDF().load_tdf(data, TDFReaderConfig(kas_private_key=kas_private_key))
+
+
+def test_duplicate_assertion_ids(kas_keys):
+    _kas_private_key, kas_public_key = kas_keys
+    with pytest.raises(ValueError, match="Duplicate assertion id"):
+        _create(kas_public_key, [_assertion("a"), _assertion("a")])
@@ -0,0 +1,134 @@
+"""Tests for bulk encryption and decryption on a process pool."""
+
+import dataclasses
+import pickle
+import ssl
+
+from otdf_python.config import KASInfo, TDFConfig
+from otdf_python.kas_key_cache import KASKeyCache
+from otdf_python.sdk import SDK
+from otdf_python.sdk_builder import SDKBuilder
+from otdf_python.tdf import TDFReaderConfig
+
+from tests.mock_crypto import KAS_URL
+
+
+class _PublicKeyKAS:
+    def __init__(self, public_key):
+        self.public_key = public_key
+
+    def get_public_key(self, kas_info):
+        return dataclasses.replace(kas_info, public_key=self.public_key)
+
+
+class _CoordinatorServices(SDK.Services):
+    """Services whose KAS is only reachable from the coordinator."""
+
+    def __init__(self, public_key):
+        self._kas = _PublicKeyKAS(public_key)
+
+    def __getstate__(self):
+        # Workers get services that cannot reach a KAS
+        return {}
+
+    def __setstate__(self, state):
+        self._kas = None
+
+    def kas(self):
+        if self._kas is None:
+            raise AssertionError("Workers must not fetch KAS public keys")
+        return self._kas
+
+
+def _write_files(tmp_path, count):
+    sources = []
+    for i in range(count):
+        path = tmp_path / f"plain-{i}.txt"
+        path.write_bytes(b"file %d\n" % i * (i * 300 + 1))
+        sources.append(path)
+    return sources
+
+
+def test_encrypt_and_decrypt_many(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    sdk = SDK(services=_CoordinatorServices(kas_public_key))
+    sources = _write_files(tmp_path, 6)
+    config = TDFConfig(kas_info_list=[KASInfo(url=KAS_URL)], default_segment_size=1024)
+
+    encrypted = sdk.encrypt_many(
+        [(p, p.with_suffix(".tdf")) for p in sources],
+        config,
+        max_workers=2,
+        chunksize=2,
+    )
+    assert [r.ok for r in encrypted.items] == [True] * 6
+    assert [r.source for r in encrypted.items] == [str(p) for p in sources]
+    assert encrypted.stats.items == 6
+    assert encrypted.stats.input_bytes == sum(p.stat().st_size for p in sources)
+    assert encrypted.stats.output_bytes == sum(
+        p.with_suffix(".tdf").stat().st_size for p in sources
+    )
+    assert encrypted.stats.bytes_per_second > 0
+
+    decrypted = sdk.decrypt_many(
+        [(p.with_suffix(".tdf"), p.with_suffix(".out")) for p in sources],
+        TDFReaderConfig(kas_private_key=kas_private_key),
+        max_workers=2,
+    )
+    assert decrypted.failures == []
+    for p in sources:
+        assert p.with_suffix(".out").read_bytes() == p.read_bytes()
+
+
+def test_failures_are_reported_per_item(tmp_path, kas_keys):
+    _kas_private_key, kas_public_key = kas_keys
+    sdk = SDK(services=_CoordinatorServices(kas_public_key))
+    (source,) = _write_files(tmp_path, 1)
+    config = TDFConfig(kas_info_list=[KASInfo(url=KAS_URL, public_key=kas_public_key)])
+
+    result = sdk.encrypt_many(
+        [
+            (tmp_path / "missing.txt", tmp_path / "missing.tdf"),
+            (source, tmp_path / "ok.tdf"),
+        ],
+        config,
+        max_workers=1,
+    )
+    assert [r.ok for r in result.items] == [False, True]
+    assert "FileNotFoundError" in result.items[0].error
+    assert not (tmp_path / "missing.tdf").exists()
+    assert (tmp_path / "ok.tdf").exists()
+    assert result.stats.failed == 1
+    assert result.failures == [result.items[0]]
+
+
+def test_builder_and_key_cache_travel_to_workers(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    builder = (
+        SDKBuilder.new_builder()
+        .set_platform_endpoint("platform.example.com")
+        .bearer_token("token")
+    )
+    builder.ssl_context = ssl.create_default_context()
+    copy = pickle.loads(pickle.dumps(builder))
+    assert copy.platform_endpoint == "https://platform.example.com"
+    assert copy.auth_token == "token"
+
+    sdk = builder.build()
+    assert sdk.builder is builder
+    cache = sdk.services.kas_key_cache()
+    cache.store(KASInfo(url=KAS_URL, public_key="pem", algorithm="rsa:2048"))
+    warmed = KASKeyCache()
+    warmed.update(pickle.loads(pickle.dumps(cache.snapshot())))
+    assert warmed.get(KAS_URL, "rsa:2048").public_key == "pem"
+
+    # Workers build their SDK from the pickled builder
+    (source,) = _write_files(tmp_path, 1)
+    config = TDFConfig(kas_info_list=[KASInfo(url=KAS_URL, public_key=kas_public_key)])
+    assert sdk.encrypt_many([(source, tmp_path / "a.tdf")], config).failures == []
+    result = sdk.decrypt_many(
+        [(tmp_path / "a.tdf", tmp_path / "a.txt")],
+        TDFReaderConfig(kas_private_key=kas_private_key),
+    )
+    assert result.failures == []
+    assert (tmp_path / "a.txt").read_bytes() == source.read_bytes()
@@ -1,5 +1,6 @@
 """Test CLI functionality"""
 
+import json
 import subprocess
 import sys
 import tempfile
@@ -169,6 +170,34 @@ def test_cli_encrypt_invalid_creds_file(project_root):
         Path(creds_file).unlink()
 
 
+def test_cli_inspect_without_auth(project_root, tmp_path):
+    """Test that CLI inspect reads the manifest without credentials or KAS"""
+    from otdf_python.config import KASInfo, TDFConfig
+    from otdf_python.tdf import TDF
+
+    from tests.mock_crypto import generate_rsa_keypair
+
+    _private_key, public_key = generate_rsa_keypair()
+    config = TDFConfig(
+        kas_info_list=[KASInfo(url="https://kas.example.com", public_key=public_key)]
+    )
+    _manifest, _size, out = TDF().create_tdf(b"inspect me", config)
+    tdf_path = tmp_path / "inspect.tdf"
+    tdf_path.write_bytes(out.getvalue())
+
+    result = subprocess.run(
+        [sys.executable, "-m", "otdf_python", "inspect", str(tdf_path)],
+        capture_output=True,
+        text=True,
+        cwd=project_root,
+    )
+    assert result.returncode == 0
+    inspection = json.loads(result.stdout)
+    assert "encryptionInformation" in inspection["manifest"]
+    assert inspection["kasUrls"] == ["https://kas.example.com"]
+    assert inspection["segments"]["plaintextSize"] == len(b"inspect me")
+
+
 def test_cli_decrypt_missing_file(project_root):
     """Test that CLI decrypt fails gracefully with missing file"""
     result = subprocess.run(
@@ -181,5 +210,37 @@ def test_cli_decrypt_missing_file(project_root):
     assert "File does not exist" in result.stderr
 
 
+@pytest.mark.parametrize("to_file", [True, False], ids=["output_file", "stdout"])
+def test_cli_decrypt_releases_no_plaintext_on_failure(tmp_path, capsysbinary, to_file):
+    """Test that a decrypt failing on a later segment writes no plaintext"""
+    from unittest.mock import MagicMock, patch
+
+    from otdf_python.cli import cmd_decrypt
+    from otdf_python.sdk import SDK
+
+    tdf_path = tmp_path / "input.tdf"
+    tdf_path.write_bytes(b"PK\x03\x04")
+    output_path = tmp_path / "plain.txt"
+    output_path.write_bytes(b"previous")
+
+    def read_tdf_file(_path, output):
+        output.write(b"first segment")
+        raise SDK.SegmentSignatureMismatch("segment 1 does not match its hash")
+
+    sdk = MagicMock()
+    sdk.read_tdf_file.side_effect = read_tdf_file
+    args = MagicMock(file=str(tdf_path), output=str(output_path) if to_file else None)
+    with (
+        patch("otdf_python.cli.build_sdk", return_value=sdk),
+        pytest.raises(SDK.SegmentSignatureMismatch),
+    ):
+        cmd_decrypt(args)
+
+    assert capsysbinary.readouterr().out == b""
+    assert output_path.read_bytes() == b"previous"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["input.tdf", "plain.txt"]
+    sdk.close.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,93 @@
+"""Tests for per-segment payload compression."""
+
+import io
+import json
+import os
+import struct
+import zipfile
+
+import pytest
+from otdf_python.compression import available_codecs, get_codec
+from otdf_python.range_source import BytesRangeSource
+from otdf_python.tdf import TDF, TDFReaderConfig
+
+from tests.mock_crypto import tdf_config
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codec_roundtrip(name):
+    codec = get_codec(name)
+    data = b"log line 42: all good\n" * 500
+    compressed = codec.compress(memoryview(data))
+    assert len(compressed) < len(data)
+    assert codec.decompress(compressed, len(data)) == data
+
+
+def test_decompress_checks_recorded_size():
+    codec = get_codec("zlib")
+    compressed = codec.compress(b"x" * 100)
+    with pytest.raises(ValueError, match="larger than recorded"):
+        codec.decompress(compressed, 50)
+    with pytest.raises(ValueError, match="expected 200"):
+        codec.decompress(compressed, 200)
+    with pytest.raises(ValueError):
+        codec.decompress(b"not zlib", 10)
+
+
+def test_unknown_codec():
+    assert "zlib" in available_codecs()
+    with pytest.raises(ValueError, match="Unsupported"):
+        get_codec("brotli")
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_compressed_tdf_roundtrip(kas_keys, name):
+    kas_private_key, kas_public_key = kas_keys
+    payload = b"".join(
+        json.dumps({"id": i, "status": "ok"}).encode() + b"\n" for i in range(2000)
+    )
+    plain = tdf_config(kas_public_key, segment_size=4096)
+    compressed = tdf_config(kas_public_key, segment_size=4096, compression=name)
+
+    _m, plain_size, _out = TDF().create_tdf(payload, plain)
+    manifest, size, out = TDF().create_tdf(payload, compressed)
+    assert size < plain_size // 2
+    assert manifest.encryptionInformation.method.compression == name
+    assert json.loads(manifest.to_json())["encryptionInformation"]["method"][
+        "compression"
+    ] == (name)
+
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    data = out.getvalue()
+    assert TDF().load_tdf(data, config).payload == payload
+
+    # Segments stay independently decodable for range reads
+    ranged = io.BytesIO()
+    TDF().read_tdf_source(
+        BytesRangeSource(data), ranged, config, offset=10000, length=5000
+    )
+    assert ranged.getvalue() == payload[10000:15000]
+    with TDF().open_tdf(data, config) as f:
+        f.seek(30000)
+        assert f.read(100) == payload[30000:30100]
+
+
+def test_incompressible_payload(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    config = tdf_config(kas_public_key, compression="zlib")
+    payload = os.urandom(5000)
+
+    _manifest, _size, out = TDF().create_tdf(payload, config)
+    reader = TDF().load_tdf(
+        out.getvalue(), TDFReaderConfig(kas_private_key=kas_private_key)
+    )
+    assert reader.payload == payload
+
+    # The compressed size is unknown up front, so the payload entry gets a
+    # ZIP64 local header rather than one sized from the plaintext
+    data = out.getvalue()
+    info = zipfile.ZipFile(io.BytesIO(data)).getinfo("0.payload")
+    header = info.header_offset
+    name_length, extra_length = struct.unpack_from("<HH", data, header + 26)
+    extra = data[header + 30 + name_length :][:extra_length]
+    assert extra[:2] == struct.pack("<H", 0x0001)
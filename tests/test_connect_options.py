@@ -0,0 +1,146 @@
+"""Tests for the codec and compression options of Connect RPCs."""
+
+import importlib.util
+import threading
+from socketserver import ThreadingMixIn
+from unittest.mock import MagicMock, patch
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import pytest
+from connectrpc.compression.gzip import GzipCompression
+from otdf_python.config import KASInfo
+from otdf_python.connect_options import ConnectOptions, connect_compression
+from otdf_python.kas_connect_rpc_client import KASConnectRPCClient
+from otdf_python.sdk_builder import SDKBuilder
+from otdf_python_proto.kas import kas_pb2
+from otdf_python_proto.kas.kas_connect import (
+    AccessServiceClientSync,
+    AccessServiceSync,
+    AccessServiceWSGIApplication,
+)
+
+
+class _AccessService(AccessServiceSync):
+    def rewrap(self, request, ctx):
+        return kas_pb2.RewrapResponse(
+            entity_wrapped_key=b"k" * 256, session_public_key="PEM " * 256
+        )
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def kas_url():
+    """Serve a stand-in KAS, recording the encoding headers of each call."""
+    app = AccessServiceWSGIApplication(_AccessService())
+    calls = []
+
+    def recording_app(environ, start_response):
+        def recording_start_response(status, headers, exc_info=None):
+            calls.append(
+                (
+                    environ.get("HTTP_CONTENT_ENCODING"),
+                    environ.get("HTTP_ACCEPT_ENCODING"),
+                    dict(headers).get("content-encoding"),
+                )
+            )
+            return start_response(status, headers, exc_info)
+
+        return app(environ, recording_start_response)
+
+    server = make_server(
+        "127.0.0.1",
+        0,
+        recording_app,
+        server_class=_ThreadingWSGIServer,
+        handler_class=_QuietHandler,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/kas", calls
+    server.shutdown()
+    server.server_close()
+
+
+def test_connect_compression():
+    assert isinstance(connect_compression("GZIP"), GzipCompression)
+    with pytest.raises(ValueError, match="Unsupported Connect compression"):
+        connect_compression("lzma")
+    if importlib.util.find_spec("zstandard") is None:
+        with pytest.raises(ValueError, match="zstandard"):
+            ConnectOptions(accept_compression=("zstd", "gzip"))
+
+
+def test_client_is_created_once_per_base_url():
+    options = ConnectOptions(send_compression=None, read_max_bytes=1 << 20)
+    with (
+        patch(
+            "otdf_python.kas_connect_rpc_client.AccessServiceClientSync"
+        ) as client_class,
+        KASConnectRPCClient(use_plaintext=True, options=options) as client,
+    ):
+        client_class.return_value.public_key.return_value = MagicMock(
+            public_key="pem", kid="k1"
+        )
+        for url in ("http://a/kas", "http://a/kas", "http://b/kas"):
+            client.get_public_key(url, KASInfo(url=url))
+
+    assert [c.kwargs["address"] for c in client_class.call_args_list] == [
+        "http://a",
+        "http://b",
+    ]
+    kwargs = client_class.call_args.kwargs
+    assert kwargs["send_compression"] is None
+    assert kwargs["read_max_bytes"] == 1 << 20
+    assert kwargs["proto_json"] is False
+    assert [c.name() for c in kwargs["accept_compression"]] == ["gzip"]
+
+
+def test_compression_is_negotiated_on_the_wire(kas_url):
+    url, calls = kas_url
+    with KASConnectRPCClient(use_plaintext=True) as client:
+        assert client.unwrap_key(url, KASInfo(url=url), "token") == b"k" * 256
+    uncompressed = ConnectOptions(send_compression=None, accept_compression=())
+    with KASConnectRPCClient(use_plaintext=True, options=uncompressed) as client:
+        assert client.unwrap_key(url, KASInfo(url=url), "token") == b"k" * 256
+
+    (sent, accepted, answered), (plain_sent, plain_accepted, plain_answered) = calls
+    assert (sent, answered) == ("gzip", "gzip")
+    assert "gzip" in accepted
+    assert plain_sent in (None, "identity")
+    assert "gzip" not in (plain_accepted or "")
+    assert plain_answered in (None, "identity")
+
+
+def test_kas_clients_of_an_sdk_share_one_rpc_client(kas_url):
+    url, calls = kas_url
+    options = ConnectOptions(accept_compression=())
+    services = (
+        SDKBuilder()
+        .set_platform_endpoint("http://localhost:8080")
+        .use_insecure_plaintext_connection(True)
+        .with_connect_options(options)
+        ._create_services()
+    )
+    with patch(
+        "otdf_python.kas_connect_rpc_client.AccessServiceClientSync",
+        wraps=AccessServiceClientSync,
+    ) as client_class:
+        for _ in range(3):
+            with services.kas() as kas:
+                rpc_client = kas._kas_client.connect_rpc_client
+                assert rpc_client.options is options
+                rpc_client.unwrap_key(url, KASInfo(url=url), "token")
+
+    # One Connect client, reused by every KAS client and not closed by them
+    assert client_class.call_count == 1
+    assert len(calls) == 3
+    assert rpc_client._http_client is not None
+    services.close()
+    assert rpc_client._http_client is None
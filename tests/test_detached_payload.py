@@ -0,0 +1,111 @@
+"""Tests for TDFs with a detached payload."""
+
+import base64
+import io
+import json
+import os
+
+import pytest
+from otdf_python.detached_payload import LocalPayloadStorage
+from otdf_python.range_source import RangeSource
+from otdf_python.sdk import SDK
+from otdf_python.tdf import TDF, TDFReaderConfig
+
+from tests.mock_crypto import tdf_config
+
+
+class _CountingStorage(LocalPayloadStorage):
+    """Local storage recording the ranges read from payload objects."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.reads = []
+
+    def open(self, url):
+        source = super().open(url)
+        reads = self.reads
+
+        class _Counting(RangeSource):
+            def size(self):
+                return source.size()
+
+            def read_range(self, offset, length):
+                reads.append((offset, length))
+                return source.read_range(offset, length)
+
+            def close(self):
+                source.close()
+
+        return _Counting()
+
+
+def test_detached_roundtrip(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    storage = LocalPayloadStorage(tmp_path)
+    payload = os.urandom(5000)
+
+    manifest, size = TDF().create_detached_tdf(
+        payload, tdf_config(kas_public_key), storage, "objects/data.bin"
+    )
+
+    raw = (tmp_path / "objects" / "data.bin").read_bytes()
+    assert len(raw) == size == 5000 + 5 * 28
+    stored = json.loads((tmp_path / "objects" / "data.bin.manifest.json").read_text())
+    assert stored["payload"] == {
+        "type": "reference",
+        "url": "objects/data.bin",
+        "protocol": "file",
+        "mimeType": "application/octet-stream",
+        "isEncrypted": True,
+    }
+    # Segments are stored back to back without ZIP framing
+    tags = [
+        s.hash for s in manifest.encryptionInformation.integrityInformation.segments
+    ]
+    assert raw[1024 + 28 - 16 : 1024 + 28] == base64.b64decode(tags[0])
+
+    out = io.BytesIO()
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    TDF().read_detached_tdf("objects/data.bin.manifest.json", out, config, storage)
+    assert out.getvalue() == payload
+
+
+def test_detached_compressed_with_file_urls(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    storage = _CountingStorage(tmp_path / "unused-root")
+    payload_url = (tmp_path / "payload.bin").as_uri()
+    manifest_url = (tmp_path / "manifest.json").as_uri()
+    payload = b"row,value\n" * 2000
+    sdk = SDK(services=None)
+
+    _manifest, size = sdk.create_detached_tdf(
+        payload,
+        tdf_config(kas_public_key, compression="zlib"),
+        storage,
+        payload_url,
+        manifest_url,
+    )
+    assert size < len(payload)
+
+    out = io.BytesIO()
+    sdk.read_detached_tdf(
+        manifest_url, out, storage, TDFReaderConfig(kas_private_key=kas_private_key)
+    )
+    assert out.getvalue() == payload
+    # Only the manifest and the payload object were read, with range reads
+    assert storage.reads[0][0] == 0
+    assert sum(length for _offset, length in storage.reads[1:]) == size
+
+
+def test_zip_manifest_is_not_detached(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    manifest, _size, _out = TDF().create_tdf(b"data", tdf_config(kas_public_key))
+    with pytest.raises(ValueError, match="not detached"):
+        TDF().read_detached_tdf(
+            manifest,
+            io.BytesIO(),
+            TDFReaderConfig(kas_private_key=kas_private_key),
+            LocalPayloadStorage(),
+        )
+    with pytest.raises(ValueError, match="Unsupported URL"):
+        LocalPayloadStorage().path("s3://bucket/key")
@@ -0,0 +1,105 @@
+"""Tests for distributed TDF encryption."""
+
+import io
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from otdf_python.distributed_encryption import encrypt_part, split_parts
+from otdf_python.tdf import TDF, TDFReaderConfig
+
+from tests.mock_crypto import tdf_config
+
+
+def test_split_parts_are_segment_aligned():
+    parts = split_parts(10_000, 1024, 3000)
+    assert [(p.offset, p.size) for p in parts] == [
+        (0, 3072),
+        (3072, 3072),
+        (6144, 3072),
+        (9216, 784),
+    ]
+    assert split_parts(0, 1024, 3000) == []
+
+
+def test_encrypt_distributed_on_process_pool(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = os.urandom(50_000)
+    source = tmp_path / "plain.bin"
+    source.write_bytes(payload)
+    output = tmp_path / "out.tdf"
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        manifest, size = TDF().encrypt_distributed(
+            source,
+            tdf_config(kas_public_key),
+            output,
+            part_size=8192,
+            executor=executor,
+        )
+
+    assert size == output.stat().st_size
+    assert len(manifest.encryptionInformation.integrityInformation.segments) == 49
+    with zipfile.ZipFile(output) as z:
+        assert z.testzip() is None
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    assert TDF().load_tdf(output.read_bytes(), config).payload == payload
+
+
+def test_encrypt_distributed_compressed(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = b"".join(b"record %d\n" % i for i in range(5000))
+    source = tmp_path / "plain.txt"
+    source.write_bytes(payload)
+    output = tmp_path / "out.tdf"
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        TDF().encrypt_distributed(
+            source,
+            tdf_config(kas_public_key, compression="zlib"),
+            output,
+            part_size=4096,
+            executor=executor,
+        )
+
+    assert output.stat().st_size < len(payload)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.tdf", "plain.txt"]
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    assert TDF().load_tdf(output.read_bytes(), config).payload == payload
+
+
+def test_parts_stitch_as_multipart_layout(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = os.urandom(7000)
+    config = tdf_config(kas_public_key)
+    plan = TDF().plan_encryption(config, len(payload), part_size=2048)
+
+    blobs = {}
+    results = []
+    # Parts can be encrypted in any order, e.g. by independent nodes
+    for index in reversed(range(len(plan.parts))):
+        blobs[index] = io.BytesIO()
+        results.append(encrypt_part(plan, index, io.BytesIO(payload), blobs[index]))
+
+    with pytest.raises(ValueError, match="every part"):
+        TDF().finalize_encryption(plan, results[1:], config)
+    manifest, tail = TDF().finalize_encryption(plan, results, config)
+
+    tdf = plan.header + b"".join(blobs[i].getvalue() for i in range(len(blobs))) + tail
+    assert len(tdf) - len(tail) == plan.part_offset(0) + plan.payload_size
+    reader = TDF().load_tdf(tdf, TDFReaderConfig(kas_private_key=kas_private_key))
+    assert reader.payload == payload
+    assert reader.manifest.encryptionInformation.integrityInformation.rootSignature == (
+        manifest.encryptionInformation.integrityInformation.rootSignature
+    )
+
+
+def test_part_offsets_need_uncompressed_segments(kas_keys):
+    _kas_private_key, kas_public_key = kas_keys
+    plan = TDF().plan_encryption(
+        tdf_config(kas_public_key, compression="zlib"), 5000, part_size=2048
+    )
+    assert plan.payload_size is None
+    with pytest.raises(ValueError, match="compression"):
+        plan.part_offset(1)
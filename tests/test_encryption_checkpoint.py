@@ -0,0 +1,153 @@
+"""Tests for resumable, checkpointed TDF encryption."""
+
+import io
+import os
+import zipfile
+
+import pytest
+from otdf_python.encryption_checkpoint import EncryptionCheckpoint
+from otdf_python.tdf import TDF, TDFReaderConfig
+
+from tests.mock_crypto import tdf_config
+
+
+class _Crash(Exception):
+    pass
+
+
+class _CrashingReader(io.BytesIO):
+    """Plaintext stream that fails once ``limit`` bytes have been read."""
+
+    def __init__(self, data: bytes, limit: int):
+        super().__init__(data)
+        self.limit = limit
+        self.bytes_read = 0
+
+    def readinto(self, b):
+        if self.bytes_read >= self.limit:
+            raise _Crash
+        n = super().readinto(b)
+        self.bytes_read += n
+        return n
+
+
+def test_resume_after_crash(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = os.urandom(20 * 1024 + 100)
+    output = tmp_path / "big.tdf"
+    checkpoint = tmp_path / "big.tdf.checkpoint"
+    config = tdf_config(kas_public_key)
+
+    with pytest.raises(_Crash):
+        TDF().create_tdf_resumable(
+            _CrashingReader(payload, 11 * 1024),
+            config,
+            output,
+            checkpoint_interval=4,
+        )
+    # Eight segments were checkpointed; the next three are discarded
+    assert EncryptionCheckpoint.load(checkpoint).plaintext_offset == 8 * 1024
+
+    reader = _CrashingReader(payload, len(payload))
+    reader_config = TDFReaderConfig(kas_private_key=kas_private_key)
+    manifest, size = TDF().create_tdf_resumable(
+        reader, config, output, reader_config=reader_config, checkpoint_interval=4
+    )
+    assert reader.bytes_read == len(payload) - 8 * 1024
+    assert not checkpoint.exists()
+    assert size == output.stat().st_size
+    assert len(manifest.encryptionInformation.integrityInformation.segments) == 21
+
+    with zipfile.ZipFile(output) as z:
+        assert z.testzip() is None
+    assert TDF().load_tdf(output.read_bytes(), reader_config).payload == payload
+
+
+def test_torn_checkpoint_is_ignored(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = os.urandom(10 * 1024)
+    source = tmp_path / "plain.bin"
+    source.write_bytes(payload)
+    output = tmp_path / "out.tdf"
+    config = tdf_config(kas_public_key, compression="zlib")
+
+    with pytest.raises(_Crash):
+        TDF().create_tdf_resumable(
+            _CrashingReader(payload, 7 * 1024), config, output, checkpoint_interval=2
+        )
+    checkpoint = tmp_path / "out.tdf.checkpoint"
+    with checkpoint.open("a") as f:
+        f.write('{"segments": [[1024')
+    assert EncryptionCheckpoint.load(checkpoint).plaintext_offset == 6 * 1024
+
+    reader_config = TDFReaderConfig(kas_private_key=kas_private_key)
+    TDF().create_tdf_resumable(source, config, output, reader_config=reader_config)
+    assert TDF().load_tdf(output.read_bytes(), reader_config).payload == payload
+
+
+def test_resume_rejects_different_config(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = os.urandom(5000)
+    output = tmp_path / "out.tdf"
+
+    with pytest.raises(_Crash):
+        TDF().create_tdf_resumable(
+            _CrashingReader(payload, 3000),
+            tdf_config(kas_public_key),
+            output,
+            checkpoint_interval=1,
+        )
+    config = tdf_config(kas_public_key, compression="zlib")
+    with pytest.raises(ValueError, match="does not match"):
+        TDF().create_tdf_resumable(
+            io.BytesIO(payload),
+            config,
+            output,
+            reader_config=TDFReaderConfig(kas_private_key=kas_private_key),
+        )
+
+
+def test_resume_after_crash_before_first_checkpoint(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = os.urandom(6000)
+    output = tmp_path / "out.tdf"
+    config = tdf_config(kas_public_key)
+
+    with pytest.raises(_Crash):
+        TDF().create_tdf_resumable(
+            _CrashingReader(payload, 2 * 1024), config, output, checkpoint_interval=4
+        )
+    assert EncryptionCheckpoint.load(f"{output}.checkpoint").payload_size == 0
+    # The output did not reach the disk, but the sidecar did
+    output.write_bytes(b"")
+
+    reader_config = TDFReaderConfig(kas_private_key=kas_private_key)
+    TDF().create_tdf_resumable(
+        io.BytesIO(payload), config, output, reader_config=reader_config
+    )
+    assert TDF().load_tdf(output.read_bytes(), reader_config).payload == payload
+
+
+def test_resume_rejects_missing_or_short_output(tmp_path, kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = os.urandom(5000)
+    output = tmp_path / "out.tdf"
+    config = tdf_config(kas_public_key)
+    reader_config = TDFReaderConfig(kas_private_key=kas_private_key)
+
+    with pytest.raises(_Crash):
+        TDF().create_tdf_resumable(
+            _CrashingReader(payload, 3000), config, output, checkpoint_interval=1
+        )
+    checkpoint = EncryptionCheckpoint.load(f"{output}.checkpoint")
+    output.write_bytes(output.read_bytes()[: checkpoint.header["dataOffset"] + 100])
+    with pytest.raises(ValueError, match="does not match the output"):
+        TDF().create_tdf_resumable(
+            io.BytesIO(payload), config, output, reader_config=reader_config
+        )
+
+    output.unlink()
+    with pytest.raises(ValueError, match="does not match the output"):
+        TDF().create_tdf_resumable(
+            io.BytesIO(payload), config, output, reader_config=reader_config
+        )
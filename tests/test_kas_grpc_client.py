@@ -0,0 +1,175 @@
+"""Tests for the gRPC KAS transport and the shared gRPC channels."""
+
+import pickle
+import threading
+from concurrent import futures
+from unittest.mock import patch
+
+import grpc
+import pytest
+from otdf_python.config import KASInfo
+from otdf_python.grpc_channel_pool import GrpcChannelPool, grpc_target
+from otdf_python.kas_client import KASClient, KASTransport
+from otdf_python.kas_connect_rpc_client import KASConnectRPCClient
+from otdf_python.kas_grpc_client import KASGrpcClient
+from otdf_python.retry import RetryPolicy
+from otdf_python.sdk_builder import SDKBuilder
+from otdf_python.sdk_exceptions import AutoConfigureException, SDKException
+from otdf_python_proto.kas import kas_pb2
+from otdf_python_proto.legacy_grpc.kas import kas_pb2_grpc
+
+
+class _AccessService(kas_pb2_grpc.AccessServiceServicer):
+    """Stand-in KAS recording the metadata and peers of its calls."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.metadata = []
+        self.peers = set()
+        self.lock = threading.Lock()
+
+    def _record(self, context):
+        with self.lock:
+            self.metadata.append(dict(context.invocation_metadata()))
+            self.peers.add(context.peer())
+            if self.failures:
+                self.failures -= 1
+                context.abort(grpc.StatusCode.UNAVAILABLE, "try again")
+
+    def PublicKey(self, request, context):
+        self._record(context)
+        return kas_pb2.PublicKeyResponse(
+            public_key=f"key for {request.algorithm or 'rsa:2048'}", kid="k1"
+        )
+
+    def Rewrap(self, request, context):
+        self._record(context)
+        if request.signed_request_token == "denied":
+            context.abort(grpc.StatusCode.PERMISSION_DENIED, "forbidden")
+        return kas_pb2.RewrapResponse(
+            entity_wrapped_key=request.signed_request_token.encode()
+        )
+
+
+@pytest.fixture
+def kas_server():
+    def start(service):
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+        kas_pb2_grpc.add_AccessServiceServicer_to_server(service, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        servers.append(server)
+        return f"http://127.0.0.1:{port}/kas"
+
+    servers = []
+    yield start
+    for server in servers:
+        server.stop(None)
+
+
+def test_grpc_target():
+    assert grpc_target("https://kas.example.com/kas") == ("kas.example.com:443", False)
+    assert grpc_target("http://localhost:8080") == ("localhost:8080", True)
+    assert grpc_target("kas.example.com:9000", use_plaintext=True) == (
+        "kas.example.com:9000",
+        True,
+    )
+    assert grpc_target("https://[::1]:8443") == ("[::1]:8443", False)
+    with pytest.raises(ValueError, match="Invalid gRPC service URL"):
+        grpc_target("ftp://kas.example.com")
+
+
+def test_public_key_and_rewrap_share_one_connection(kas_server):
+    service = _AccessService()
+    url = kas_server(service)
+    pool = GrpcChannelPool()
+    client = KASGrpcClient(use_plaintext=True, channel_pool=pool)
+
+    info = client.get_public_key(url, KASInfo(url=url, algorithm="ec:secp256r1"), "t")
+    assert (info.public_key, info.kid) == ("key for ec:secp256r1", "k1")
+
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        keys = list(
+            executor.map(
+                lambda i: client.unwrap_key(url, KASInfo(url=url), f"token{i}", "t"),
+                range(32),
+            )
+        )
+    assert keys == [f"token{i}".encode() for i in range(32)]
+    assert len(pool) == 1
+    # Every call was multiplexed on the same connection
+    assert len(service.peers) == 1
+    assert all(m["authorization"] == "Bearer t" for m in service.metadata)
+
+    # The pool is shared, so closing the client leaves it open
+    client.close()
+    assert len(pool) == 1
+    pool.close()
+    assert len(pool) == 0
+
+
+def test_transient_errors_are_retried(kas_server):
+    service = _AccessService(failures=2)
+    url = kas_server(service)
+    client = KASGrpcClient(
+        use_plaintext=True,
+        retry_policy=RetryPolicy(max_attempts=3, initial_backoff=0.001),
+    )
+    with client:
+        assert client.unwrap_key(url, KASInfo(url=url), "token") == b"token"
+        assert len(service.metadata) == 3
+
+        with pytest.raises(SDKException, match="gRPC rewrap failed"):
+            client.unwrap_key(url, KASInfo(url=url), "denied")
+        # Permission errors are not retried
+        assert len(service.metadata) == 4
+
+
+def test_kas_client_selects_the_transport():
+    pool = GrpcChannelPool()
+    client = KASClient(transport="grpc", channel_pool=pool)
+    assert isinstance(client.connect_rpc_client, KASGrpcClient)
+    assert client.connect_rpc_client.channel_pool is pool
+    assert type(KASClient().connect_rpc_client) is KASConnectRPCClient
+    with pytest.raises(ValueError, match="Unsupported KAS transport"):
+        KASClient(transport="carrier-pigeon")
+    with pytest.raises(ValueError, match="verify_ssl=False"):
+        KASGrpcClient(verify_ssl=False)
+
+
+def test_builder_shares_the_channel_pool():
+    pool = GrpcChannelPool(keepalive_time=600.0)
+    builder = (
+        SDKBuilder()
+        .set_platform_endpoint("http://localhost:8080")
+        .use_insecure_plaintext_connection(True)
+        .with_kas_transport(KASTransport.GRPC, channel_pool=pool)
+    )
+    services = builder._create_services()
+    assert services.grpc_channel_pool() is pool
+    clients = [services.kas()._kas_client.connect_rpc_client for _ in range(2)]
+    assert all(client.channel_pool is pool for client in clients)
+    # The pool may be shared with other SDKs, so closing leaves it open
+    with patch.object(pool, "close") as close_pool:
+        services.close()
+    close_pool.assert_not_called()
+
+    restored = pickle.loads(pickle.dumps(builder))
+    assert restored._kas_transport is KASTransport.GRPC
+    assert restored._grpc_channel_pool.keepalive_time == 600.0
+
+    with pytest.raises(ValueError, match="Unsupported KAS transport"):
+        builder.with_kas_transport("smoke-signals")
+
+
+def test_build_rejects_grpc_without_tls_verification():
+    builder = (
+        SDKBuilder()
+        .set_platform_endpoint("https://platform.example.com")
+        .use_insecure_skip_verify(True)
+        .with_kas_transport("grpc")
+    )
+    with pytest.raises(AutoConfigureException, match="cannot skip TLS"):
+        builder.build()
+    # Plaintext connections have no certificates to verify
+    builder.use_insecure_plaintext_connection(True).build().close()
@@ -0,0 +1,72 @@
+"""Tests for KAS latency tracking and hedged requests."""
+
+import threading
+import time
+
+import pytest
+from otdf_python.kas_latency import KASLatencyTracker, hedged_call
+
+KAS_A = "https://kas-a.example.com"
+KAS_B = "https://kas-b.example.com"
+
+
+def test_tracker_ranks_and_hedges_by_history():
+    tracker = KASLatencyTracker(min_samples=3, default_delay=0.5)
+    assert tracker.rank([KAS_A, KAS_B]) == [KAS_A, KAS_B]
+    assert tracker.hedge_delay(KAS_A) == 0.5
+
+    for seconds in (0.2, 0.3, 0.4):
+        tracker.record(KAS_A, seconds)
+    tracker.record(KAS_B, 0.1)
+    assert tracker.rank([KAS_A, KAS_B]) == [KAS_B, KAS_A]
+    assert tracker.percentile(KAS_A, 0.95) == 0.4
+    assert tracker.hedge_delay(KAS_A) == 0.4
+    # Too few samples for B's own p95
+    assert tracker.hedge_delay(KAS_B) == 0.5
+
+    tracker.record_failure(KAS_B)
+    assert tracker.rank([KAS_A, KAS_B]) == [KAS_A, KAS_B]
+    tracker.record(KAS_B, 0.1)
+    assert tracker.rank([KAS_A, KAS_B]) == [KAS_B, KAS_A]
+
+
+def test_hedged_call_returns_first_success():
+    tracker = KASLatencyTracker(default_delay=0.05)
+    release = threading.Event()
+    started = []
+
+    def slow():
+        started.append(KAS_A)
+        release.wait(5)
+        return b"slow"
+
+    def fast():
+        started.append(KAS_B)
+        return b"fast"
+
+    try:
+        assert hedged_call([(KAS_A, slow), (KAS_B, fast)], tracker) == b"fast"
+    finally:
+        release.set()
+    assert started == [KAS_A, KAS_B]
+    assert tracker.percentile(KAS_B, 0.5) is not None
+
+    # B is now historically faster and is asked first, without hedging
+    started.clear()
+    assert hedged_call([(KAS_A, slow), (KAS_B, fast)], tracker) == b"fast"
+    assert started == [KAS_B]
+
+
+def test_hedged_call_fails_over_without_waiting():
+    tracker = KASLatencyTracker(default_delay=10)
+
+    def failing():
+        raise ConnectionError("unreachable")
+
+    started = time.perf_counter()
+    assert hedged_call([(KAS_A, failing), (KAS_B, lambda: b"key")], tracker) == (b"key")
+    assert time.perf_counter() - started < 5
+    assert tracker.rank([KAS_A, KAS_B]) == [KAS_B, KAS_A]
+
+    with pytest.raises(ConnectionError, match="unreachable"):
+        hedged_call([(KAS_A, failing), (KAS_B, failing)], tracker)
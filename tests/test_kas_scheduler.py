@@ -0,0 +1,236 @@
+"""Tests for the KAS concurrency limiter and priority lanes."""
+
+import functools
+import pickle
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from connectrpc.code import Code
+from connectrpc.errors import ConnectError
+from otdf_python.config import KASInfo
+from otdf_python.kas_connect_rpc_client import KASConnectRPCClient
+from otdf_python.kas_scheduler import (
+    AIMDLimit,
+    KASLane,
+    KASScheduler,
+    current_lane,
+    kas_lane,
+)
+from otdf_python.retry import deadline
+from otdf_python.sdk_exceptions import (
+    DeadlineExceededException,
+    KASOverloadedException,
+)
+
+KAS = "https://kas.example.com"
+
+
+def _fixed_limit(limit):
+    return functools.partial(AIMDLimit, initial=limit, minimum=limit, maximum=limit)
+
+
+class _Blocked:
+    """Requests that run in threads until released, recording their order."""
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.started = []
+        self.releases = {}
+        self.threads = []
+
+    def start(self, name, lane):
+        release = self.releases[name] = threading.Event()
+
+        def request():
+            self.started.append(name)
+            release.wait(5)
+
+        thread = threading.Thread(
+            target=self.scheduler.run, args=(KAS, request, lane), daemon=True
+        )
+        thread.start()
+        self.threads.append(thread)
+
+    def wait_for(self, in_flight, queued=0, started=None):
+        started = in_flight if started is None else started
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            stats = self.scheduler.stats(KAS)
+            if (
+                stats
+                and stats.in_flight == in_flight
+                and sum(stats.queued.values()) == queued
+                and len(self.started) == started
+            ):
+                return
+            time.sleep(0.001)
+        raise AssertionError("requests did not reach the expected state")
+
+    def finish(self):
+        for release in self.releases.values():
+            release.set()
+        for thread in self.threads:
+            thread.join(5)
+
+
+def test_aimd_limit_grows_under_load_and_backs_off():
+    limit = AIMDLimit(initial=4, maximum=8, backoff=0.5, tolerance=2.0)
+    limit.update(0.010, in_flight=3, failed=False)
+    assert limit.limit == pytest.approx(4.25)
+    assert limit.baseline == 0.010
+    # Barely used limits do not grow
+    limit.update(0.010, in_flight=0, failed=False)
+    assert limit.limit == pytest.approx(4.25)
+
+    limit.update(0.050, in_flight=3, failed=False)
+    assert limit.limit == pytest.approx(2.125)
+    limit.update(0.010, in_flight=0, failed=True)
+    assert limit.limit == pytest.approx(1.0625)
+    limit.update(0.010, in_flight=0, failed=True)
+    assert limit.limit == 1
+
+
+def test_interactive_requests_are_admitted_before_batch():
+    scheduler = KASScheduler(limit_factory=_fixed_limit(2), batch_share=1.0)
+    requests = _Blocked(scheduler)
+    try:
+        requests.start("batch-1", KASLane.BATCH)
+        requests.start("batch-2", KASLane.BATCH)
+        requests.wait_for(in_flight=2)
+        requests.start("batch-3", KASLane.BATCH)
+        requests.wait_for(in_flight=2, queued=1)
+        requests.start("interactive", KASLane.INTERACTIVE)
+        requests.wait_for(in_flight=2, queued=2)
+        # The freed slot goes to the interactive request queued last
+        requests.releases["batch-1"].set()
+        requests.wait_for(in_flight=2, queued=1, started=3)
+        assert requests.started[2] == "interactive"
+    finally:
+        requests.finish()
+    assert requests.started[3] == "batch-3"
+
+    stats = scheduler.stats(KAS)
+    assert stats.in_flight == 0
+    assert stats.lanes[KASLane.BATCH].admitted == 3
+    assert stats.lanes[KASLane.BATCH].finished == 3
+    assert stats.lanes[KASLane.INTERACTIVE].mean_queue_time > 0
+    assert stats.lanes[KASLane.INTERACTIVE].mean_service_time >= 0
+
+
+def test_batch_share_keeps_capacity_for_interactive_and_sheds_overflow():
+    scheduler = KASScheduler(
+        limit_factory=_fixed_limit(4),
+        batch_share=0.5,
+        max_queued={KASLane.INTERACTIVE: 8, KASLane.BATCH: 0},
+    )
+    requests = _Blocked(scheduler)
+    try:
+        requests.start("batch-1", KASLane.BATCH)
+        requests.start("batch-2", KASLane.BATCH)
+        requests.wait_for(in_flight=2)
+        with pytest.raises(KASOverloadedException, match="batch queue is full"):
+            scheduler.run(KAS, lambda: None, KASLane.BATCH)
+        # Interactive requests still get the rest of the limit
+        assert scheduler.run(KAS, lambda: "ok", KASLane.INTERACTIVE) == "ok"
+    finally:
+        requests.finish()
+    assert scheduler.stats(KAS).lanes[KASLane.BATCH].shed == 1
+
+
+def test_errors_count_and_lower_the_limit():
+    scheduler = KASScheduler(limit_factory=functools.partial(AIMDLimit, initial=8))
+
+    def failing():
+        raise ConnectionError("unreachable")
+
+    with pytest.raises(ConnectionError):
+        scheduler.run(KAS, failing)
+    stats = scheduler.stats(KAS)
+    assert stats.lanes[KASLane.INTERACTIVE].errors == 1
+    assert stats.limit < 8
+    assert scheduler.endpoints() == [KAS]
+
+    copy = pickle.loads(pickle.dumps(scheduler))
+    assert copy.batch_share == scheduler.batch_share
+    assert copy.endpoints() == []
+
+
+def test_only_overload_errors_lower_the_limit():
+    scheduler = KASScheduler(limit_factory=functools.partial(AIMDLimit, initial=8))
+
+    def overloaded(error):
+        return isinstance(error, ConnectionError)
+
+    def denied():
+        raise PermissionError("not entitled")
+
+    for _ in range(5):
+        with pytest.raises(PermissionError):
+            scheduler.run(KAS, denied, overloaded=overloaded)
+    stats = scheduler.stats(KAS)
+    assert stats.lanes[KASLane.INTERACTIVE].errors == 5
+    assert stats.limit == 8
+
+    def unreachable():
+        raise ConnectionError("unreachable")
+
+    with pytest.raises(ConnectionError):
+        scheduler.run(KAS, unreachable, overloaded=overloaded)
+    assert scheduler.stats(KAS).limit < 8
+
+
+@patch("otdf_python.kas_connect_rpc_client.AccessServiceClientSync")
+def test_denied_connect_rpcs_leave_the_limit(mock_access_service_client):
+    public_key = mock_access_service_client.return_value.public_key
+    public_key.side_effect = ConnectError(Code.PERMISSION_DENIED, "denied")
+    scheduler = KASScheduler(limit_factory=functools.partial(AIMDLimit, initial=8))
+    with KASConnectRPCClient(use_plaintext=True, scheduler=scheduler) as client:
+        for _ in range(3):
+            with pytest.raises(Exception, match="denied"):
+                client.get_public_key(
+                    "http://kas.example.com/kas",
+                    KASInfo(url="http://kas.example.com/kas"),
+                )
+    assert scheduler.stats("http://kas.example.com").limit == 8
+
+
+def test_lane_follows_the_context():
+    scheduler = KASScheduler()
+    assert current_lane() is KASLane.INTERACTIVE
+    with kas_lane(KASLane.BATCH):
+        assert current_lane() is KASLane.BATCH
+        scheduler.run(KAS, lambda: None)
+    assert current_lane() is KASLane.INTERACTIVE
+    assert scheduler.stats(KAS).lanes[KASLane.BATCH].admitted == 1
+
+
+@patch("otdf_python.kas_connect_rpc_client.AccessServiceClientSync")
+def test_connect_rpc_calls_go_through_the_scheduler(mock_access_service_client):
+    response = MagicMock(kid="kid", public_key="pem")
+    mock_access_service_client.return_value.public_key.return_value = response
+    scheduler = KASScheduler()
+    with KASConnectRPCClient(use_plaintext=True, scheduler=scheduler) as client:
+        result = client.get_public_key(
+            "http://kas.example.com/kas", KASInfo(url="http://kas.example.com/kas")
+        )
+    assert result.public_key == "pem"
+    stats = scheduler.stats("http://kas.example.com")
+    assert stats.lanes[KASLane.INTERACTIVE].finished == 1
+
+
+def test_queued_requests_give_up_at_the_deadline():
+    scheduler = KASScheduler(limit_factory=_fixed_limit(1))
+    requests = _Blocked(scheduler)
+    try:
+        requests.start("first", KASLane.INTERACTIVE)
+        requests.wait_for(in_flight=1)
+        with (
+            deadline(0.05),
+            pytest.raises(DeadlineExceededException, match="waiting for KAS"),
+        ):
+            scheduler.run(KAS, lambda: None)
+        assert scheduler.stats(KAS).queued[KASLane.INTERACTIVE] == 0
+    finally:
+        requests.finish()
@@ -0,0 +1,165 @@
+"""Tests for deadlines, retries and retry budgets."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx2 as httpx
+import pytest
+from connectrpc.code import Code
+from connectrpc.errors import ConnectError
+from otdf_python.config import KASInfo
+from otdf_python.kas_connect_rpc_client import KASConnectRPCClient
+from otdf_python.retry import (
+    RetryBudget,
+    RetryPolicy,
+    call_timeout,
+    call_with_retry,
+    deadline,
+    http_request_with_retry,
+    remaining_time,
+)
+from otdf_python.sdk_exceptions import DeadlineExceededException
+
+NO_BACKOFF = RetryPolicy(initial_backoff=0, timeout=5)
+
+
+class _Flaky:
+    """Fails ``failures`` times with ``error``, then returns ``"ok"``."""
+
+    def __init__(self, failures, error=None):
+        self.failures = failures
+        self.error = error or ConnectionError("unavailable")
+        self.timeouts = []
+
+    def __call__(self, timeout):
+        self.timeouts.append(timeout)
+        if len(self.timeouts) <= self.failures:
+            raise self.error
+        return "ok"
+
+
+def _transient(error):
+    return isinstance(error, ConnectionError)
+
+
+def test_deadlines_nest_and_cap_timeouts():
+    assert remaining_time() is None
+    assert call_timeout(30) == 30
+    with deadline(10):
+        assert 9 < call_timeout(30) <= 10
+        with deadline(60):
+            # Inner deadlines cannot extend the outer one
+            assert remaining_time() <= 10
+        with deadline(0), pytest.raises(DeadlineExceededException):
+            call_timeout(30)
+    assert remaining_time() is None
+
+
+def test_transient_failures_are_retried():
+    call = _Flaky(2)
+    assert call_with_retry(call, NO_BACKOFF, None, _transient) == "ok"
+    assert call.timeouts == [5, 5, 5]
+
+    call = _Flaky(3)
+    with pytest.raises(ConnectionError):
+        call_with_retry(call, NO_BACKOFF, None, _transient)
+    assert len(call.timeouts) == NO_BACKOFF.max_attempts
+
+    call = _Flaky(1, ValueError("bad request"))
+    with pytest.raises(ValueError):
+        call_with_retry(call, NO_BACKOFF, None, _transient)
+    assert len(call.timeouts) == 1
+
+
+def test_retry_budget_stops_retry_storms():
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    assert call_with_retry(_Flaky(2), NO_BACKOFF, budget, _transient) == "ok"
+    # The call deposited half a token (capped at 2) and two retries took two
+    assert budget.tokens == 0
+    call = _Flaky(1)
+    # The deposit of this call is not enough for a retry
+    with pytest.raises(ConnectionError):
+        call_with_retry(call, NO_BACKOFF, budget, _transient)
+    assert len(call.timeouts) == 1
+    assert budget.tokens == 0.5
+
+
+def test_backoff_never_overruns_the_deadline():
+    policy = RetryPolicy(initial_backoff=10, max_backoff=10, timeout=5)
+    # A backoff of 5 s does not fit a deadline of 0.5 s
+    with patch("otdf_python.retry.random.uniform", return_value=5.0), deadline(0.5):
+        call = _Flaky(1)
+        started = time.monotonic()
+        with pytest.raises(ConnectionError):
+            call_with_retry(call, policy, None, _transient)
+    assert time.monotonic() - started < 0.5
+    assert len(call.timeouts) == 1
+    assert call.timeouts[0] <= 0.5
+
+
+def test_http_requests_retry_transient_statuses():
+    responses = [MagicMock(status_code=503), MagicMock(status_code=200)]
+    method = MagicMock(side_effect=responses)
+    response = http_request_with_retry(method, "https://idp", NO_BACKOFF, None)
+    assert response is responses[1]
+    assert method.call_args.kwargs["timeout"] == 5
+
+    # The last response is returned whatever its status
+    method = MagicMock(return_value=MagicMock(status_code=503))
+    response = http_request_with_retry(method, "https://idp", NO_BACKOFF, None)
+    assert response.status_code == 503
+    assert method.call_count == 3
+
+    method = MagicMock(side_effect=[httpx.ConnectError("refused"), responses[1]])
+    assert (
+        http_request_with_retry(method, "https://idp", NO_BACKOFF, None).status_code
+        == 200
+    )
+
+
+@patch("otdf_python.kas_connect_rpc_client.AccessServiceClientSync")
+def test_kas_rpcs_are_retried_within_the_deadline(mock_access_service_client):
+    public_key = mock_access_service_client.return_value.public_key
+    public_key.side_effect = [
+        ConnectError(Code.UNAVAILABLE, "unavailable"),
+        MagicMock(kid="kid", public_key="pem"),
+    ]
+    with (
+        KASConnectRPCClient(use_plaintext=True, retry_policy=NO_BACKOFF) as client,
+        deadline(2),
+    ):
+        result = client.get_public_key(
+            "http://kas.example.com/kas", KASInfo(url="http://kas.example.com/kas")
+        )
+    assert result.public_key == "pem"
+    timeouts = [call.kwargs["timeout_ms"] for call in public_key.call_args_list]
+    assert len(timeouts) == 2
+    assert all(0 < timeout <= 2000 for timeout in timeouts)
+
+    public_key.side_effect = ConnectError(Code.PERMISSION_DENIED, "denied")
+    with (
+        KASConnectRPCClient(use_plaintext=True) as client,
+        pytest.raises(Exception, match="denied"),
+    ):
+        client.get_public_key(
+            "http://kas.example.com/kas", KASInfo(url="http://kas.example.com/kas")
+        )
+    assert public_key.call_count == 3
+
+
+def test_kas_rpc_timeouts_start_after_admission():
+    class _SlowScheduler:
+        def run(self, endpoint, fn, overloaded=None):
+            time.sleep(0.3)
+            return fn()
+
+    timeouts = []
+    client = KASConnectRPCClient(use_plaintext=True, scheduler=_SlowScheduler())
+    with deadline(1):
+        client._call("http://kas", timeouts.append)
+    # The time queued for admission is taken off the timeout of the RPC
+    assert 0 < timeouts[0] <= 700
+
+    with deadline(0.1), pytest.raises(DeadlineExceededException):
+        client._call("http://kas", timeouts.append)
+    assert len(timeouts) == 1
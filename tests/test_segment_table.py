@@ -0,0 +1,142 @@
+"""Tests for SegmentTable."""
+
+import base64
+import copy
+import json
+import os
+
+import pytest
+from otdf_python.manifest import Manifest, ManifestSegment
+from otdf_python.segment_table import SegmentTable
+from otdf_python.tdf import TDF, TDFReaderConfig
+
+from tests.mock_crypto import generate_rsa_keypair, tdf_config
+
+
+def _table(sizes, default=None):
+    table = SegmentTable(default)
+    for size in sizes:
+        table.append(size, size + 28, os.urandom(SegmentTable.TAG_LENGTH))
+    return table
+
+
+def test_offsets_and_ranges():
+    table = _table([10, 10, 4], default=10)
+    assert len(table) == 3
+    assert table.total_size == 24
+    assert table.total_encrypted_size == 24 + 3 * 28
+    assert table.plaintext_offset(2) == 20
+    assert table.encrypted_range(1) == (38, 76)
+    assert table.segment_size(2) == 4
+    assert table.encrypted_segment_size(2) == 32
+
+
+@pytest.mark.parametrize("default", [10, None])
+def test_find_segment(default):
+    table = _table([10, 10, 4], default=default)
+    assert table.find_segment(0) == 0
+    assert table.find_segment(9) == 0
+    assert table.find_segment(10) == 1
+    assert table.find_segment(23) == 2
+    with pytest.raises(IndexError):
+        table.find_segment(24)
+    assert list(table.segments_for_range(5, 10)) == [0, 1]
+    assert list(table.segments_for_range(20, 100)) == [2]
+    assert list(table.segments_for_range(24, 1)) == []
+
+
+def test_find_segment_non_uniform():
+    table = _table([10, 3, 10], default=10)
+    assert table.find_segment(12) == 1
+    assert table.find_segment(13) == 2
+
+
+def test_sequence_of_manifest_segments():
+    tag = os.urandom(SegmentTable.TAG_LENGTH)
+    table = SegmentTable(100)
+    table.append(100, 128, tag)
+    segment = table[0]
+    assert isinstance(segment, ManifestSegment)
+    assert segment == ManifestSegment(
+        hash=base64.b64encode(tag).decode(), segmentSize=100, encryptedSegmentSize=128
+    )
+    assert table == [segment]
+    assert table[-1] == segment
+    assert table[:1] == [segment]
+    assert table.aggregate_hash() == tag
+    with pytest.raises(IndexError):
+        table[1]
+
+
+def test_non_gmac_hashes_are_preserved():
+    hex_hash = base64.b64encode(os.urandom(16).hex().encode()).decode()
+    segments = [
+        {"hash": base64.b64encode(b"t" * 16).decode(), "segmentSize": 4},
+        {"hash": hex_hash, "segmentSize": 4},
+    ]
+    for seg in segments:
+        seg["encryptedSegmentSize"] = 32
+    table = SegmentTable.from_segments(segments)
+    assert table.to_json_list() == segments
+    assert table.tag(0) == b"t" * 16
+
+
+def test_verify_segment():
+    table = SegmentTable()
+    table.append(4, 32, b"x" * 16)
+    assert table.verify_segment(0, b"\0" * 16 + b"x" * 16)
+    assert not table.verify_segment(0, b"\0" * 16 + b"y" * 16)
+    assert not table.verify_segment(0, b"short")
+
+
+def test_deepcopy_is_independent():
+    table = _table([1, 2])
+    copied = copy.deepcopy(table)
+    copied.append(3, 31, b"z" * 16)
+    assert len(table) == 2
+    assert len(copied) == 3
+
+
+def test_replace_tag_and_truncate():
+    table = _table([10, 10, 4], default=10)
+    table.replace_tag(1, b"n" * 16)
+    assert table.tag(1) == b"n" * 16
+    with pytest.raises(IndexError):
+        table.replace_tag(3, b"n" * 16)
+
+    table.truncate(2)
+    assert len(table) == 2
+    assert table.total_size == 20
+    assert table.aggregate_hash()[16:] == b"n" * 16
+    table.append(10, 38, b"m" * 16)
+    assert table.find_segment(25) == 2
+
+
+def test_manifest_roundtrip_uses_segment_table():
+    kas_private_key, kas_public_key = generate_rsa_keypair()
+    config = tdf_config(kas_public_key, segment_size=8)
+    payload = b"0123456789abcdefghij"
+
+    tdf = TDF()
+    manifest, _size, out = tdf.create_tdf(payload, config)
+    segments = manifest.encryptionInformation.integrityInformation.segments
+    assert isinstance(segments, SegmentTable)
+    assert [s.segmentSize for s in segments] == [8, 8, 4]
+
+    manifest_json = manifest.to_json()
+    integrity_json = json.loads(manifest_json)["encryptionInformation"][
+        "integrityInformation"
+    ]
+    assert len(integrity_json["segments"]) == 3
+    loaded = Manifest.from_json(manifest_json)
+    loaded_integrity = loaded.encryptionInformation.integrityInformation
+    loaded_segments = loaded_integrity.segments
+    assert isinstance(loaded_segments, SegmentTable)
+    # The segment hashes are only decoded once the table is used
+    assert "_tags" not in vars(loaded_segments)
+    assert loaded_segments == segments
+
+    reader = tdf.load_tdf(
+        out.getvalue(), TDFReaderConfig(kas_private_key=kas_private_key)
+    )
+    assert reader.payload == payload
@@ -0,0 +1,120 @@
+"""Tests for SingleFlight request coalescing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from otdf_python.config import KASInfo
+from otdf_python.kas_client import KASClient
+from otdf_python.retry import deadline
+from otdf_python.sdk_exceptions import DeadlineExceededException
+from otdf_python.single_flight import SingleFlight
+
+
+def _wait_for_waiters(flight, key, count):
+    """Block until ``count`` threads wait for the call in flight for ``key``."""
+    while True:
+        with flight._lock:
+            call = flight._calls.get(key)
+            if call is not None and call.waiters >= count:
+                return
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flight.do, "key", fn) for _ in range(4)]
+        _wait_for_waiters(flight, "key", 3)
+        release.set()
+    results = [f.result() for f in futures]
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+
+    # Finished calls are not cached
+    assert flight.do("key", lambda: "again") == "again"
+
+
+def test_waiters_give_up_at_their_own_deadline():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        return "slow"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # The first caller has no deadline
+        future = executor.submit(flight.do, "key", fn)
+        _wait_for_waiters(flight, "key", 0)
+        with (
+            deadline(0.05),
+            pytest.raises(DeadlineExceededException, match="call in flight"),
+        ):
+            flight.do("key", fn)
+        assert flight._calls["key"].waiters == 0
+        release.set()
+    assert future.result() == "slow"
+    assert flight.in_flight() == 0
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        raise ConnectionError("KAS unavailable")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(flight.do, "key", fn) for _ in range(3)]
+        _wait_for_waiters(flight, "key", 2)
+        release.set()
+    for future in futures:
+        with pytest.raises(ConnectionError, match="unavailable"):
+            future.result()
+    assert flight.in_flight() == 0
+
+
+def test_kas_clients_coalesce_public_key_requests(monkeypatch):
+    flight = SingleFlight()
+    release = threading.Event()
+    fetched = []
+
+    def fetch(self, kas_info):
+        fetched.append(kas_info.url)
+        release.wait(5)
+        return KASInfo(url=kas_info.url, public_key="pem", kid="k1")
+
+    monkeypatch.setattr(KASClient, "_get_public_key_with_connect_rpc", fetch)
+    clients = [KASClient("http://kas", single_flight=flight) for _ in range(3)]
+    infos = [KASInfo(url="http://kas", default=i == 0) for i in range(3)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(client.get_public_key, info)
+            for client, info in zip(clients, infos, strict=True)
+        ]
+        # A different algorithm is a different request
+        other = executor.submit(
+            clients[0].get_public_key,
+            KASInfo(url="http://kas", algorithm="ec:secp256r1"),
+        )
+        _wait_for_waiters(flight, ("public_key", "http://kas", None), 2)
+        _wait_for_waiters(flight, ("public_key", "http://kas", "ec:secp256r1"), 0)
+        release.set()
+    assert [f.result().public_key for f in futures] == ["pem"] * 3
+    # Each caller gets its own KASInfo back, with its own fields
+    assert all(f.result() is info for f, info in zip(futures, infos, strict=True))
+    assert [info.default for info in infos] == [True, False, False]
+    assert other.result().public_key == "pem"
+    assert fetched == ["http://kas", "http://kas"]
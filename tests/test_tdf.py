@@ -1,15 +1,27 @@
 """Tests for TDF."""
 
+import array
+import base64
+import dataclasses
 import io
 import json
+import os
+import threading
 import zipfile
 
 import pytest
+from otdf_python.asym_crypto import AsymDecryption
+from otdf_python.autoconfigure_utils import KeySplitStep
 from otdf_python.config import KASInfo, TDFConfig
+from otdf_python.kas_scheduler import KASLane, current_lane, kas_lane
 from otdf_python.manifest import Manifest
+from otdf_python.range_source import FileRangeSource
+from otdf_python.retry import deadline, remaining_time
+from otdf_python.sdk import SDK
 from otdf_python.tdf import TDF, TDFReaderConfig
+from otdf_python.zip_reader import ZipReader
 
-from tests.mock_crypto import generate_rsa_keypair
+from tests.mock_crypto import KAS_URL, create_tdf, generate_rsa_keypair, tdf_config
 
 
 def test_tdf_create_and_load():
@@ -60,3 +72,651 @@ def test_tdf_multi_kas_roundtrip():
         reader_config = TDFReaderConfig(kas_private_key=priv)
         dec = tdf.load_tdf(data, reader_config)
         assert dec.payload == payload
+
+
+class _CountingReader(io.BytesIO):
+    """BytesIO that records how many bytes were read through it."""
+
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def test_inspect_tdf_reads_only_manifest():
+    """Test that inspect_tdf reports the manifest without reading the payload."""
+    _kas_private_key, kas_public_key = generate_rsa_keypair()
+    attribute = "https://example.com/attr/Classification/value/S"
+    config = tdf_config(kas_public_key, attributes=[attribute])
+    payload = b"x" * (64 * 1024 + 5)
+    _manifest, _size, out = TDF().create_tdf(payload, config)
+
+    source = _CountingReader(out.getvalue())
+    inspection = SDK.inspect_tdf(source)
+
+    assert inspection.attributes == [attribute]
+    assert inspection.kas_urls == ["https://kas.example.com"]
+    assert inspection.segment_count == 65
+    assert inspection.segment_size_default == 1024
+    assert inspection.plaintext_size == len(payload)
+    assert inspection.encrypted_size == len(payload) + 65 * 28
+    assert source.bytes_read < inspection.encrypted_size // 4
+
+
+def _write_tdf(tmp_path, payload, segment_size=1024):
+    kas_private_key, kas_public_key = generate_rsa_keypair()
+    tdf_path = tmp_path / "payload.tdf"
+    tdf_path.write_bytes(create_tdf(kas_public_key, payload, segment_size))
+    return tdf_path, kas_private_key
+
+
+def test_read_tdf_file_mmap_roundtrip(tmp_path):
+    """Test decrypting a TDF file through the memory-mapped path."""
+    payload = bytes(range(256)) * 41
+    tdf_path, kas_private_key = _write_tdf(tmp_path, payload)
+
+    output = io.BytesIO()
+    manifest = TDF().read_tdf_file(
+        tdf_path, output, TDFReaderConfig(kas_private_key=kas_private_key)
+    )
+
+    assert output.getvalue() == payload
+    assert len(manifest.encryptionInformation.integrityInformation.segments) == 11
+
+
+def test_read_tdf_file_detects_tampered_segment(tmp_path):
+    """Test that a modified GMAC tag is reported as a segment mismatch."""
+    tdf_path, kas_private_key = _write_tdf(tmp_path, b"a" * 3000)
+    data = bytearray(tdf_path.read_bytes())
+    with zipfile.ZipFile(io.BytesIO(bytes(data))) as z:
+        info = z.getinfo("0.payload")
+    # Flip a byte inside the first segment's GMAC tag (30-byte header + name)
+    tag_offset = info.header_offset + 30 + len(info.filename) + 1024 + 28 - 1
+    data[tag_offset] ^= 0xFF
+    tdf_path.write_bytes(bytes(data))
+
+    with pytest.raises(SDK.SegmentSignatureMismatch):
+        TDF().read_tdf_file(
+            tdf_path, io.BytesIO(), TDFReaderConfig(kas_private_key=kas_private_key)
+        )
+
+
+def test_read_tdf_file_detects_tampered_ciphertext(tmp_path):
+    """Test that a ciphertext change fails authentication, not the unmapping."""
+    tdf_path, kas_private_key = _write_tdf(tmp_path, b"a" * 3000)
+    data = bytearray(tdf_path.read_bytes())
+    payload_offset, _size = ZipReader(bytes(data)).get_entry_range("0.payload")
+    # The tag on record still matches, AES-GCM authentication does not
+    data[payload_offset + 1052 + 100] ^= 0x01
+    tdf_path.write_bytes(bytes(data))
+
+    with pytest.raises(SDK.SegmentSignatureMismatch, match="segment 1 failed"):
+        TDF().read_tdf_file(
+            tdf_path, io.BytesIO(), TDFReaderConfig(kas_private_key=kas_private_key)
+        )
+
+
+class _TrickleReader(io.RawIOBase):
+    """Non-seekable stream returning at most 100 bytes per readinto."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self._data.read(min(len(b), 100))
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+@pytest.mark.parametrize(
+    "make_payload",
+    [
+        bytes,
+        bytearray,
+        memoryview,
+        lambda data: array.array("I", data),
+        lambda data: _TrickleReader(data),
+    ],
+    ids=["bytes", "bytearray", "memoryview", "array", "short-reads"],
+)
+def test_create_tdf_from_buffers_and_streams(make_payload):
+    kas_private_key, kas_public_key = generate_rsa_keypair()
+    config = tdf_config(kas_public_key)
+    payload = bytes(range(256)) * 10
+
+    manifest, _size, out = TDF().create_tdf(make_payload(payload), config)
+    segments = manifest.encryptionInformation.integrityInformation.segments
+    assert [s.segmentSize for s in segments] == [1024, 1024, 512]
+
+    reader = TDF().load_tdf(
+        out.getvalue(), TDFReaderConfig(kas_private_key=kas_private_key)
+    )
+    assert reader.payload == payload
+
+
+def test_rewrap_tdf_copies_payload_verbatim():
+    old_private, old_public = generate_rsa_keypair()
+    new_private, new_public = generate_rsa_keypair()
+    payload = b"rewrap me " * 500
+    config = TDFConfig(
+        kas_info_list=[KASInfo(url="https://old.example.com", public_key=old_public)],
+        default_segment_size=1024,
+    )
+    _manifest, _size, out = TDF().create_tdf(payload, config)
+    original = out.getvalue()
+
+    new_kas = KASInfo(url="https://new.example.com", public_key=new_public)
+    manifest, size, rewrapped = TDF().rewrap_tdf(
+        original, [new_kas], TDFReaderConfig(kas_private_key=old_private)
+    )
+    data = rewrapped.getvalue()
+    assert size == len(data)
+    assert [ka.url for ka in manifest.encryptionInformation.keyAccess] == [
+        "https://new.example.com"
+    ]
+    with (
+        zipfile.ZipFile(io.BytesIO(original)) as a,
+        zipfile.ZipFile(io.BytesIO(data)) as b,
+    ):
+        assert a.read("0.payload") == b.read("0.payload")
+
+    assert TDF().load_tdf(
+        data, TDFReaderConfig(kas_private_key=new_private)
+    ).payload == (payload)
+    with pytest.raises(ValueError, match="unwrap"):
+        TDF().load_tdf(data, TDFReaderConfig(kas_private_key=old_private))
+
+
+def test_rewrap_tdf_adds_recipient_and_attributes():
+    old_private, old_public = generate_rsa_keypair()
+    new_private, new_public = generate_rsa_keypair()
+    config = TDFConfig(
+        kas_info_list=[KASInfo(url="https://old.example.com", public_key=old_public)],
+        attributes=["https://example.com/attr/a/value/1"],
+    )
+    _manifest, _size, out = TDF().create_tdf(b"payload", config)
+
+    attribute = "https://example.com/attr/b/value/2"
+    manifest, _size, rewrapped = TDF().rewrap_tdf(
+        out.getvalue(),
+        KASInfo(url="https://new.example.com", public_key=new_public),
+        TDFReaderConfig(kas_private_key=old_private),
+        attributes=[attribute],
+        keep_existing=True,
+    )
+    data = rewrapped.getvalue()
+    inspection = TDF().inspect_tdf(data)
+    assert inspection.attributes == [attribute]
+    assert inspection.kas_urls == ["https://old.example.com", "https://new.example.com"]
+
+    # Every key access object is bound to the new policy
+    key = TDF()._unwrap_key(manifest.encryptionInformation.keyAccess, new_private)
+    policy_json = base64.b64decode(manifest.encryptionInformation.policy).decode()
+    for ka in manifest.encryptionInformation.keyAccess:
+        assert ka.policyBinding == TDF._policy_binding(key, policy_json)
+    for private_key in (old_private, new_private):
+        reader_config = TDFReaderConfig(kas_private_key=private_key)
+        assert TDF().load_tdf(data, reader_config).payload == b"payload"
+
+
+def _payload_ciphertext(tdf_path):
+    with zipfile.ZipFile(tdf_path) as z:
+        assert z.testzip() is None
+        return z.read("0.payload")
+
+
+def test_update_tdf_appends_segments(tmp_path):
+    payload = os.urandom(2500)
+    tdf_path, kas_private_key = _write_tdf(tmp_path, payload)
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    before = _payload_ciphertext(tdf_path)
+
+    more = os.urandom(3000)
+    manifest = TDF().update_tdf(tdf_path, config, append=io.BytesIO(more))
+
+    segments = manifest.encryptionInformation.integrityInformation.segments
+    assert [s.segmentSize for s in segments] == [1024] * 5 + [380]
+    after = _payload_ciphertext(tdf_path)
+    # Full segments are untouched; the short last one was re-encrypted
+    assert after[: 2 * 1052] == before[: 2 * 1052]
+    assert after[2 * 1052 : len(before)] != before[2 * 1052 :]
+
+    output = io.BytesIO()
+    TDF().read_tdf_file(tdf_path, output, config)
+    assert output.getvalue() == payload + more
+
+    TDF().update_tdf(tdf_path, config, append=b"tail")
+    assert TDF().load_tdf(tdf_path.read_bytes(), config).payload == (
+        payload + more + b"tail"
+    )
+
+
+def test_update_tdf_replaces_segments(tmp_path):
+    payload = os.urandom(3000)
+    tdf_path, kas_private_key = _write_tdf(tmp_path, payload)
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    before = _payload_ciphertext(tdf_path)
+
+    replacement = os.urandom(1024)
+    with tdf_path.open("r+b") as f:
+        TDF().update_tdf(f, config, replace={1: replacement})
+
+    after = _payload_ciphertext(tdf_path)
+    assert len(after) == len(before)
+    assert after[:1052] == before[:1052]
+    assert after[2 * 1052 :] == before[2 * 1052 :]
+    expected = payload[:1024] + replacement + payload[2048:]
+    assert TDF().load_tdf(tdf_path.read_bytes(), config).payload == expected
+
+    with pytest.raises(ValueError, match="must be 1024 bytes"):
+        TDF().update_tdf(tdf_path, config, replace={0: b"short"})
+    with pytest.raises(ValueError, match="out of range"):
+        TDF().update_tdf(tdf_path, config, replace={3: replacement})
+    assert TDF().load_tdf(tdf_path.read_bytes(), config).payload == expected
+
+
+def test_update_tdf_compressed_and_with_assertions(tmp_path):
+    from otdf_python.assertion_config import (
+        AppliesToState,
+        AssertionConfig,
+        Scope,
+        Statement,
+        Type,
+    )
+
+    kas_private_key, kas_public_key = generate_rsa_keypair()
+    assertion = AssertionConfig(
+        id="a1",
+        type=Type.HANDLING_ASSERTION,
+        scope=Scope.PAYLOAD,
+        applies_to_state=AppliesToState.ENCRYPTED,
+        statement=Statement(format="json", schema="urn:test", value="{}"),
+    )
+    config = tdf_config(
+        kas_public_key,
+        compression="zlib",
+        assertions=[assertion],
+    )
+    _manifest, _size, out = TDF().create_tdf(b"log line\n" * 300, config)
+    tdf_path = tmp_path / "log.tdf"
+    tdf_path.write_bytes(out.getvalue())
+
+    reader_config = TDFReaderConfig(kas_private_key=kas_private_key)
+    TDF().update_tdf(tdf_path, reader_config, append=b"new line\n" * 200)
+    reader = TDF().load_tdf(tdf_path.read_bytes(), reader_config)
+    assert reader.payload == b"log line\n" * 300 + b"new line\n" * 200
+    assert reader.manifest.assertions[0].id == "a1"
+
+
+def test_encrypt_iter_streams_a_valid_tdf():
+    kas_private_key, kas_public_key = generate_rsa_keypair()
+    config = tdf_config(kas_public_key)
+    # Chunks smaller than, equal to and larger than a segment
+    chunks = [b"a" * 100, b"b" * 1024, b"c" * 3000, bytearray(b"d" * 7), b""]
+    payload = b"".join(chunks)
+
+    stream = TDF().encrypt_iter(iter(chunks), config)
+    parts = []
+    try:
+        while True:
+            parts.append(next(stream))
+    except StopIteration as stop:
+        manifest = stop.value
+    segments = manifest.encryptionInformation.integrityInformation.segments
+    assert [s.segmentSize for s in segments] == [1024, 1024, 1024, 1024, 35]
+    # Header, one chunk per segment, then the descriptor, manifest and directory
+    assert len(parts) == 7
+    assert all(len(p) == 1024 + 28 for p in parts[1:5])
+
+    data = b"".join(parts)
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        assert z.testzip() is None
+    reader = TDF().load_tdf(data, TDFReaderConfig(kas_private_key=kas_private_key))
+    assert reader.payload == payload
+
+    empty = b"".join(TDF().encrypt_iter([], config))
+    assert (
+        TDF().load_tdf(empty, TDFReaderConfig(kas_private_key=kas_private_key)).payload
+        == b""
+    )
+
+
+@pytest.mark.parametrize("streamed", [False, True], ids=["create_tdf", "encrypt_iter"])
+def test_read_tdf_stream_from_pipe(tmp_path, streamed):
+    kas_private_key, kas_public_key = generate_rsa_keypair()
+    config = tdf_config(kas_public_key)
+    payload = os.urandom(10_000)
+    if streamed:
+        data = b"".join(TDF().encrypt_iter([payload], config))
+    else:
+        data = TDF().create_tdf(payload, config)[2].getvalue()
+
+    out = io.BytesIO()
+    manifest = TDF().read_tdf_stream(
+        _TrickleReader(data),
+        out,
+        TDFReaderConfig(kas_private_key=kas_private_key),
+        # Spill the payload to a file after 4 KiB
+        spool_threshold=4096,
+        spool_dir=tmp_path,
+    )
+    assert out.getvalue() == payload
+    assert len(manifest.encryptionInformation.integrityInformation.segments) == 10
+    assert list(tmp_path.iterdir()) == []
+
+
+def _verify_fixture():
+    kas_private_key, kas_public_key = generate_rsa_keypair()
+    config = tdf_config(kas_public_key)
+    data = TDF().create_tdf(os.urandom(20_000), config)[2].getvalue()
+    payload_offset, _size = ZipReader(data).get_entry_range("0.payload")
+    return data, payload_offset, kas_private_key
+
+
+def test_verify_tdf_checks_every_segment():
+    data, payload_offset, kas_private_key = _verify_fixture()
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+
+    result = SDK(services=None).verify_tdf(data, config, max_workers=4)
+    assert result.segment_count == 20
+    assert result.encrypted_size == 20_000 + 20 * 28
+    assert result.gb_per_second > 0
+
+    # Ciphertext change in the 13th segment: the tag on record still matches,
+    # AES-GCM authentication does not
+    tampered = bytearray(data)
+    tampered[payload_offset + 12 * 1052 + 100] ^= 0x01
+    with pytest.raises(SDK.SegmentSignatureMismatch, match="segment 12 failed"):
+        TDF().verify_tdf(bytes(tampered), config, batch_bytes=3000)
+
+    # Tag change in the last segment no longer matches the manifest hash
+    tampered = bytearray(data)
+    tampered[payload_offset + 20_000 + 20 * 28 - 1] ^= 0x01
+    with pytest.raises(SDK.SegmentSignatureMismatch, match="segment 19 hash"):
+        TDF().verify_tdf(bytes(tampered), config)
+
+
+def test_verify_tdf_checks_root_signature():
+    data, _offset, kas_private_key = _verify_fixture()
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        payload = z.read("0.payload")
+        manifest = json.loads(z.read("0.manifest.json"))
+    integrity = manifest["encryptionInformation"]["integrityInformation"]
+    integrity["rootSignature"]["sig"] = base64.b64encode(b"\x00" * 32).decode()
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w") as z:
+        z.writestr("0.payload", payload)
+        z.writestr("0.manifest.json", json.dumps(manifest))
+
+    with pytest.raises(SDK.RootSignatureValidationException):
+        TDF().verify_tdf(
+            out.getvalue(), TDFReaderConfig(kas_private_key=kas_private_key)
+        )
+
+
+class _SplitKAS:
+    """KAS endpoints that only answer once both calls of a round are in flight."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.unwrapped = []
+
+    def get_public_key(self, kas_info):
+        self.barrier.wait()
+        return dataclasses.replace(kas_info, public_key=self.keys[kas_info.url][1])
+
+    def unwrap(self, key_access, policy_json, session_key_type):
+        self.barrier.wait()
+        self.unwrapped.append(key_access.url)
+        private_key = self.keys[key_access.url][0]
+        return AsymDecryption(private_key).decrypt(
+            base64.b64decode(key_access.wrappedKey)
+        )
+
+
+class _SplitServices(SDK.Services):
+    def __init__(self, kas):
+        self._kas = kas
+
+    def kas(self):
+        return self._kas
+
+
+def test_split_key_fetches_and_unwraps_splits_concurrently():
+    keys = {
+        "https://kas-a.example.com": generate_rsa_keypair(),
+        "https://kas-b.example.com": generate_rsa_keypair(),
+    }
+    kas = _SplitKAS(keys)
+    tdf = TDF(_SplitServices(kas))
+    config = TDFConfig(
+        split_plan=[
+            KeySplitStep("https://kas-a.example.com", "a"),
+            KeySplitStep("https://kas-b.example.com", "b"),
+        ]
+    )
+    manifest, _size, out = tdf.create_tdf(b"split payload", config)
+    key_access = manifest.encryptionInformation.keyAccess
+    assert [(ka.url, ka.sid) for ka in key_access] == [
+        ("https://kas-a.example.com", "a"),
+        ("https://kas-b.example.com", "b"),
+    ]
+    policy_json = base64.b64decode(manifest.encryptionInformation.policy).decode()
+    for ka in key_access:
+        share = AsymDecryption(keys[ka.url][0]).decrypt(base64.b64decode(ka.wrappedKey))
+        # Each KAS only holds a share of the key, bound to the policy
+        assert ka.policyBinding == TDF._policy_binding(share, policy_json)
+
+    # Both rewraps must be in flight at once to pass the barrier
+    assert tdf.load_tdf(out.getvalue(), TDFReaderConfig()).payload == (b"split payload")
+    assert sorted(kas.unwrapped) == sorted(keys)
+
+
+class _ContextKAS:
+    """A KAS that records the lane and deadline its calls run under."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.contexts = []
+
+    def _record(self):
+        self.contexts.append((current_lane(), remaining_time()))
+
+    def get_public_key(self, kas_info):
+        self._record()
+        return dataclasses.replace(kas_info, public_key=self.keys[kas_info.url][1])
+
+    def unwrap(self, key_access, policy_json, session_key_type):
+        self._record()
+        private_key = self.keys[key_access.url][0]
+        return AsymDecryption(private_key).decrypt(
+            base64.b64decode(key_access.wrappedKey)
+        )
+
+
+def test_public_key_fetches_use_the_callers_lane_and_deadline():
+    keys = {
+        "https://kas-a.example.com": generate_rsa_keypair(),
+        "https://kas-b.example.com": generate_rsa_keypair(),
+    }
+    kas = _ContextKAS(keys)
+    config = TDFConfig(kas_info_list=[KASInfo(url=url) for url in keys])
+    # Two missing public keys are fetched concurrently on pool threads
+    with kas_lane(KASLane.BATCH), deadline(5):
+        TDF(_SplitServices(kas)).create_tdf(b"payload", config)
+    assert len(kas.contexts) == 2
+    for lane, remaining in kas.contexts:
+        assert lane is KASLane.BATCH
+        assert remaining is not None
+        assert remaining <= 5
+
+
+@pytest.mark.parametrize("reader", ["read_tdf_file", "read_tdf_source"])
+def test_file_readers_unwrap_in_the_callers_lane_and_deadline(tmp_path, reader):
+    keys = {KAS_URL: generate_rsa_keypair()}
+    tdf_path = tmp_path / "payload.tdf"
+    tdf_path.write_bytes(create_tdf(keys[KAS_URL][1], b"payload"))
+    kas = _ContextKAS(keys)
+    tdf = TDF(_SplitServices(kas))
+    source = tdf_path if reader == "read_tdf_file" else FileRangeSource(tdf_path)
+    output = io.BytesIO()
+    # The rewrap overlaps the payload reads on a pool thread
+    with kas_lane(KASLane.BATCH), deadline(5):
+        getattr(tdf, reader)(source, output, TDFReaderConfig())
+    assert output.getvalue() == b"payload"
+    [(lane, remaining)] = kas.contexts
+    assert lane is KASLane.BATCH
+    assert remaining is not None
+    assert remaining <= 5
+
+
+def test_split_key_with_redundant_kas_per_split():
+    private_key, public_key = generate_rsa_keypair()
+    urls = [f"https://kas-{i}.example.com" for i in range(3)]
+    config = TDFConfig(
+        kas_info_list=[KASInfo(url=url, public_key=public_key) for url in urls],
+        split_plan=[
+            KeySplitStep(urls[0], "s1"),
+            KeySplitStep(urls[1], "s1"),
+            KeySplitStep(urls[2], "s2"),
+        ],
+    )
+    manifest, _size, out = TDF().create_tdf(b"payload", config)
+    key_access = manifest.encryptionInformation.keyAccess
+    assert [ka.sid for ka in key_access] == ["s1", "s1", "s2"]
+    # Either KAS of a split holds the same share
+    decrypt = AsymDecryption(private_key).decrypt
+    shares = [decrypt(base64.b64decode(ka.wrappedKey)) for ka in key_access]
+    assert shares[0] == shares[1] != shares[2]
+
+    reader_config = TDFReaderConfig(kas_private_key=private_key)
+    assert TDF().load_tdf(out.getvalue(), reader_config).payload == b"payload"
+    with pytest.raises(ValueError, match="split key"):
+        TDF().rewrap_tdf(
+            out.getvalue(),
+            KASInfo(url="https://new.example.com", public_key=public_key),
+            reader_config,
+            keep_existing=True,
+        )
+
+
+def _swap_first_segments(tdf_path):
+    """Swap segments 0 and 1 in both the payload and the manifest hashes."""
+    with zipfile.ZipFile(tdf_path) as z:
+        payload = z.read("0.payload")
+        manifest = json.loads(z.read("0.manifest.json"))
+    segments = manifest["encryptionInformation"]["integrityInformation"]["segments"]
+    segments[0], segments[1] = segments[1], segments[0]
+    payload = payload[1052:2104] + payload[:1052] + payload[2104:]
+    with zipfile.ZipFile(tdf_path, "w", zipfile.ZIP_STORED) as z:
+        z.writestr("0.payload", payload)
+        z.writestr("0.manifest.json", json.dumps(manifest))
+
+
+def test_update_tdf_rejects_tampered_tdf(tmp_path):
+    tdf_path, kas_private_key = _write_tdf(tmp_path, os.urandom(3000))
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    _swap_first_segments(tdf_path)
+    tampered = tdf_path.read_bytes()
+
+    with pytest.raises(SDK.RootSignatureValidationException):
+        TDF().update_tdf(tdf_path, config, append=b"more")
+    assert tdf_path.read_bytes() == tampered
+
+
+def _drop_last_segment(tdf_path):
+    """Drop the last segment from both the payload and the manifest hashes."""
+    with zipfile.ZipFile(tdf_path) as z:
+        payload = z.read("0.payload")
+        manifest = json.loads(z.read("0.manifest.json"))
+    segments = manifest["encryptionInformation"]["integrityInformation"]["segments"]
+    dropped = segments.pop()
+    payload = payload[: -dropped["encryptedSegmentSize"]]
+    with zipfile.ZipFile(tdf_path, "w", zipfile.ZIP_STORED) as z:
+        z.writestr("0.payload", payload)
+        z.writestr("0.manifest.json", json.dumps(manifest))
+
+
+@pytest.mark.parametrize(
+    "read",
+    [
+        lambda tdf, path, config: tdf.load_tdf(path.read_bytes(), config),
+        lambda tdf, path, config: tdf.read_tdf_file(path, io.BytesIO(), config),
+        lambda tdf, path, config: tdf.read_tdf_stream(
+            io.BufferedReader(io.BytesIO(path.read_bytes())), io.BytesIO(), config
+        ),
+        lambda tdf, path, config: tdf.read_tdf_source(
+            FileRangeSource(path), io.BytesIO(), config
+        ),
+        lambda tdf, path, config: tdf.open_tdf(path, config).read(),
+    ],
+    ids=["load_tdf", "read_tdf_file", "read_tdf_stream", "read_tdf_source", "open_tdf"],
+)
+def test_readers_reject_truncated_manifest(tmp_path, read):
+    tdf_path, kas_private_key = _write_tdf(tmp_path, os.urandom(3000))
+    _drop_last_segment(tdf_path)
+    # Every remaining segment matches its hash; only the root signature
+    # covers the list of segments
+    with pytest.raises(SDK.RootSignatureValidationException):
+        read(TDF(), tdf_path, TDFReaderConfig(kas_private_key=kas_private_key))
+
+
+def test_update_tdf_requires_keys_for_assertions_not_signed_with_hs256(tmp_path):
+    from otdf_python.assertion_config import (
+        AppliesToState,
+        AssertionConfig,
+        AssertionKey,
+        AssertionKeyAlg,
+        Scope,
+        Statement,
+        Type,
+    )
+
+    kas_private_key, kas_public_key = generate_rsa_keypair()
+    signing_private, signing_public = generate_rsa_keypair()
+    config = tdf_config(
+        kas_public_key,
+        assertions=[
+            AssertionConfig(
+                id="signed",
+                type=Type.HANDLING_ASSERTION,
+                scope=Scope.PAYLOAD,
+                applies_to_state=AppliesToState.ENCRYPTED,
+                statement=Statement(format="json", schema="urn:test", value="{}"),
+                signing_key=AssertionKey(AssertionKeyAlg.RS256, signing_private),
+            )
+        ],
+    )
+    _manifest, _size, out = TDF().create_tdf(os.urandom(1500), config)
+    tdf_path = tmp_path / "signed.tdf"
+    tdf_path.write_bytes(out.getvalue())
+    reader_config = TDFReaderConfig(
+        kas_private_key=kas_private_key,
+        assertion_verification_keys={
+            "signed": AssertionKey(AssertionKeyAlg.RS256, signing_public)
+        },
+    )
+    original = tdf_path.read_bytes()
+
+    with pytest.raises(ValueError, match="signed with RS256"):
+        TDF().update_tdf(tdf_path, reader_config, append=b"more")
+    assert tdf_path.read_bytes() == original
+
+    TDF().update_tdf(
+        tdf_path,
+        reader_config,
+        append=b"more",
+        assertion_signing_keys={
+            "signed": AssertionKey(AssertionKeyAlg.RS256, signing_private)
+        },
+    )
+    # Still verifies against the third-party public key
+    assert (
+        TDF().load_tdf(tdf_path.read_bytes(), reader_config).payload.endswith(b"more")
+    )
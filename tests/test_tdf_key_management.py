@@ -1,6 +1,8 @@
 """Tests for TDF key management."""
 
 import base64
+import hashlib
+import hmac
 import io
 import unittest
 import zipfile
@@ -48,9 +50,14 @@ class TestTDFKeyManagement(unittest.TestCase):
                 policyBinding=None,
             )
 
+            # Signed with the 32-byte payload key the tests unwrap
+            root_signature = hmac.new(b"x" * 32, b"hash", hashlib.sha256).digest()
+
             # Create encryption info
             integrity_info = ManifestIntegrityInformation(
-                rootSignature=ManifestRootSignature(alg="HS256", sig="signature"),
+                rootSignature=ManifestRootSignature(
+                    alg="HS256", sig=base64.b64encode(root_signature).decode()
+                ),
                 segmentHashAlg="SHA256",
                 segmentSizeDefault=1024,
                 encryptedSegmentSizeDefault=1052,
@@ -93,9 +100,7 @@ class TestTDFKeyManagement(unittest.TestCase):
             zf.writestr("0.manifest.json", manifest.to_json())
 
             # Add encrypted payload
-            zf.writestr(
-                "0.payload", b"\x00\x01\x02\x03\x04\x05"
-            )  # dummy encrypted data
+            zf.writestr("0.payload", bytes(38))  # dummy encrypted segment
 
         return buffer.getvalue()
 
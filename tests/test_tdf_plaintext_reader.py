@@ -0,0 +1,92 @@
+"""Tests for the seekable TDF plaintext reader."""
+
+import io
+import tarfile
+import zipfile
+
+from otdf_python.range_source import BytesRangeSource
+from otdf_python.sdk import SDK
+from otdf_python.tdf import TDF, TDFReaderConfig
+
+from tests.mock_crypto import create_tdf
+
+
+class CountingRangeSource(BytesRangeSource):
+    def __init__(self, data):
+        super().__init__(data)
+        self.requests = []
+
+    def read_range(self, offset, length):
+        self.requests.append((offset, length))
+        return super().read_range(offset, length)
+
+
+def test_read_seek_tell(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = bytes(range(256)) * 20
+    data = create_tdf(kas_public_key, payload)
+
+    with TDF().open_tdf(data, TDFReaderConfig(kas_private_key=kas_private_key)) as f:
+        assert f.seekable()
+        assert f.read(10) == payload[:10]
+        assert f.tell() == 10
+        f.seek(3000)
+        assert f.read(2000) == payload[3000:5000]
+        f.seek(-100, io.SEEK_END)
+        assert f.read() == payload[-100:]
+        assert f.read(1) == b""
+        f.seek(1020)
+        buffer = bytearray(10)
+        assert f.readinto(buffer) == 10
+        assert buffer == payload[1020:1030]
+
+
+def test_decrypts_only_touched_segments(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    payload = bytes(range(256)) * 400  # 100 segments
+    source = CountingRangeSource(create_tdf(kas_public_key, payload))
+    f = TDF().open_tdf(
+        source, TDFReaderConfig(kas_private_key=kas_private_key), cache_segments=2
+    )
+    metadata_requests = len(source.requests)
+
+    f.seek(50 * 1024 + 7)
+    assert f.read(5) == payload[50 * 1024 + 7 : 50 * 1024 + 12]
+    f.seek(50 * 1024 + 500)
+    f.read(5)
+    # The second read hits the cached segment
+    assert len(source.requests) == metadata_requests + 1
+    f.close()
+
+
+def test_random_access_consumers(kas_keys):
+    kas_private_key, kas_public_key = kas_keys
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.txt", b"alpha" * 1000)
+        zf.writestr("b.txt", b"beta" * 1000)
+    tar_buffer = io.BytesIO()
+    with tarfile.open(fileobj=tar_buffer, mode="w") as tf:
+        info = tarfile.TarInfo("c.txt")
+        info.size = 5
+        tf.addfile(info, io.BytesIO(b"gamma"))
+
+    config = TDFReaderConfig(kas_private_key=kas_private_key)
+    zip_tdf = create_tdf(kas_public_key, archive.getvalue())
+    with TDF().open_tdf(zip_tdf, config) as f, zipfile.ZipFile(f) as zf:
+        assert zf.read("b.txt") == b"beta" * 1000
+    tar_tdf = create_tdf(kas_public_key, tar_buffer.getvalue())
+    with TDF().open_tdf(tar_tdf, config) as f, tarfile.open(fileobj=f) as tf:
+        assert tf.extractfile("c.txt").read() == b"gamma"
+
+
+def test_sdk_open_tdf_from_path(kas_keys, tmp_path):
+    kas_private_key, kas_public_key = kas_keys
+    payload = b"hello, seekable world"
+    path = tmp_path / "doc.tdf"
+    path.write_bytes(create_tdf(kas_public_key, payload))
+
+    sdk = SDK(services=None)
+    with sdk.open_tdf(path, TDFReaderConfig(kas_private_key=kas_private_key)) as f:
+        f.seek(7)
+        assert f.read() == payload[7:]
@@ -3,9 +3,11 @@
 import io
 import random
 import unittest
+import zipfile
 from pathlib import Path
 
-from otdf_python.zip_reader import ZipReader
+from otdf_python.invalid_zip_exception import InvalidZipException
+from otdf_python.zip_reader import StreamingZipReader, ZipReader
 from otdf_python.zip_writer import ZipWriter
 
 
@@ -73,6 +75,100 @@ class TestZipReader(unittest.TestCase):
         self.assertEqual(found_names, set(names_to_data.keys()))
         reader.close()
 
+    def test_get_entry_range(self):
+        """Test locating raw entry data without reading it."""
+        writer = ZipWriter()
+        writer.data("first.txt", b"first entry")
+        writer.data("0.payload", b"payload bytes")
+        writer.finish()
+        data = writer.getvalue()
+        reader = ZipReader(io.BytesIO(data))
+        offset, size = reader.get_entry_range("0.payload")
+        self.assertEqual(data[offset : offset + size], b"payload bytes")
+        reader.close()
+
+
+class _Pipe(io.RawIOBase):
+    """Non-seekable stream returning short reads."""
+
+    def __init__(self, data, read_size=333):
+        self._data = io.BytesIO(data)
+        self._read_size = read_size
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self._data.read(min(len(b), self._read_size))
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class _Unseekable(io.RawIOBase):
+    """Write-only stream, which makes zipfile use data descriptors."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        return self.buffer.write(b)
+
+
+class TestStreamingZipReader(unittest.TestCase):
+    """Tests for StreamingZipReader."""
+
+    def _read_all(self, data, **kwargs):
+        reader = StreamingZipReader(_Pipe(data), **kwargs)
+        return {name: b"".join(chunks) for name, chunks in reader.entries()}
+
+    def test_entries_with_sizes_in_local_headers(self):
+        writer = ZipWriter()
+        writer.data("a.txt", b"alpha")
+        writer.data("b.bin", bytes(range(256)) * 50)
+        writer.finish()
+        entries = self._read_all(writer.getvalue(), chunk_size=64)
+        self.assertEqual(entries, {"a.txt": b"alpha", "b.bin": bytes(range(256)) * 50})
+
+    def test_entries_with_data_descriptors(self):
+        # Payload full of descriptor signatures that do not describe it
+        rng = random.Random(7)
+        payload = b"".join(
+            b"PK\x07\x08" + rng.randbytes(rng.randrange(30)) for _ in range(500)
+        )
+        out = _Unseekable()
+        with zipfile.ZipFile(out, "w") as z:
+            with z.open("0.payload", "w") as f:
+                f.write(payload)
+            z.writestr("0.manifest.json", "{}")
+        entries = self._read_all(out.buffer.getvalue(), chunk_size=100)
+        self.assertEqual(entries, {"0.payload": payload, "0.manifest.json": b"{}"})
+
+    def test_skips_unread_entries(self):
+        writer = ZipWriter()
+        writer.data("skip", b"x" * 1000)
+        writer.data("keep", b"kept")
+        writer.finish()
+        names = []
+        for name, chunks in StreamingZipReader(_Pipe(writer.getvalue())).entries():
+            names.append(name)
+            if name == "keep":
+                self.assertEqual(b"".join(chunks), b"kept")
+        self.assertEqual(names, ["skip", "keep"])
+
+    def test_rejects_corrupt_and_truncated_streams(self):
+        writer = ZipWriter()
+        writer.data("a.txt", b"alpha")
+        writer.finish()
+        data = writer.getvalue()
+        corrupt = data.replace(b"alpha", b"alphA")
+        with self.assertRaises(InvalidZipException):
+            self._read_all(corrupt)
+        with self.assertRaises(InvalidZipException):
+            self._read_all(data[:40])
+
 
 if __name__ == "__main__":
     unittest.main()
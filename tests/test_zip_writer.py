@@ -1,10 +1,14 @@
 """Tests for ZipWriter."""
 
 import io
+import os
+import struct
 import unittest
 import zipfile
+import zlib
 
-from otdf_python.zip_writer import ZipWriter
+from otdf_python.invalid_zip_exception import InvalidZipException
+from otdf_python.zip_writer import ZipEntryUpdater, ZipWriter, _crc32_shift
 
 
 class TestZipWriter(unittest.TestCase):
@@ -27,6 +31,20 @@ class TestZipWriter(unittest.TestCase):
             self.assertEqual(z.read("foo.txt"), b"hello world")
             self.assertEqual(z.read("bar.txt"), b"bar contents")
 
+    def test_stream_with_unknown_size_uses_zip64(self):
+        """Test streaming an entry whose size is not known up front."""
+        out = io.BytesIO()
+        writer = ZipWriter(out)
+        with writer.stream("big.bin") as f:
+            f.write(memoryview(b"x" * 100))
+            f.write(bytearray(b"y" * 10))
+        writer.finish()
+        out.seek(0)
+        with zipfile.ZipFile(out, "r") as z:
+            self.assertEqual(z.read("big.bin"), b"x" * 100 + b"y" * 10)
+        info = writer.get_file_infos()[0]
+        self.assertEqual(info.size, 110)
+
     def test_getvalue(self):
         """Test getting writer value as bytes."""
         writer = ZipWriter()
@@ -36,6 +54,65 @@ class TestZipWriter(unittest.TestCase):
         with zipfile.ZipFile(io.BytesIO(data), "r") as z:
             self.assertEqual(z.read("a.txt"), b"A")
 
+    def test_crc32_shift_combines_blocks(self):
+        """Test the CRC-32 shift operator against zlib."""
+        for a_len, b_len in [(0, 5), (7, 0), (100, 3000), (1, 1 << 20)]:
+            a, b = os.urandom(a_len), os.urandom(b_len)
+            self.assertEqual(
+                zlib.crc32(a + b), _crc32_shift(zlib.crc32(a), b_len) ^ zlib.crc32(b)
+            )
+
+    def _archive(self, seekable=True):
+        out = io.BytesIO()
+        with zipfile.ZipFile(out, "w") as z:
+            if seekable:
+                z.writestr("data", b"0123456789")
+            else:
+                with z.open("data", "w", force_zip64=True) as f:
+                    f.write(b"0123456789")
+            z.writestr("tail", b"old tail")
+        return out
+
+    def test_entry_updater_patches_and_grows(self):
+        """Test overwriting and appending to an entry followed by another."""
+        for seekable in (True, False):
+            with self.subTest(seekable=seekable):
+                out = self._archive(seekable)
+                updater = ZipEntryUpdater(out, "data", "tail")
+                updater.write(2, b"ab")
+                updater.write(8, b"XYZ")
+                updater.write(updater.size, b"!" * 1000)
+                updater.finish(b"new tail")
+
+                expected = b"01ab4567XYZ" + b"!" * 1000
+                self.assertEqual(updater.crc, zlib.crc32(expected))
+                out.seek(0)
+                with zipfile.ZipFile(out) as z:
+                    self.assertIsNone(z.testzip())
+                    self.assertEqual(z.read("data"), expected)
+                    self.assertEqual(z.read("tail"), b"new tail")
+                    self.assertEqual(z.namelist(), ["data", "tail"])
+
+    def test_entry_updater_refreshes_local_header(self):
+        """Test that the local header of the grown entry stays consistent."""
+        out = self._archive()
+        updater = ZipEntryUpdater(out, "data", "tail")
+        updater.write(10, b"more")
+        updater.finish(b"t")
+        crc, compressed, size = struct.unpack_from("<LLL", out.getvalue(), 14)
+        self.assertEqual(crc, zlib.crc32(b"0123456789more"))
+        self.assertEqual((compressed, size), (14, 14))
+
+    def test_entry_updater_requires_trailing_entry_last(self):
+        """Test that other entries after the updated one are rejected."""
+        out = io.BytesIO()
+        with zipfile.ZipFile(out, "w") as z:
+            z.writestr("data", b"d")
+            z.writestr("tail", b"t")
+            z.writestr("extra", b"e")
+        with self.assertRaises(InvalidZipException):
+            ZipEntryUpdater(out, "data", "tail")
+
 
 if __name__ == "__main__":
     unittest.main()